@@ -2,9 +2,10 @@
 Analysis Endpoint Router
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, File, HTTPException, UploadFile
 from typing import List
 from ..services.analyzer_claude import Analyzer
+from ..services.batch_analysis import batch_analysis_manager, parse_jsonl_texts, BATCH_MAX_TEXTS
 from ..services.credit_manager import CreditManager
 
 router = APIRouter(prefix="/analysis", tags=["analysis"])
@@ -14,7 +15,7 @@ credit_manager = CreditManager()
 @router.post("/text")
 async def analyze_text(text: str, user_id: str):
     """
-    Analyze a single text
+    Analyze a single text; meta.prompt holds the prompt packing info (token counts, max_tokens)
     """
     try:
         # Calculate required credits
@@ -26,12 +27,12 @@ async def analyze_text(text: str, user_id: str):
             raise HTTPException(status_code=402, detail="Insufficient credits")
             
         # Perform analysis
-        result = analyzer.analyze_text(text)
+        result = await analyzer.analyze_texts([text])
         
         # Deduct credits
         credit_manager.deduct_credits(user_id, required_credits, None)  # Replace None with actual DB connection
         
-        return result
+        return {"content": result["content"], "meta": {"prompt": result["prompt_meta"]}}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -50,11 +51,46 @@ async def analyze_multiple_texts(texts: List[str], user_id: str):
             raise HTTPException(status_code=402, detail="Insufficient credits")
             
         # Perform analysis
-        result = analyzer.analyze_multiple_texts(texts)
+        result = await analyzer.analyze_multiple_texts(texts)
         
         # Deduct credits
         credit_manager.deduct_credits(user_id, required_credits, None)  # Replace None with actual DB connection
         
         return result
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/batch", status_code=202)
+async def submit_batch_analysis(user_id: str, file: UploadFile = File(...)):
+    """
+    Submit a JSONL file of texts (one JSON string or {"text": ...} per line) for background analysis
+    """
+    try:
+        texts = parse_jsonl_texts(await file.read())
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not texts:
+        raise HTTPException(status_code=400, detail="No texts to analyze")
+    if len(texts) > BATCH_MAX_TEXTS:
+        raise HTTPException(status_code=413, detail=f"Too many texts (max {BATCH_MAX_TEXTS})")
+
+    # Calculate required credits
+    total_size = sum(len(text.encode('utf-8')) for text in texts)
+    required_credits = credit_manager.calculate_base_credits(total_size)
+    
+    # Check and deduct credits
+    if not credit_manager.check_credits(user_id, required_credits, None):  # Replace None with actual DB connection
+        raise HTTPException(status_code=402, detail="Insufficient credits")
+    credit_manager.deduct_credits(user_id, required_credits, None)  # Replace None with actual DB connection
+    
+    return batch_analysis_manager.submit(texts, user_id)
+
+@router.get("/batch/{job_id}")
+async def get_batch_analysis(job_id: str, user_id: str):
+    """
+    Poll batch analysis progress; result holds the merged analysis so far
+    """
+    job = batch_analysis_manager.get_job(job_id)
+    if job is None or job["user_id"] != user_id:
+        raise HTTPException(status_code=404, detail="Batch job not found")
+    return job
@@ -11,24 +11,26 @@ from datetime import datetime, timedelta
 import uuid
 import os
 from dotenv import load_dotenv
-import zipfile
-from io import BytesIO
 import time
 import json
 import logging
 
-from api.services.analyzer_claude import Analyzer
-from api.services.strategist import Strategist
-from api.services.copywriter import Copywriter
-from api.services.formatter_claude import Formatter
 from api.services.credit_manager import CreditManager
-from api.crawlers.dispatcher import CrawlerDispatcher
+from api.services.analysis_pipeline import (
+    analyzer,
+    strategist,
+    copywriter,
+    formatter,
+    build_analysis_pipeline
+)
 from api.utils.auth import verify_auth_token
 from api.services.analysis_history import AnalysisHistory
-from weasyprint import HTML
+from api.services.pdf_renderer import pdf_renderer
+from api.utils.file_response import cached_file_response
+from api.utils.zip_stream import zip_stream_response
 from api.services.brand_strategy import BrandStrategyGenerator
 from api.endpoints import analysis, strategy, copy, formatting, credit, download
-from api.routes import crawler, auth, share, feedback, history, favorite, export, execution, admin, credit_log
+from api.routes import crawler, auth, share, feedback, history, favorite, export, execution, admin, credit_log, jobs
 from api.services.favorite_manager import (
     add_favorite,
     remove_favorite,
@@ -41,15 +43,23 @@ from api.services.zip_download_limiter import (
     get_remaining_cooldown
 )
 from api.services.feedback_manager import add_feedback, get_feedback_summary, submit_feedback
-from api.services.scheduler_manager import schedule_analysis
+from api.services.scheduler_manager import schedule_analysis, scheduler_manager
 from api.services.api_key_manager import generate_api_key, create_api_key, is_valid_api_key, get_user_by_api_key, get_api_key_by_user
 from api.services.gpt_caller import GPTCaller
 from api.services.claude_caller import ClaudeCaller
+from api.services.http_client import http_client
+from api.services.llm_clients import llm_clients
+from api.services.cache_manager import cache_manager
+from api.services.job_queue import job_queue
+from api.services.job_worker import job_workers
+from api.utils.prompt_packer import pack_prompt
+from api.utils.sse import sse_response
 from api.crawlers.reddit_scraper import RedditScraper
 from api.handlers.exception_handler import register_exception_handlers
 from api.middleware.logger import LoggingMiddleware
 from api.config.logging_config import configure_logging
 from api.db.database import engine
+from api.services.schema_migration import upgrade_schema
 from api.models import base
 from api.middleware.exception_handler import exception_handler
 from api.middleware.error_handler import global_error_handler
@@ -126,6 +136,9 @@ mock_brand_strategy_storage = {
     }
 }
 
+# ZIP entry listing favorited reports that failed to render
+MISSING_REPORTS_FILENAME = "MISSING_REPORTS.txt"
+
 # Share link storage
 share_link_storage: Dict[str, Dict[str, str]] = {}
 
@@ -133,12 +146,7 @@ share_link_storage: Dict[str, Dict[str, str]] = {}
 mock_favorites_storage: Dict[str, List[str]] = {}
 
 # Initialize services
-analyzer = Analyzer()
-strategist = Strategist()
-copywriter = Copywriter()
-formatter = Formatter()
 credit_manager = CreditManager()
-crawler_dispatcher = CrawlerDispatcher()
 analysis_history = AnalysisHistory()
 brand_strategy_generator = BrandStrategyGenerator()
 
@@ -150,8 +158,8 @@ if not os.path.exists(log_dir):
 # 로깅 설정 적용
 logger = configure_logging()
 
-# 데이터베이스 테이블 생성
-base.Base.metadata.create_all(bind=engine)
+# 데이터베이스 테이블/컬럼/인덱스 생성 (이미 적용된 항목은 건너뜀, 워커 간 잠금)
+upgrade_schema(engine, base.Base.metadata)
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -188,6 +196,32 @@ async def check_login_required(request: Request, call_next):
     response = await call_next(request)
     return response
 
+# 시작 시 캐시 만료 항목 정리 작업 시작
+@app.on_event("startup")
+async def start_cache_sweeper():
+    cache_manager.start_sweeper()
+
+# 시작 시 작업 워커 프로세스 시작 (JOB_WORKER_COUNT=0이면 별도 실행)
+@app.on_event("startup")
+async def start_job_workers():
+    job_workers.start()
+    scheduler_manager.start()
+
+# 시작 시 PDF 렌더링 프로세스 예열
+@app.on_event("startup")
+async def start_pdf_renderer():
+    await pdf_renderer.start()
+
+# 종료 시 크롤러 HTTP 연결 풀 정리
+@app.on_event("shutdown")
+async def close_http_client():
+    await http_client.aclose()
+    await llm_clients.aclose()
+    await cache_manager.stop_sweeper()
+    await scheduler_manager.stop()
+    job_workers.stop()
+    pdf_renderer.shutdown()
+
 # 라우터 등록
 app.include_router(crawler.router, prefix="/api", tags=["crawler"])
 app.include_router(auth.router, prefix="/api", tags=["auth"])
@@ -199,6 +233,7 @@ app.include_router(export.router, prefix="/api", tags=["export"])
 app.include_router(execution.router, prefix="/api", tags=["execution"])
 app.include_router(admin.router, prefix="/api", tags=["admin"])
 app.include_router(credit_log.router, prefix="/api", tags=["credit"])
+app.include_router(jobs.router, prefix="/api", tags=["jobs"])
 app.include_router(analysis.router, prefix="/api")
 app.include_router(download.router, prefix="/api")
 
@@ -272,6 +307,8 @@ class ScheduleAnalysisRequest(BaseModel):
 
 class ScheduleAnalysisResponse(BaseModel):
     message: str
+    schedule_id: Optional[str] = None
+    next_run_at: Optional[datetime] = None
 
 class ApiKeyRegisterRequest(BaseModel):
     user_id: str
@@ -287,6 +324,7 @@ class ApiAccessStrategyResponse(BaseModel):
     copy: str
     style: str
     report_html: str
+    timings: Dict[str, Any] = {}
 
 class TestAnalysisRequest(BaseModel):
     keyword: str
@@ -295,6 +333,7 @@ class TestAnalysisResponse(BaseModel):
     analysis: Dict[str, Any]
     strategy: Dict[str, Any]
     formatted: Dict[str, Any]
+    meta: Dict[str, Any] = {}
 
 # Rate limiting cache for ZIP downloads
 zip_download_cache: Dict[str, float] = {}
@@ -361,6 +400,38 @@ async def format_report(request: FormatRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/strategy/stream")
+async def stream_strategy(request: StrategyRequest):
+    """
+    Stream marketing strategy tokens as Server-Sent Events (token → done)
+    """
+    async def events():
+        chunks = []
+        async for text in strategist.stream_strategy(request.analysis_result):
+            chunks.append(text)
+            yield {"type": "token", "text": text}
+        yield {"type": "done", "strategy": "".join(chunks)}
+    
+    return sse_response(events())
+
+@app.post("/copy/stream")
+async def stream_copy(request: CopyRequest):
+    """
+    Stream marketing copy tokens as Server-Sent Events (token → done)
+    """
+    return sse_response(copywriter.stream_copy(
+        request.strategy,
+        request.analysis_result,
+        request.style
+    ))
+
+@app.post("/format/stream")
+async def stream_format(request: FormatRequest):
+    """
+    Stream the formatted HTML report as Server-Sent Events (token → done)
+    """
+    return sse_response(formatter.stream_report(request.strategy))
+
 @app.post("/full_analysis")
 async def full_analysis(
     request: Dict,
@@ -375,15 +446,12 @@ async def full_analysis(
         raise HTTPException(status_code=403, detail="Authentication required")
 
     input_text = request.get("input_text")
-    channels = request.get("channels", [])
     
     try:
         # Run analysis pipeline
-        crawl_results = await crawler_dispatcher.run_selected_crawlers(channels)
-        analysis_result = await analyzer.analyze_text(input_text)
-        strategy = await strategist.generate_strategy(analysis_result)
-        copy = await copywriter.generate_copy(strategy, analysis_result)
-        report = await formatter.format_strategy(strategy, analysis_result, copy)
+        stage_results, timings = await build_analysis_pipeline("full_analysis", input_text).run()
+        copy = stage_results["copy"]
+        report = stage_results["report"]
         
         # Calculate and check credits
         credit_info = credit_manager.process_request(
@@ -399,12 +467,38 @@ async def full_analysis(
             "from_cache": credit_info["from_cache"],
             "free_trial": credit_info["free_trial"],
             "copy": copy,
-            "report_html": report["html"]
+            "report_html": report["html"],
+            "timings": timings,
+            "meta": {"prompt": stage_results["analysis_call"]["prompt_meta"]}
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/full_analysis/jobs", status_code=202)
+async def enqueue_full_analysis(
+    request: Dict,
+    auth_token: Optional[str] = Header(None)
+):
+    """
+    Queue a full analysis for a background job worker; poll /api/jobs/{job_id} for the result
+    """
+    # Verify authentication
+    user_id, is_authenticated = verify_auth_token(auth_token)
+    if not is_authenticated:
+        raise HTTPException(status_code=403, detail="Authentication required")
+    
+    input_text = request.get("input_text")
+    if not input_text:
+        raise HTTPException(status_code=400, detail="input_text is required")
+    
+    job_id = job_queue.enqueue(
+        "full_analysis",
+        {"input_text": input_text, "channels": request.get("channels", []), "user_id": user_id},
+        user_id=user_id
+    )
+    return {"job_id": job_id, "status": "queued"}
+
 @app.post("/ab-test")
 async def ab_test(
     request: ABTestRequest,
@@ -438,31 +532,21 @@ async def ab_test(
                 detail=f"Insufficient credits. Required: {total_credit}"
             )
         
-        variants = []
-        for i in range(request.variant_count):
-            # Run crawlers
-            crawl_results = await crawler_dispatcher.run_selected_crawlers(request.channels)
-            
-            # Analyze text
-            analysis_result = await analyzer.analyze_text(request.input_text)
-            
-            # Generate strategy
-            strategy = await strategist.generate_strategy(analysis_result)
-            
-            # Generate copy
-            copy = await copywriter.generate_copy(strategy, analysis_result)
-            
-            # Format report
-            report = await formatter.format_report(strategy, analysis_result, copy)
-            
-            # Add to variants
-            variants.append({
-                "variant_id": f"variant_{i+1}",
-                "analysis": analysis_result,
-                "strategy": strategy,
-                "copy": copy,
-                "report_html": report
-            })
+        # Analysis and strategy run once; copy/report variants run concurrently
+        stage_results, timings = await build_analysis_pipeline(
+            "ab_test", request.input_text, variant_count=request.variant_count
+        ).run()
+        
+        variants = [
+            {
+                "variant_id": f"variant_{i}",
+                "analysis": stage_results["analysis"],
+                "strategy": stage_results["strategy"],
+                "copy": stage_results[f"copy_{i}"],
+                "report_html": stage_results[f"report_{i}"]["html"]
+            }
+            for i in range(1, request.variant_count + 1)
+        ]
         
         # Deduct credits
         credit_manager.deduct_credits(user_id, total_credit)
@@ -470,7 +554,8 @@ async def ab_test(
         return {
             "variants": variants,
             "final_credit": total_credit,
-            "from_cache": False
+            "from_cache": False,
+            "timings": timings
         }
         
     except HTTPException:
@@ -569,6 +654,7 @@ async def get_user_history(
 async def download_analysis_pdf(
     user_id: str,
     analysis_id: str,
+    request: Request,
     auth_token: Optional[str] = Header(None)
 ):
     """
@@ -577,10 +663,11 @@ async def download_analysis_pdf(
     Args:
         user_id: ID of the user
         analysis_id: ID of the analysis
+        request: Request (If-None-Match / Range headers)
         auth_token: Authentication token
         
     Returns:
-        PDF file as response
+        PDF file as response (304 when the ETag matches, 206 for Range requests)
     """
     # Verify authentication
     auth_user_id, is_authenticated = verify_auth_token(auth_token)
@@ -601,16 +688,16 @@ async def download_analysis_pdf(
         if not html_content:
             raise HTTPException(status_code=404, detail="Report HTML not found")
             
-        # Convert HTML to PDF
-        pdf = HTML(string=html_content).write_pdf()
+        # Convert HTML to PDF (rendered off the event loop, cached by content hash)
+        etag, pdf_path = await pdf_renderer.render_to_file(html_content)
         
         # Create response
-        return Response(
-            content=pdf,
+        return cached_file_response(
+            request,
+            pdf_path,
             media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'attachment; filename="analysis_{analysis_id}.pdf"'
-            }
+            filename=f"analysis_{analysis_id}.pdf",
+            etag=etag
         )
         
     except HTTPException:
@@ -940,6 +1027,50 @@ async def check_favorite_status(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def build_favorite_report_html(analysis_id: str) -> Optional[str]:
+    """
+    즐겨찾기 리포트(카피, 리포트, 브랜드 전략)를 PDF 변환용 HTML로 만듭니다.
+    
+    Args:
+        analysis_id: 분석 ID
+        
+    Returns:
+        HTML 문자열 또는 None (분석 결과가 없는 경우)
+    """
+    # Get analysis data
+    analysis = mock_analysis_storage.get(analysis_id)
+    if not analysis:
+        return None
+        
+    # Get brand strategy data
+    brand_strategy = mock_brand_strategy_storage.get(analysis_id, {})
+    
+    # Combine HTML content
+    html_content = f"""
+    <html>
+        <head>
+            <meta charset="UTF-8">
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 20px; }}
+                .copy {{ font-size: 24px; margin-bottom: 20px; }}
+                .branding {{ margin-top: 20px; padding: 10px; background: #f5f5f5; }}
+            </style>
+        </head>
+        <body>
+            <div class="copy">{analysis['copy']}</div>
+            {analysis['report_html']}
+            <div class="branding">
+                <h3>브랜드 전략</h3>
+                <p>참조점: {brand_strategy.get('reference_point', 'N/A')}</p>
+                <p>프레임 시프트: {brand_strategy.get('frame_shift', 'N/A')}</p>
+                <p>포지셔닝: {brand_strategy.get('positioning', 'N/A')}</p>
+            </div>
+        </body>
+    </html>
+    """
+    
+    return html_content
+
 @app.post("/download/favorites")
 async def download_favorite_reports(
     user_id: str,
@@ -953,7 +1084,7 @@ async def download_favorite_reports(
         auth_token: Optional authentication token
         
     Returns:
-        ZIP file containing all favorited reports as PDFs
+        ZIP file containing all favorited reports as PDFs, streamed as each PDF is rendered
         
     Raises:
         HTTPException: If authentication fails, no favorites found, or rate limit exceeded
@@ -980,72 +1111,82 @@ async def download_favorite_reports(
         if not favorite_ids:
             raise HTTPException(status_code=404, detail="No favorited reports found")
         
-        # Create in-memory ZIP file
-        zip_buffer = BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for analysis_id in favorite_ids:
-                try:
-                    # Get analysis data
-                    analysis = mock_analysis_storage.get(analysis_id)
-                    if not analysis:
-                        continue
-                        
-                    # Get brand strategy data
-                    brand_strategy = mock_brand_strategy_storage.get(analysis_id, {})
-                    
-                    # Combine HTML content
-                    html_content = f"""
-                    <html>
-                        <head>
-                            <meta charset="UTF-8">
-                            <style>
-                                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                                .copy {{ font-size: 24px; margin-bottom: 20px; }}
-                                .branding {{ margin-top: 20px; padding: 10px; background: #f5f5f5; }}
-                            </style>
-                        </head>
-                        <body>
-                            <div class="copy">{analysis['copy']}</div>
-                            {analysis['report_html']}
-                            <div class="branding">
-                                <h3>브랜드 전략</h3>
-                                <p>참조점: {brand_strategy.get('reference_point', 'N/A')}</p>
-                                <p>프레임 시프트: {brand_strategy.get('frame_shift', 'N/A')}</p>
-                                <p>포지셔닝: {brand_strategy.get('positioning', 'N/A')}</p>
-                            </div>
-                        </body>
-                    </html>
-                    """
-                    
-                    # Generate PDF
-                    pdf_buffer = BytesIO()
-                    HTML(string=html_content).write_pdf(pdf_buffer)
-                    
-                    # Add PDF to ZIP
-                    zip_file.writestr(f"strategy_{analysis_id}.pdf", pdf_buffer.getvalue())
-                    
-                except Exception as e:
-                    print(f"Error processing analysis {analysis_id}: {str(e)}")
+        # Build report HTML for each favorite
+        reports = []
+        for analysis_id in favorite_ids:
+            try:
+                html_content = build_favorite_report_html(analysis_id)
+                if html_content is not None:
+                    reports.append((f"strategy_{analysis_id}.pdf", html_content))
+            except Exception as e:
+                print(f"Error processing analysis {analysis_id}: {str(e)}")
+        
+        # Stream ZIP entries as each PDF finishes rendering in the render pool
+        async def zip_entries():
+            missing = []
+            async for filename, result in pdf_renderer.iter_rendered_files(reports):
+                if isinstance(result, BaseException):
+                    print(f"Error processing {filename}: {str(result)}")
+                    missing.append(f"{filename}: {str(result)}")
                     continue
+                yield filename, result
+            # The 200 is already sent, so list reports that could not be rendered inside the archive
+            if missing:
+                yield MISSING_REPORTS_FILENAME, ("\n".join(missing) + "\n").encode("utf-8")
         
-        # Record successful download
+        # Record download (the archive is streamed, so this happens before the first byte)
         record_download_time(user_id)
         
-        # Prepare response
-        zip_buffer.seek(0)
-        return Response(
-            content=zip_buffer.getvalue(),
-            media_type="application/zip",
-            headers={
-                "Content-Disposition": f"attachment; filename=favorite_reports_{user_id}.zip"
-            }
-        )
+        return zip_stream_response(zip_entries(), f"favorite_reports_{user_id}.zip")
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate ZIP file: {str(e)}")
 
+@app.post("/download/favorites/jobs", status_code=202)
+async def enqueue_favorite_reports_download(
+    user_id: str,
+    auth_token: Optional[str] = Header(None)
+):
+    """
+    Queue PDF rendering of all favorited reports into a ZIP file.
+    Poll /api/jobs/{job_id} and fetch the file from /api/jobs/{job_id}/download.
+    """
+    # Verify authentication
+    if auth_token:
+        if not verify_auth_token(auth_token):
+            raise HTTPException(status_code=403, detail="Invalid authentication token")
+    
+    # Check rate limit
+    if not is_download_allowed(user_id):
+        remaining = get_remaining_cooldown(user_id)
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": "ZIP 파일 다운로드는 10분에 1회만 가능합니다.",
+                "remaining_seconds": remaining
+            }
+        )
+    
+    # Get list of favorited analysis IDs
+    favorite_ids = get_favorites(user_id)
+    if not favorite_ids:
+        raise HTTPException(status_code=404, detail="No favorited reports found")
+    
+    # Worker processes cannot see in-process storage, so the HTML goes with the job
+    documents = []
+    for analysis_id in favorite_ids:
+        html_content = build_favorite_report_html(analysis_id)
+        if html_content is not None:
+            documents.append({"filename": f"strategy_{analysis_id}.pdf", "html": html_content})
+    if not documents:
+        raise HTTPException(status_code=404, detail="No favorited reports found")
+    
+    job_id = job_queue.enqueue("favorites_zip", {"user_id": user_id, "documents": documents}, user_id=user_id)
+    record_download_time(user_id)
+    return {"job_id": job_id, "status": "queued"}
+
 @app.post("/feedback", response_model=FeedbackResponse)
 async def submit_feedback(feedback: FeedbackRequest):
     """
@@ -1110,13 +1251,17 @@ async def schedule_analysis_endpoint(request: ScheduleAnalysisRequest):
         HTTPException: If scheduling fails
     """
     try:
-        schedule_analysis(
+        schedule = schedule_analysis(
             user_id=request.user_id,
             input_text=request.input_text,
             channels=request.channels,
             frequency=request.frequency
         )
-        return ScheduleAnalysisResponse(message="분석이 예약되었습니다.")
+        return ScheduleAnalysisResponse(
+            message="분석이 예약되었습니다.",
+            schedule_id=schedule["id"],
+            next_run_at=datetime.fromtimestamp(schedule["next_run_at"])
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1125,6 +1270,34 @@ async def schedule_analysis_endpoint(request: ScheduleAnalysisRequest):
             detail="분석 예약 중 오류가 발생했습니다"
         )
 
+@app.get("/schedule-analysis")
+async def list_scheduled_analyses(user_id: str):
+    """
+    List a user's recurring analyses with their next run time.
+    """
+    schedules = scheduler_manager.list_schedules(user_id)
+    return [
+        {
+            "schedule_id": schedule["id"],
+            "input_text": schedule["input_text"],
+            "channels": json.loads(schedule["channels"]),
+            "frequency": schedule["frequency"],
+            "next_run_at": datetime.fromtimestamp(schedule["next_run_at"]),
+            "last_run_at": datetime.fromtimestamp(schedule["last_run_at"]) if schedule["last_run_at"] else None,
+            "last_job_id": schedule["last_job_id"]
+        }
+        for schedule in schedules
+    ]
+
+@app.delete("/schedule-analysis/{schedule_id}", response_model=ScheduleAnalysisResponse)
+async def cancel_scheduled_analysis(schedule_id: str, user_id: str):
+    """
+    Cancel a recurring analysis.
+    """
+    if not scheduler_manager.remove_schedule(schedule_id, user_id):
+        raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다")
+    return ScheduleAnalysisResponse(message="분석 예약이 취소되었습니다.", schedule_id=schedule_id)
+
 @app.post("/api-access/register", response_model=ApiKeyRegisterResponse)
 async def register_api_key(request: ApiKeyRegisterRequest):
     """
@@ -1177,25 +1350,17 @@ async def api_access_strategy(
                 detail="유효하지 않은 API 키입니다"
             )
         
-        # Run crawlers
-        crawl_results = await crawler_dispatcher.run_selected_crawlers(request.channels)
-        
-        # Analyze text
-        analysis_result = await analyzer.analyze_text(request.input_text)
-        
-        # Generate strategy
-        strategy = await strategist.generate_strategy(analysis_result)
-        
-        # Generate copy
-        copy = await copywriter.generate_copy(strategy, analysis_result)
-        
-        # Format report
-        report = await formatter.format_report(strategy, analysis_result, copy)
+        # Run analysis pipeline
+        stage_results, timings = await build_analysis_pipeline(
+            "api_access_strategy", request.input_text
+        ).run()
+        analysis_result = stage_results["analysis"]
         
         return ApiAccessStrategyResponse(
-            copy=copy,
+            copy=stage_results["copy"],
             style=analysis_result.get("style", "감성적"),
-            report_html=report["html"]
+            report_html=stage_results["report"]["html"],
+            timings=timings
         )
         
     except HTTPException:
@@ -1216,23 +1381,27 @@ async def test_analysis(request: TestAnalysisRequest):
         
         # 1. Scrape Reddit
         scraped_texts = await scraper.scrape(request.keyword)
-        combined_text = "\n\n".join(scraped_texts)
         
-        # 2. Analyze with Claude
-        analysis_prompt = f"""
+        # 2. Analyze with Claude (크롤링 본문을 입력 토큰 예산에 맞게 패킹)
+        packed = pack_prompt(
+            f"""
         Analyze the following Reddit posts about {request.keyword}:
-        {combined_text}
+        {{content}}
         
         Provide insights about:
         1. Main topics discussed
         2. Sentiment analysis
         3. Key points and arguments
         4. Potential opportunities
-        """
+        """,
+            scraped_texts
+        )
+        analysis_prompt = packed.pop("prompt")
         
         analysis_result = await claude.call(
             prompt=analysis_prompt,
-            system="You are an expert analyst specializing in social media content analysis."
+            system="You are an expert analyst specializing in social media content analysis.",
+            max_tokens=packed["max_tokens"]
         )
         
         # 3. Generate strategy with GPT
@@ -1272,7 +1441,8 @@ async def test_analysis(request: TestAnalysisRequest):
         return TestAnalysisResponse(
             analysis=json.loads(analysis_result['content']),
             strategy=json.loads(strategy_result['content']),
-            formatted=json.loads(formatted_result['content'])
+            formatted=json.loads(formatted_result['content']),
+            meta={"analysis_prompt": packed}
         )
         
     except Exception as e:
@@ -1,9 +1,10 @@
-from api.models.history import AnalysisHistory, StrategyHistory, CrawlHistory
+from api.models.history import AnalysisHistory, StrategyHistory, CrawlHistory, HistoryCounter
 from api.models.favorite import FavoriteAnalysis
 
 __all__ = [
     "AnalysisHistory",
     "StrategyHistory",
     "CrawlHistory",
+    "HistoryCounter",
     "FavoriteAnalysis",
 ] 
\ No newline at end of file
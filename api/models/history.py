@@ -1,9 +1,33 @@
-from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Index, LargeBinary, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 from api.db.database import Base
+from api.services.storage_codec import storage_codec
+import json
 import uuid
 
+# 목록 조회용 요약 최대 길이
+HISTORY_SUMMARY_LENGTH = 200
+
+class CompressedText(TypeDecorator):
+    """
+    파이썬에서는 str로 다루고 DB에는 storage_codec으로 압축한 바이너리(BYTEA/BLOB)로 저장하는 컬럼
+    압축 전에 Text로 저장된 원문 값도 그대로 읽습니다.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return storage_codec.encode_value(value)
+
+    def result_processor(self, dialect, coltype):
+        # SQLite에는 압축 전 Text 값이 남아 있을 수 있어 드라이버 값을 LargeBinary 변환 없이 바로 받음
+        return lambda value: self.process_result_value(value, dialect)
+
+    def process_result_value(self, value, dialect):
+        return storage_codec.decode_value(value)
+
 class AnalysisHistory(Base):
     """
     분석 결과를 저장하는 테이블
@@ -13,12 +37,18 @@ class AnalysisHistory(Base):
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), index=True, nullable=False)
     input_text = Column(Text, nullable=False)
-    result_json = Column(Text, nullable=False)
+    result_json = Column(CompressedText, nullable=False)
+    summary = Column(Text, nullable=True)  # 목록 조회용 요약 (저장 시 생성)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # 관계 설정
     strategies = relationship("StrategyHistory", back_populates="analysis")
 
+    # 사용자별 최신순 커서 페이지네이션용 인덱스
+    __table_args__ = (
+        Index("ix_analysis_history_user_created", "user_id", "created_at", "id"),
+    )
+
 class StrategyHistory(Base):
     """
     전략 생성 결과를 저장하는 테이블
@@ -29,12 +59,18 @@ class StrategyHistory(Base):
     analysis_id = Column(String(36), ForeignKey("analysis_history.id"), nullable=False)
     user_id = Column(String(36), index=True, nullable=False)
     strategy_type = Column(String(50), nullable=False)  # "existing" or "new"
-    result_json = Column(Text, nullable=False)
+    result_json = Column(CompressedText, nullable=False)
+    summary = Column(Text, nullable=True)  # 목록 조회용 요약 (저장 시 생성)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # 관계 설정
     analysis = relationship("AnalysisHistory", back_populates="strategies")
 
+    # 사용자별 최신순 커서 페이지네이션용 인덱스
+    __table_args__ = (
+        Index("ix_strategy_history_user_created", "user_id", "created_at", "id"),
+    )
+
 class CrawlHistory(Base):
     """
     크롤링 결과를 저장하는 테이블
@@ -46,5 +82,108 @@ class CrawlHistory(Base):
     input_text = Column(Text, nullable=False)
     channels = Column(Text, nullable=False)  # JSON string of channel list
     result_count = Column(Integer, nullable=False)
-    result_json = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now()) 
\ No newline at end of file
+    result_json = Column(CompressedText, nullable=False)
+    summary = Column(Text, nullable=True)  # 목록 조회용 요약 (저장 시 생성)
+    created_at = Column(DateTime(timezone=True), server_default=func.now()) 
+
+    # 사용자별 최신순 커서 페이지네이션용 인덱스
+    __table_args__ = (
+        Index("ix_crawl_history_user_created", "user_id", "created_at", "id"),
+    )
+
+def build_result_summary(result_json: str, max_length: int = HISTORY_SUMMARY_LENGTH) -> str:
+    """
+    결과 JSON에서 앞부분 텍스트를 모아 목록 표시용 요약을 만듭니다.
+
+    Args:
+        result_json (str): 결과 JSON 문자열 (JSON이 아니면 원문 사용)
+        max_length (int): 최대 길이
+
+    Returns:
+        str: 요약 텍스트
+    """
+    try:
+        data = json.loads(result_json)
+    except (TypeError, ValueError):
+        data = result_json
+
+    parts = []
+    length = 0
+    stack = [data]
+    while stack and length < max_length:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+        elif isinstance(value, str):
+            text = " ".join(value.split())
+            if text:
+                parts.append(text)
+                length += len(text) + 1
+
+    summary = " ".join(parts)
+    if len(summary) > max_length:
+        summary = summary[:max_length - 1].rstrip() + "…"
+    return summary
+
+class HistoryCounter(Base):
+    """
+    사용자별 이력 개수를 저장하는 테이블 (목록 조회 시 COUNT(*) 대신 사용)
+    """
+    __tablename__ = "history_counters"
+
+    user_id = Column(String(36), primary_key=True)
+    table_name = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+def _adjust_history_count(connection, table_name: str, user_id: str, delta: int) -> None:
+    # 카운터가 없으면 만들고 있으면 더함 (upsert라 동시에 처음 저장해도 누락 없음)
+    # 카운터 도입 전 행은 schema_migration._backfill_history_counters가 채움
+    counters = HistoryCounter.__table__
+    if connection.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    statement = insert(counters).values(user_id=user_id, table_name=table_name, count=max(delta, 0))
+    connection.execute(statement.on_conflict_do_update(
+        index_elements=[counters.c.user_id, counters.c.table_name],
+        set_={"count": counters.c.count + delta}
+    ))
+
+def track_history_count(model) -> None:
+    """
+    모델의 행이 추가/삭제될 때 같은 트랜잭션 안에서 사용자별 카운터를 갱신하도록 등록합니다.
+
+    Args:
+        model: user_id 컬럼을 가진 이력 모델
+    """
+    table_name = model.__tablename__
+
+    @event.listens_for(model, "after_insert")
+    def _after_insert(mapper, connection, target):
+        _adjust_history_count(connection, table_name, target.user_id, 1)
+
+    @event.listens_for(model, "after_delete")
+    def _after_delete(mapper, connection, target):
+        _adjust_history_count(connection, table_name, target.user_id, -1)
+
+    model.__history_counted__ = True
+    # 스키마 업그레이드 시 카운터를 채울 테이블 표시
+    model.__table__.info["history_counted"] = True
+
+def track_result_summary(model) -> None:
+    """
+    모델의 행을 저장할 때 summary가 비어 있으면 result_json에서 요약을 만들어 채우도록 등록합니다.
+
+    Args:
+        model: result_json, summary 컬럼을 가진 이력 모델
+    """
+    @event.listens_for(model, "before_insert")
+    def _before_insert(mapper, connection, target):
+        if target.summary is None and target.result_json is not None:
+            target.summary = build_result_summary(target.result_json)
+
+for _model in (AnalysisHistory, StrategyHistory, CrawlHistory):
+    track_history_count(_model)
+    track_result_summary(_model)
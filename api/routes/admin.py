@@ -6,6 +6,12 @@ from datetime import datetime, timedelta
 from api.db.database import get_db
 from api.models.admin_log import AnalysisLog
 from api.dependencies.auth import get_current_user_id
+from api.services.cache_manager import cache_manager
+from api.services.single_flight import single_flight
+from api.services.llm_clients import llm_clients
+from api.services.llm_router import llm_router
+from api.services.llm_cache import llm_response_cache
+from api.services.pdf_renderer import pdf_renderer
 
 router = APIRouter()
 
@@ -61,4 +67,30 @@ async def get_admin_stats(
         raise HTTPException(
             status_code=500,
             detail=f"통계 데이터 조회 중 오류가 발생했습니다: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+@router.get("/admin/cache-stats")
+async def get_cache_stats(
+    user_id: str = Depends(get_current_user_id)
+) -> Dict[str, Any]:
+    """
+    크롤링 캐시의 히트/미스/제거 통계를 반환합니다.
+    
+    Returns:
+        Dict[str, Any]: 캐시 통계
+            - entries / bytes: 현재 저장된 항목 수와 사용 바이트
+            - hits / misses / hit_rate_percent: 조회 통계
+            - evictions / expired_purged: 한도 초과 제거 및 만료 정리 횟수
+            - single_flight: 진행 중인 요청 수와 합류한 요청 수
+            - llm_clients: 제공자별 동시 요청 수, 재시도 횟수, 서킷 상태, 오류율, 응답 시간 백분위수
+            - llm_router: 헤지/대체 요청 통계
+            - llm_cache: LLM 응답 캐시 히트/미스/우회 통계
+            - pdf_renderer: PDF 렌더링 대기열과 렌더링 결과 캐시 통계
+    """
+    stats = cache_manager.get_stats()
+    stats["single_flight"] = single_flight.get_stats()
+    stats["llm_clients"] = llm_clients.get_stats()
+    stats["llm_router"] = llm_router.get_stats()
+    stats["llm_cache"] = llm_response_cache.get_stats()
+    stats["pdf_renderer"] = pdf_renderer.get_stats()
+    return stats
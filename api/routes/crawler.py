@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from ..services.cache_manager import cache_manager
@@ -37,6 +38,13 @@ from ..services.crawlers.clien_crawler import crawl_clien
 
 from ..utils.logger import crawl_logger
 from ..services.rate_limiter import rate_limiter
+from ..services.crawl_fanout import crawl_fanout
+from ..services.single_flight import single_flight
+from ..services.post_store import post_store
+from ..services.storage_codec import storage_codec
+from ..utils.text_cleaner import filter_short_results
+from ..utils.near_duplicate import NearDuplicateIndex, remove_near_duplicates
+from ..utils.result_ranker import select_results, ANALYSIS_INPUT_TOKEN_BUDGET
 from api.dependencies.auth import get_current_user_id
 
 router = APIRouter()
@@ -51,13 +59,20 @@ CHANNEL_CRAWLER_MAP = {
     "clien": crawl_clien
 }
 
+# 게시물 저장소를 거치는 증분 크롤러 매핑 (high-water mark 이후 게시물만 수집 후 저장분과 병합)
+STORED_CRAWLER_MAP = {
+    channel: post_store.wrap(channel, crawler_func)
+    for channel, crawler_func in CHANNEL_CRAWLER_MAP.items()
+}
+
 # 환경 변수에서 로깅 활성화 여부 확인
 SAVE_CRAWL_RESULTS = os.getenv("SAVE_CRAWL_RESULTS", "false").lower() == "true"
 CRAWL_LOG_DIR = os.getenv("CRAWL_LOG_DIR", "crawl_logs")
 
 def save_crawl_result(user_id: str, input_text: str, channels: List[str], results: List[Dict[str, Any]]) -> None:
     """
-    크롤링 결과를 JSON 파일로 저장합니다.
+    크롤링 결과를 압축된 JSON 파일로 저장합니다 (디버깅용, SAVE_CRAWL_RESULTS=true일 때만).
+    게시물은 post_store에 URL 기준으로 영구 저장되므로 운영 환경에서는 필요하지 않습니다.
     
     Args:
         user_id (str): 사용자 ID
@@ -72,21 +87,21 @@ def save_crawl_result(user_id: str, input_text: str, channels: List[str], result
         # 타임스탬프 생성
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # 파일명 생성 (사용자ID_타임스탬프.json)
-        filename = f"{CRAWL_LOG_DIR}/{user_id}_{timestamp}.json"
-        
         # 디렉토리 생성
         os.makedirs(CRAWL_LOG_DIR, exist_ok=True)
         
-        # 결과 저장
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump({
-                "user_id": user_id,
-                "input_text": input_text,
-                "channels": channels,
-                "timestamp": timestamp,
-                "results": results
-            }, f, ensure_ascii=False, indent=2)
+        # 결과 저장 (압축된 JSON, 사용자ID_타임스탬프.json.zst)
+        payload = json.dumps({
+            "user_id": user_id,
+            "input_text": input_text,
+            "channels": channels,
+            "timestamp": timestamp,
+            "results": results
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        data, suffix = storage_codec.encode_file(payload)
+        filename = f"{CRAWL_LOG_DIR}/{user_id}_{timestamp}.json{suffix}"
+        with open(filename, "wb") as f:
+            f.write(data)
             
         print(f"[CRAWL] 결과 저장 완료: {filename}")
         
@@ -167,160 +182,399 @@ def calculate_metadata(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         "total_length": total_length
     }
 
-@router.post("/crawl", response_model=CrawlResponse)
-async def crawl_text(data: CrawlRequest, user_id: str = Depends(get_current_user_id)):
+def validate_crawl_request(data: CrawlRequest, user_id: str) -> List[str]:
+    """
+    크롤링 요청의 요청 제한과 입력값을 검증합니다.
+    
+    Args:
+        data (CrawlRequest): 크롤링 요청
+        user_id (str): 사용자 ID
+        
+    Returns:
+        List[str]: 정렬된 사용 채널 목록
+        
+    Raises:
+        HTTPException: 요청 제한 초과 또는 입력값 검증 실패 시
+    """
+    # 요청 제한 확인
     try:
-        # 요청 제한 확인
-        try:
-            rate_limiter.check_rate_limit(user_id)
-        except Exception as e:
-            print(f"[RATE_LIMIT] 사용자 {user_id} 요청 제한 초과")
-            crawl_logger.log_error(
-                user_id=user_id,
-                input_text=data.input_text,
-                channels=data.channels,
-                error_type="RATE_LIMIT",
-                error_message=str(e)
-            )
-            raise HTTPException(
-                status_code=429,
-                detail={
-                    "message": str(e),
-                    "stats": rate_limiter.get_user_stats(user_id)
-                }
-            )
+        rate_limiter.check_rate_limit(user_id)
+    except Exception as e:
+        print(f"[RATE_LIMIT] 사용자 {user_id} 요청 제한 초과")
+        crawl_logger.log_error(
+            user_id=user_id,
+            input_text=data.input_text,
+            channels=data.channels,
+            error_type="RATE_LIMIT",
+            error_message=str(e)
+        )
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "message": str(e),
+                "stats": rate_limiter.get_user_stats(user_id)
+            }
+        )
 
-        # 사용된 채널 목록 정렬
-        used_channels = sorted(list(set(data.channels)))
-        print(f"[CRAWL] 사용 채널: {', '.join(used_channels)}")
+    # 사용된 채널 목록 정렬
+    used_channels = sorted(list(set(data.channels)))
+    print(f"[CRAWL] 사용 채널: {', '.join(used_channels)}")
 
-        # Debug logging for request details
-        print(f"[CRAWL] 요청 채널: {data.channels}")
-        print(f"[CRAWL] 입력 텍스트: {data.input_text}")
-        print(f"[CRAWL] 사용자 ID: {user_id}")
+    # Debug logging for request details
+    print(f"[CRAWL] 요청 채널: {data.channels}")
+    print(f"[CRAWL] 입력 텍스트: {data.input_text}")
+    print(f"[CRAWL] 사용자 ID: {user_id}")
 
-        # Input text validation
-        MAX_INPUT_LENGTH = 500
-        if not data.input_text.strip():
-            print("[CRAWL] 빈 입력 텍스트 요청 거부")
-            crawl_logger.log_error(
-                user_id=user_id,
-                input_text=data.input_text,
-                channels=data.channels,
-                error_type="VALIDATION",
-                error_message="입력 텍스트가 비어 있습니다"
-            )
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": "입력 텍스트가 비어 있습니다.",
-                    "note": "검색할 키워드나 문장을 입력해주세요."
-                }
-            )
+    # Input text validation
+    MAX_INPUT_LENGTH = 500
+    if not data.input_text.strip():
+        print("[CRAWL] 빈 입력 텍스트 요청 거부")
+        crawl_logger.log_error(
+            user_id=user_id,
+            input_text=data.input_text,
+            channels=data.channels,
+            error_type="VALIDATION",
+            error_message="입력 텍스트가 비어 있습니다"
+        )
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": "입력 텍스트가 비어 있습니다.",
+                "note": "검색할 키워드나 문장을 입력해주세요."
+            }
+        )
 
-        if len(data.input_text) > MAX_INPUT_LENGTH:
-            print(f"[CRAWL] 입력 텍스트 길이 초과: {len(data.input_text)}자")
-            crawl_logger.log_error(
-                user_id=user_id,
-                input_text=data.input_text,
-                channels=data.channels,
-                error_type="VALIDATION",
-                error_message=f"입력 텍스트 길이 초과: {len(data.input_text)}자"
-            )
-            raise HTTPException(
-                status_code=413,
-                detail={
-                    "message": f"입력 텍스트는 최대 {MAX_INPUT_LENGTH}자까지 허용됩니다.",
-                    "current_length": len(data.input_text),
-                    "note": "더 짧은 키워드나 문장으로 다시 시도해주세요."
-                }
-            )
+    if len(data.input_text) > MAX_INPUT_LENGTH:
+        print(f"[CRAWL] 입력 텍스트 길이 초과: {len(data.input_text)}자")
+        crawl_logger.log_error(
+            user_id=user_id,
+            input_text=data.input_text,
+            channels=data.channels,
+            error_type="VALIDATION",
+            error_message=f"입력 텍스트 길이 초과: {len(data.input_text)}자"
+        )
+        raise HTTPException(
+            status_code=413,
+            detail={
+                "message": f"입력 텍스트는 최대 {MAX_INPUT_LENGTH}자까지 허용됩니다.",
+                "current_length": len(data.input_text),
+                "note": "더 짧은 키워드나 문장으로 다시 시도해주세요."
+            }
+        )
 
-        # Check for empty channels
-        if not data.channels:
-            print("[CRAWL] 빈 채널 리스트 요청 거부")
-            crawl_logger.log_error(
-                user_id=user_id,
-                input_text=data.input_text,
-                channels=data.channels,
-                error_type="VALIDATION",
-                error_message="크롤링할 채널을 1개 이상 선택해야 합니다"
-            )
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": "크롤링할 채널을 1개 이상 선택해야 합니다.",
-                    "supported_community_channels": COMMUNITY_CHANNELS,
-                    "note": "커뮤니티 채널 중 최소 1개는 포함해야 합니다."
-                }
-            )
+    # Check for empty channels
+    if not data.channels:
+        print("[CRAWL] 빈 채널 리스트 요청 거부")
+        crawl_logger.log_error(
+            user_id=user_id,
+            input_text=data.input_text,
+            channels=data.channels,
+            error_type="VALIDATION",
+            error_message="크롤링할 채널을 1개 이상 선택해야 합니다"
+        )
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": "크롤링할 채널을 1개 이상 선택해야 합니다.",
+                "supported_community_channels": COMMUNITY_CHANNELS,
+                "note": "커뮤니티 채널 중 최소 1개는 포함해야 합니다."
+            }
+        )
 
-        # Check if all channels are SNS channels
-        if all(ch in SNS_CHANNELS for ch in data.channels):
-            print(f"[CRAWL] SNS 채널만 포함된 요청 거부: {data.channels}")
-            crawl_logger.log_error(
-                user_id=user_id,
-                input_text=data.input_text,
-                channels=data.channels,
-                error_type="VALIDATION",
-                error_message="선택된 채널이 모두 SNS 채널입니다"
-            )
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": "선택된 채널이 모두 SNS 채널입니다.",
-                    "supported_community_channels": COMMUNITY_CHANNELS,
-                    "note": "커뮤니티 채널 중 최소 1개는 포함해야 합니다."
-                }
-            )
+    # Check if all channels are SNS channels
+    if all(ch in SNS_CHANNELS for ch in data.channels):
+        print(f"[CRAWL] SNS 채널만 포함된 요청 거부: {data.channels}")
+        crawl_logger.log_error(
+            user_id=user_id,
+            input_text=data.input_text,
+            channels=data.channels,
+            error_type="VALIDATION",
+            error_message="선택된 채널이 모두 SNS 채널입니다"
+        )
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": "선택된 채널이 모두 SNS 채널입니다.",
+                "supported_community_channels": COMMUNITY_CHANNELS,
+                "note": "커뮤니티 채널 중 최소 1개는 포함해야 합니다."
+            }
+        )
 
-        # Check for unsupported SNS channels
-        unsupported_sns = [ch for ch in data.channels if ch in SNS_CHANNELS]
-        if unsupported_sns:
-            print(f"[CRAWL] SNS 채널 요청 거부: {unsupported_sns}")
-            crawl_logger.log_error(
-                user_id=user_id,
-                input_text=data.input_text,
-                channels=data.channels,
-                error_type="VALIDATION",
-                error_message=f"현재 SNS 채널은 크롤링을 지원하지 않습니다: {unsupported_sns}"
-            )
-            raise HTTPException(
-                status_code=501,
-                detail={
-                    "message": f"현재 SNS 채널은 크롤링을 지원하지 않습니다: {unsupported_sns}",
-                    "supported_community_channels": COMMUNITY_CHANNELS,
-                    "note": "SNS 채널 분석은 서비스 준비 중입니다."
-                }
-            )
+    # Check for unsupported SNS channels
+    unsupported_sns = [ch for ch in data.channels if ch in SNS_CHANNELS]
+    if unsupported_sns:
+        print(f"[CRAWL] SNS 채널 요청 거부: {unsupported_sns}")
+        crawl_logger.log_error(
+            user_id=user_id,
+            input_text=data.input_text,
+            channels=data.channels,
+            error_type="VALIDATION",
+            error_message=f"현재 SNS 채널은 크롤링을 지원하지 않습니다: {unsupported_sns}"
+        )
+        raise HTTPException(
+            status_code=501,
+            detail={
+                "message": f"현재 SNS 채널은 크롤링을 지원하지 않습니다: {unsupported_sns}",
+                "supported_community_channels": COMMUNITY_CHANNELS,
+                "note": "SNS 채널 분석은 서비스 준비 중입니다."
+            }
+        )
+
+    # Validate channels (only community channels supported)
+    unsupported_channels = [ch for ch in data.channels if ch not in COMMUNITY_CHANNELS]
+    if unsupported_channels:
+        print(f"[CRAWL] 미지원 채널 요청 거부: {unsupported_channels}")
+        crawl_logger.log_error(
+            user_id=user_id,
+            input_text=data.input_text,
+            channels=data.channels,
+            error_type="VALIDATION",
+            error_message=f"지원하지 않는 채널이 포함되어 있습니다: {unsupported_channels}"
+        )
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": f"지원하지 않는 채널이 포함되어 있습니다: {unsupported_channels}",
+                "supported_community_channels": COMMUNITY_CHANNELS,
+                "note": "현재 커뮤니티 채널만 지원됩니다."
+            }
+        )
+
+    return used_channels
+
+def label_channel_results(channel: str, channel_result: List[Any]) -> List[Dict[str, Any]]:
+    """
+    채널 크롤링 결과의 제목과 본문에 채널 라벨을 추가하고 채널 키를 기록합니다.
+    
+    Args:
+        channel (str): 채널 키
+        channel_result (List[Any]): 채널 크롤링 결과 (dict 또는 문자열)
+        
+    Returns:
+        List[Dict[str, Any]]: 라벨이 추가된 결과 리스트
+    """
+    labeled_results = []
+    for result in channel_result:
+        if not isinstance(result, dict):
+            result = {"title": "", "content": str(result)}
+        # 제목과 본문에 채널 라벨 추가
+        if "title" in result:
+            result["title"] = format_result_with_channel(channel, result["title"])
+        if "content" in result:
+            result["content"] = format_result_with_channel(channel, result["content"])
+        result["channel"] = channel
+        labeled_results.append(result)
+    return labeled_results
+
+async def run_uncached_crawl(
+    data: CrawlRequest,
+    user_id: str,
+    used_channels: List[str],
+    cache_key: str,
+    credit_info: Optional[Dict[str, Any]] = None
+) -> CrawlResponse:
+    """
+    캐시에 없는 요청에 대해 크레딧 처리, 크롤링, 후처리, 캐시 저장을 수행합니다.
+    
+    Args:
+        data (CrawlRequest): 크롤링 요청
+        user_id (str): 사용자 ID
+        used_channels (List[str]): 정렬된 사용 채널 목록
+        cache_key (str): 캐시 키
+        credit_info (Optional[Dict[str, Any]]): 이미 계산된 크레딧 정보 (백그라운드 갱신 시 재사용, 차감하지 않음)
+        
+    Returns:
+        CrawlResponse: 크롤링 응답
+    """
+    # Process credits
+    if credit_info is None:
+        credit_info = credit_manager.process_request(
+            text=data.input_text,
+            community_channels=[c for c in data.channels if get_channel_type(c) == "community"],
+            sns_channels=[],  # SNS channels not supported yet
+            user_id=user_id,
+            db_connection=None
+        )
+        print(f"[CREDIT] 사용자 {user_id}에게 {credit_info['final_credit']} 크레딧 차감")
 
-        # Validate channels (only community channels supported)
-        unsupported_channels = [ch for ch in data.channels if ch not in COMMUNITY_CHANNELS]
-        if unsupported_channels:
-            print(f"[CRAWL] 미지원 채널 요청 거부: {unsupported_channels}")
-            crawl_logger.log_error(
+    # Execute crawlers concurrently with per-channel deadlines
+    print(f"[CRAWL] 크롤링 시작: {len(data.channels)}개 채널 (동시 실행)")
+    channel_outcomes = await crawl_fanout.run(data.channels, STORED_CRAWLER_MAP, data.input_text)
+
+    channel_results: Dict[str, List[Any]] = {}
+    failed_channels = []
+    timed_out_channels = []  # 제한 시간 내 응답하지 못한 채널
+    channel_stats = {}  # 채널별 결과 개수 통계
+    success_count = 0
+    failure_count = 0
+
+    for channel, outcome in channel_outcomes.items():
+        if outcome["status"] != "success":
+            error_type = {
+                "unsupported": "VALIDATION",
+                "timeout": "TIMEOUT"
+            }.get(outcome["status"], "EXCEPTION")
+            print(f"[CRAWL][{channel}] 크롤링 실패: {outcome['error']}")
+            crawl_logger.log_failure(
                 user_id=user_id,
+                channel=channel,
                 input_text=data.input_text,
-                channels=data.channels,
-                error_type="VALIDATION",
-                error_message=f"지원하지 않는 채널이 포함되어 있습니다: {unsupported_channels}"
-            )
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": f"지원하지 않는 채널이 포함되어 있습니다: {unsupported_channels}",
-                    "supported_community_channels": COMMUNITY_CHANNELS,
-                    "note": "현재 커뮤니티 채널만 지원됩니다."
-                }
+                error_msg=outcome["error"],
+                error_type=error_type
             )
+            failed_channels.append(channel)
+            if outcome["status"] == "timeout":
+                timed_out_channels.append(channel)
+            channel_stats[channel] = 0
+            failure_count += 1
+            continue
+
+        channel_results[channel] = outcome["results"]
+        channel_stats[channel] = len(outcome["results"])
+        print(f"[CRAWL][{channel}] 크롤링 완료: {channel_stats[channel]}개 결과 ({outcome['elapsed']}초)")
+        success_count += 1
+
+    # Check if any results were obtained
+    if not any(channel_results.values()):
+        print(f"[CRAWL] 모든 채널 크롤링 실패: {failed_channels}")
+        crawl_logger.log_error(
+            user_id=user_id,
+            input_text=data.input_text,
+            channels=data.channels,
+            error_type="SYSTEM",
+            error_message="모든 채널 크롤링에 실패했습니다"
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="모든 채널 크롤링에 실패했습니다."
+        )
+
+    # Log partial success if some channels failed
+    if failed_channels:
+        print(f"[CRAWL] 일부 채널 크롤링 실패: {failed_channels}")
+        print(f"[CRAWL] 성공한 결과 수: {sum(channel_stats.values())}")
+
+    # 크롤링 결과 취합 (각 결과에 채널 라벨 추가)
+    results = []
+    for channel, channel_result in channel_results.items():
+        results.extend(label_channel_results(channel, channel_result))
+
+    print(f"[CRAWL] 채널 라벨 추가 후 결과: {len(results)}개")
+
+    # 근사 중복 제거 (이모지/URL/채널 라벨만 다른 재게시물 포함)
+    unique_results = remove_near_duplicates(results)
+    
+    print(f"[CRAWL] 중복 제거 후 결과: {len(unique_results)}개 (원본: {len(results)}개)")
+
+    # 짧은 문장 필터링
+    filtered_results = filter_short_results(unique_results, min_length=10)
+    print(f"[CRAWL] 짧은 문장 필터링 후 결과: {len(filtered_results)}개 (중복 제거 후: {len(unique_results)}개)")
+
+    # 관련도/반응도/최신성 점수와 채널 균형을 고려해 최대 결과 개수만큼 선택
+    MAX_RESULT_COUNT = 30
+    final_results = select_results(filtered_results, data.input_text, max_count=MAX_RESULT_COUNT)
+    print(f"[CRAWL] 최종 결과 개수: {len(final_results)}개 (최대 {MAX_RESULT_COUNT}개 제한)")
+
+    # Claude 분석 입력은 토큰 예산 안에서 다시 선택
+    sampled_results = select_results(
+        final_results,
+        data.input_text,
+        max_count=MAX_ANALYSIS_INPUT_COUNT,
+        token_budget=ANALYSIS_INPUT_TOKEN_BUDGET
+    )
+    was_sampled = len(sampled_results) < len(final_results)
+    if was_sampled:
+        print(f"[CRAWL] Claude 분석을 위한 샘플링 적용: {len(final_results)}개 -> {len(sampled_results)}개")
+
+    # 메타데이터 통계 계산
+    metadata = calculate_metadata(final_results)
+    metadata["was_sampled"] = was_sampled
+    metadata["original_count"] = len(final_results)
+    metadata["sampled_count"] = len(sampled_results)
+    
+    # 실패율 계산
+    total_attempted = success_count + failure_count
+    fail_rate = round((failure_count / total_attempted) * 100, 1) if total_attempted > 0 else 0
+    metadata["success_count"] = success_count
+    metadata["failure_count"] = failure_count
+    metadata["fail_rate_percent"] = fail_rate
+    metadata["timed_out_channels"] = timed_out_channels
+    
+    print(f"[CRAWL] 메타데이터: 총 {metadata['total_count']}개, 평균 길이 {metadata['average_length']}자, 실패율 {fail_rate}%")
+
+    # 결과 저장
+    save_crawl_result(user_id, data.input_text, data.channels, final_results)
+
+    # 분석 이력 기록
+    crawl_logger.log_analysis_history(
+        user_id=user_id,
+        input_text=data.input_text,
+        channels=data.channels,
+        results=final_results,
+        metadata=metadata
+    )
+
+    # 캐시에 저장 (캐시/SWR 히트도 미스와 같은 토큰 예산 내 결과를 반환하도록 샘플링 결과를 저장)
+    cache_manager.set(
+        cache_key,
+        {
+            "results": sampled_results,
+            "credit_info": credit_info,
+            "channel_stats": channel_stats,
+            "metadata": metadata
+        }
+    )
+    print(f"[CACHE] 캐시 저장 완료: key={cache_key}, 항목 수={len(sampled_results)}")
+
+    # 최종 결과 반환
+    crawl_logger.log_request(
+        user_id=user_id,
+        input_text=data.input_text,
+        channels=data.channels,
+        from_cache=False,
+        result_count=len(final_results)
+    )
+    return CrawlResponse(
+        from_cache=False,
+        final_credit=credit_info["final_credit"],
+        used_channels=used_channels,
+        results=sampled_results,
+        channel_stats=channel_stats,
+        meta={
+            "total_count": metadata["total_count"],
+            "average_length": metadata["average_length"],
+            "was_sampled": was_sampled,
+            "fail_rate_percent": fail_rate
+        }
+    )
+
+@router.post("/crawl", response_model=CrawlResponse)
+async def crawl_text(data: CrawlRequest, user_id: str = Depends(get_current_user_id)):
+    try:
+        used_channels = validate_crawl_request(data, user_id)
 
         # Generate cache key and check cache
         cache_key = cache_manager.generate_key(data.input_text, data.channels)
         print(f"[CRAWL] 캐시 키: {cache_key}")
 
-        cached_result = cache_manager.get(cache_key)
-        if cached_result:
-            print(f"[CACHE] 캐시에서 결과 반환됨: key={cache_key}")
+        cached_entry = cache_manager.get_entry(cache_key)
+        if cached_entry:
+            cached_result, age_seconds, is_stale = cached_entry
+            if is_stale:
+                # soft TTL이 지난 항목은 즉시 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
+                print(f"[CACHE] stale 캐시 반환 후 백그라운드 갱신: key={cache_key}, age={age_seconds}초")
+                cache_manager.refresh_in_background(
+                    cache_key,
+                    lambda: single_flight.do(
+                        f"crawl:{cache_key}",
+                        lambda: run_uncached_crawl(
+                            data, user_id, used_channels, cache_key,
+                            credit_info=cached_result["credit_info"]
+                        )
+                    )
+                )
+            else:
+                print(f"[CACHE] 캐시에서 결과 반환됨: key={cache_key}")
             crawl_logger.log_request(
                 user_id=user_id,
                 input_text=data.input_text,
@@ -334,198 +588,187 @@ async def crawl_text(data: CrawlRequest, user_id: str = Depends(get_current_user
                 from_cache=True,
                 used_channels=used_channels,
                 channel_stats=cached_result["channel_stats"],
-                meta=cached_result["metadata"]
+                meta={
+                    **cached_result["metadata"],
+                    "stale": is_stale,
+                    "cache_age_seconds": age_seconds
+                }
             )
 
-        # Process credits
-        credit_info = credit_manager.process_request(
-            text=data.input_text,
-            community_channels=[c for c in data.channels if get_channel_type(c) == "community"],
-            sns_channels=[],  # SNS channels not supported yet
+        # 동일한 요청이 이미 진행 중이면 그 결과를 공유 (single-flight)
+        response, shared = await single_flight.do(
+            f"crawl:{cache_key}",
+            lambda: run_uncached_crawl(data, user_id, used_channels, cache_key)
+        )
+        if shared:
+            print(f"[CRAWL] 진행 중인 동일 요청 결과 공유: key={cache_key}")
+            crawl_logger.log_request(
+                user_id=user_id,
+                input_text=data.input_text,
+                channels=data.channels,
+                from_cache=True,
+                result_count=len(response.results)
+            )
+            return response.copy(update={"from_cache": True})
+        return response
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"[CRAWL] 시스템 오류 발생: {str(e)}")
+        crawl_logger.log_error(
             user_id=user_id,
-            db_connection=None
+            input_text=data.input_text,
+            channels=data.channels,
+            error_type="SYSTEM",
+            error_message=str(e)
         )
-        print(f"[CREDIT] 사용자 {user_id}에게 {credit_info['final_credit']} 크레딧 차감")
+        raise HTTPException(status_code=500, detail="크롤링 중 오류가 발생했습니다") 
+
+@router.post("/crawl/stream")
+async def crawl_text_stream(data: CrawlRequest, user_id: str = Depends(get_current_user_id)):
+    """
+    채널별 크롤링 결과를 완료되는 순서대로 NDJSON 스트림으로 전송합니다.
+    
+    각 줄은 JSON 객체이며 type 필드로 구분됩니다.
+    - "channel": 채널 하나의 라벨/중복 제거/필터링이 끝난 결과
+    - "cached": 캐시에서 조회된 분석 입력 결과 (토큰 예산 내로 샘플링된 결과)
+    - "summary": 마지막 줄, channel_stats와 메타데이터 포함
+    """
+    used_channels = validate_crawl_request(data, user_id)
+
+    cache_key = cache_manager.generate_key(data.input_text, data.channels)
+    cached_result = cache_manager.get(cache_key)
+
+    async def cached_stream():
+        crawl_logger.log_request(
+            user_id=user_id,
+            input_text=data.input_text,
+            channels=data.channels,
+            from_cache=True,
+            result_count=len(cached_result["results"])
+        )
+        yield json.dumps({
+            "type": "cached",
+            "results": cached_result["results"]
+        }, ensure_ascii=False) + "\n"
+        yield json.dumps({
+            "type": "summary",
+            "from_cache": True,
+            "final_credit": cached_result["credit_info"]["final_credit"],
+            "used_channels": used_channels,
+            "channel_stats": cached_result["channel_stats"],
+            "meta": cached_result["metadata"]
+        }, ensure_ascii=False) + "\n"
+
+    if cached_result:
+        print(f"[CACHE] 캐시에서 스트림 결과 반환됨: key={cache_key}")
+        return StreamingResponse(cached_stream(), media_type="application/x-ndjson")
+
+    credit_info = credit_manager.process_request(
+        text=data.input_text,
+        community_channels=[c for c in data.channels if get_channel_type(c) == "community"],
+        sns_channels=[],  # SNS channels not supported yet
+        user_id=user_id,
+        db_connection=None
+    )
+    print(f"[CREDIT] 사용자 {user_id}에게 {credit_info['final_credit']} 크레딧 차감")
 
-        # Execute crawlers with error handling
-        print(f"[CRAWL] 크롤링 시작: {len(data.channels)}개 채널")
-        all_results = []
-        failed_channels = []
-        channel_stats = {}  # 채널별 결과 개수 통계
+    async def crawl_stream():
+        MAX_RESULT_COUNT = 30
+        final_results = []
+        dedup_index = NearDuplicateIndex()
+        channel_stats = {}
+        timed_out_channels = []
         success_count = 0
         failure_count = 0
 
-        for channel in data.channels:
-            if channel not in CHANNEL_CRAWLER_MAP:
-                print(f"[CRAWL][{channel}] 지원하지 않는 채널")
-                crawl_logger.log_failure(
-                    user_id=user_id,
-                    channel=channel,
-                    input_text=data.input_text,
-                    error_msg="지원하지 않는 채널",
-                    error_type="VALIDATION"
-                )
-                failed_channels.append(channel)
-                channel_stats[channel] = 0
-                failure_count += 1
-                continue
-
-            try:
-                print(f"[CRAWL][{channel}] 크롤링 시작")
-                result = await CHANNEL_CRAWLER_MAP[channel](data.input_text)
-                
-                if isinstance(result, Exception):
-                    print(f"[CRAWL][{channel}] 크롤링 실패: {str(result)}")
-                    crawl_logger.log_failure(
-                        user_id=user_id,
-                        channel=channel,
-                        input_text=data.input_text,
-                        error_msg=str(result),
-                        error_type="CRAWL"
-                    )
-                    failed_channels.append(channel)
-                    channel_stats[channel] = 0
-                    failure_count += 1
-                    continue
-                    
-                # Ensure each result is a string
-                if isinstance(result, list):
-                    all_results.extend([str(item) for item in result])
-                    channel_stats[channel] = len(result)
-                else:
-                    all_results.append(str(result))
-                    channel_stats[channel] = 1
-                    
-                print(f"[CRAWL][{channel}] 크롤링 완료: {channel_stats[channel]}개 결과")
-                success_count += 1
-                
-            except Exception as e:
-                print(f"[CRAWL][{channel}] 크롤링 실패: {str(e)}")
+        print(f"[CRAWL] 스트림 크롤링 시작: {len(data.channels)}개 채널")
+        async for channel, outcome in crawl_fanout.iter_completed(data.channels, STORED_CRAWLER_MAP, data.input_text):
+            if outcome["status"] != "success":
+                print(f"[CRAWL][{channel}] 크롤링 실패: {outcome['error']}")
                 crawl_logger.log_failure(
                     user_id=user_id,
                     channel=channel,
                     input_text=data.input_text,
-                    error_msg=str(e),
-                    error_type="EXCEPTION"
+                    error_msg=outcome["error"],
+                    error_type="TIMEOUT" if outcome["status"] == "timeout" else "EXCEPTION"
                 )
-                failed_channels.append(channel)
+                if outcome["status"] == "timeout":
+                    timed_out_channels.append(channel)
                 channel_stats[channel] = 0
                 failure_count += 1
+                yield json.dumps({
+                    "type": "channel",
+                    "channel": channel,
+                    "status": outcome["status"],
+                    "error": outcome["error"],
+                    "results": []
+                }, ensure_ascii=False) + "\n"
                 continue
 
-        # Check if any results were obtained
-        if not all_results:
-            print(f"[CRAWL] 모든 채널 크롤링 실패: {failed_channels}")
-            crawl_logger.log_error(
-                user_id=user_id,
-                input_text=data.input_text,
-                channels=data.channels,
-                error_type="SYSTEM",
-                error_message="모든 채널 크롤링에 실패했습니다"
-            )
-            raise HTTPException(
-                status_code=500,
-                detail="모든 채널 크롤링에 실패했습니다."
-            )
-
-        # Log partial success if some channels failed
-        if failed_channels:
-            print(f"[CRAWL] 일부 채널 크롤링 실패: {failed_channels}")
-            print(f"[CRAWL] 성공한 결과 수: {len(all_results)}")
-
-        # 크롤링 결과 취합
-        results = []
-        for channel, channel_result in zip(data.channels, all_results):
-            # 각 결과에 채널 라벨 추가
-            labeled_results = []
-            for result in channel_result:
-                # 제목과 본문에 채널 라벨 추가
-                if "title" in result:
-                    result["title"] = format_result_with_channel(channel, result["title"])
-                if "content" in result:
-                    result["content"] = format_result_with_channel(channel, result["content"])
-                labeled_results.append(result)
-            results.extend(labeled_results)
-
-        print(f"[CRAWL] 채널 라벨 추가 후 결과: {len(results)}개")
-
-        # 중복 제거 로직
-        unique_results = []
-        seen_contents = set()
-        
-        for result in results:
-            # 본문과 제목을 결합하여 중복 체크
-            content_key = f"{result.get('title', '')} {result.get('content', '')}".strip()
-            
-            # 빈 내용이거나 이미 본 내용이면 건너뛰기
-            if not content_key or content_key in seen_contents:
-                continue
-                
-            # 중복되지 않은 결과만 추가
-            unique_results.append(result)
-            seen_contents.add(content_key)
-            
-        print(f"[CRAWL] 중복 제거 후 결과: {len(unique_results)}개 (원본: {len(results)}개)")
-
-        # 짧은 문장 필터링
-        from ....utils.text_cleaner import filter_short_results
-        filtered_results = filter_short_results(unique_results, min_length=10)
-        print(f"[CRAWL] 짧은 문장 필터링 후 결과: {len(filtered_results)}개 (중복 제거 후: {len(unique_results)}개)")
-
-        # 최대 결과 개수 제한
-        MAX_RESULT_COUNT = 30
-        final_results = filtered_results[:MAX_RESULT_COUNT]
-        print(f"[CRAWL] 최종 결과 개수: {len(final_results)}개 (최대 {MAX_RESULT_COUNT}개 제한)")
-
-        # Claude 분석을 위한 샘플링 적용
-        if len(final_results) > MAX_ANALYSIS_INPUT_COUNT:
-            sampled_results = final_results[:MAX_ANALYSIS_INPUT_COUNT]
-            was_sampled = True
-            print(f"[CRAWL] Claude 분석을 위한 샘플링 적용: {len(final_results)}개 -> {len(sampled_results)}개")
-        else:
-            sampled_results = final_results
-            was_sampled = False
-
-        # 메타데이터 통계 계산
+            channel_stats[channel] = len(outcome["results"])
+            success_count += 1
+
+            # 이전 채널 결과와 함께 중복 제거 후 짧은 문장 필터링
+            unique_results = [
+                result for result in label_channel_results(channel, outcome["results"])
+                if dedup_index.add(f"{result.get('title', '')} {result.get('content', '')}")
+            ]
+            channel_final = filter_short_results(unique_results, min_length=10)
+            # 남은 자리를 아직 응답하지 않은 채널과 나눠 갖도록 채널 내 상위 결과만 전송
+            pending_channels = len(data.channels) - success_count - failure_count + 1
+            channel_share = -(-max(0, MAX_RESULT_COUNT - len(final_results)) // pending_channels)
+            channel_final = select_results(channel_final, data.input_text, max_count=channel_share)
+            final_results.extend(channel_final)
+
+            print(f"[CRAWL][{channel}] 스트림 전송: {len(channel_final)}개 결과 ({outcome['elapsed']}초)")
+            yield json.dumps({
+                "type": "channel",
+                "channel": channel,
+                "status": "success",
+                "elapsed": outcome["elapsed"],
+                "results": channel_final
+            }, ensure_ascii=False) + "\n"
+
+        sampled_results = select_results(
+            final_results,
+            data.input_text,
+            max_count=MAX_ANALYSIS_INPUT_COUNT,
+            token_budget=ANALYSIS_INPUT_TOKEN_BUDGET
+        )
+        was_sampled = len(sampled_results) < len(final_results)
         metadata = calculate_metadata(final_results)
         metadata["was_sampled"] = was_sampled
         metadata["original_count"] = len(final_results)
         metadata["sampled_count"] = len(sampled_results)
-        
-        # 실패율 계산
+
         total_attempted = success_count + failure_count
         fail_rate = round((failure_count / total_attempted) * 100, 1) if total_attempted > 0 else 0
         metadata["success_count"] = success_count
         metadata["failure_count"] = failure_count
         metadata["fail_rate_percent"] = fail_rate
-        
-        print(f"[CRAWL] 메타데이터: 총 {metadata['total_count']}개, 평균 길이 {metadata['average_length']}자, 실패율 {fail_rate}%")
-
-        # 결과 저장
-        save_crawl_result(user_id, data.input_text, data.channels, final_results)
-
-        # 분석 이력 기록
-        crawl_logger.log_analysis_history(
-            user_id=user_id,
-            input_text=data.input_text,
-            channels=data.channels,
-            results=final_results,
-            metadata=metadata
-        )
+        metadata["timed_out_channels"] = timed_out_channels
 
-        # 캐시에 저장
-        cache_manager.set(
-            cache_key,
-            {
-                "results": final_results,
-                "credit_info": credit_info,
-                "channel_stats": channel_stats,
-                "metadata": metadata
-            }
-        )
-        print(f"[CACHE] 캐시 저장 완료: key={cache_key}, 항목 수={len(final_results)}")
+        if final_results:
+            save_crawl_result(user_id, data.input_text, data.channels, final_results)
+            crawl_logger.log_analysis_history(
+                user_id=user_id,
+                input_text=data.input_text,
+                channels=data.channels,
+                results=final_results,
+                metadata=metadata
+            )
+            cache_manager.set(
+                cache_key,
+                {
+                    "results": sampled_results,
+                    "credit_info": credit_info,
+                    "channel_stats": channel_stats,
+                    "metadata": metadata
+                }
+            )
 
-        # 최종 결과 반환
         crawl_logger.log_request(
             user_id=user_id,
             input_text=data.input_text,
@@ -533,29 +776,13 @@ async def crawl_text(data: CrawlRequest, user_id: str = Depends(get_current_user
             from_cache=False,
             result_count=len(final_results)
         )
-        return CrawlResponse(
-            from_cache=False,
-            final_credit=credit_info["final_credit"],
-            used_channels=used_channels,
-            results=sampled_results,
-            channel_stats=channel_stats,
-            meta={
-                "total_count": metadata["total_count"],
-                "average_length": metadata["average_length"],
-                "was_sampled": was_sampled,
-                "fail_rate_percent": fail_rate
-            }
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"[CRAWL] 시스템 오류 발생: {str(e)}")
-        crawl_logger.log_error(
-            user_id=user_id,
-            input_text=data.input_text,
-            channels=data.channels,
-            error_type="SYSTEM",
-            error_message=str(e)
-        )
-        raise HTTPException(status_code=500, detail="크롤링 중 오류가 발생했습니다") 
\ No newline at end of file
+        yield json.dumps({
+            "type": "summary",
+            "from_cache": False,
+            "final_credit": credit_info["final_credit"],
+            "used_channels": used_channels,
+            "channel_stats": channel_stats,
+            "meta": metadata
+        }, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(crawl_stream(), media_type="application/x-ndjson")
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Request, HTTPException
 from fastapi.responses import StreamingResponse
 from services.formatter import render_report_html
-from weasyprint import HTML
+from api.services.pdf_renderer import pdf_renderer
 import io
 
 router = APIRouter()
@@ -11,13 +11,13 @@ async def download_pdf(request: Request):
     try:
         data = await request.json()
         html = render_report_html(data)
-        pdf_io = io.BytesIO()
-        HTML(string=html).write_pdf(target=pdf_io)
-        pdf_io.seek(0)
+        pdf_io = io.BytesIO(await pdf_renderer.render(html))
         return StreamingResponse(
             content=pdf_io,
             media_type="application/pdf",
             headers={"Content-Disposition": "attachment; filename=intrix_report.pdf"}
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
@@ -7,7 +7,8 @@ from api.dependencies.auth import get_current_user_id
 from api.db.database import get_db
 from api.models.execution import ExecutionStrategy
 from pydantic import BaseModel
-from api.services.gpt_executor import generate_execution_strategy
+from api.services.gpt_executor import generate_execution_strategy, stream_execution_strategy
+from api.utils.sse import sse_response
 from api.services.logger import log_analysis
 from datetime import datetime
 import time
@@ -29,6 +30,73 @@ class ExecutionResponse(BaseModel):
     cta: str
     created_at: datetime
 
+def save_execution_strategy(
+    db: Session,
+    user_id: str,
+    data: ExecutionRequest,
+    hook: str,
+    flow: str,
+    cta: str,
+    start_time: float
+) -> str:
+    """
+    실행 전략을 저장(기존 전략이 있으면 갱신)하고 분석 로그를 기록합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        user_id: 현재 사용자 ID
+        data: 실행 전략 요청 데이터
+        hook: HOOK 섹션
+        flow: FLOW 섹션
+        cta: CTA 섹션
+        start_time: 생성 시작 시각 (처리 시간 계산용)
+        
+    Returns:
+        str: 저장된 실행 전략 ID
+    """
+    # 기존 전략이 있는지 확인
+    existing_strategy = db.query(ExecutionStrategy).filter(
+        ExecutionStrategy.analysis_id == data.analysis_id
+    ).first()
+    
+    if existing_strategy:
+        # 기존 전략 업데이트
+        existing_strategy.hook = hook
+        existing_strategy.flow = flow
+        existing_strategy.cta = cta
+        strategy_id = existing_strategy.id
+        logger.info(f"Updated existing strategy: {strategy_id}")
+    else:
+        # 새 전략 생성
+        strategy_id = str(uuid4())
+        record = ExecutionStrategy(
+            id=strategy_id,
+            user_id=user_id,
+            analysis_id=data.analysis_id,
+            hook=hook,
+            flow=flow,
+            cta=cta
+        )
+        db.add(record)
+        logger.info(f"Created new strategy: {strategy_id}")
+    
+    db.commit()
+    
+    # 처리 시간 계산
+    processing_time = time.time() - start_time
+    
+    # 분석 로그 기록
+    log_analysis(
+        db=db,
+        user_id=user_id,
+        analysis_type="실행전략",
+        input_text=data.input_text,
+        credit_used=1,  # 실행 전략 생성에 필요한 크레딧
+        processing_time=processing_time
+    )
+    
+    return strategy_id
+
 @router.post("/execution", response_model=ExecutionResponse)
 async def create_execution_strategy(
     data: ExecutionRequest,
@@ -55,50 +123,11 @@ async def create_execution_strategy(
         # 실행 전략 생성 시작 시간 기록
         start_time = time.time()
         
-        # 기존 전략이 있는지 확인
-        existing_strategy = db.query(ExecutionStrategy).filter(
-            ExecutionStrategy.analysis_id == data.analysis_id
-        ).first()
-        
         # GPT를 통해 실행 전략 생성
         hook, flow, cta = await generate_execution_strategy(data.input_text)
         logger.info("Execution strategy generated successfully")
         
-        if existing_strategy:
-            # 기존 전략 업데이트
-            existing_strategy.hook = hook
-            existing_strategy.flow = flow
-            existing_strategy.cta = cta
-            strategy_id = existing_strategy.id
-            logger.info(f"Updated existing strategy: {strategy_id}")
-        else:
-            # 새 전략 생성
-            strategy_id = str(uuid4())
-            record = ExecutionStrategy(
-                id=strategy_id,
-                user_id=user_id,
-                analysis_id=data.analysis_id,
-                hook=hook,
-                flow=flow,
-                cta=cta
-            )
-            db.add(record)
-            logger.info(f"Created new strategy: {strategy_id}")
-        
-        db.commit()
-        
-        # 처리 시간 계산
-        processing_time = time.time() - start_time
-        
-        # 분석 로그 기록
-        log_analysis(
-            db=db,
-            user_id=user_id,
-            analysis_type="실행전략",
-            input_text=data.input_text,
-            credit_used=1,  # 실행 전략 생성에 필요한 크레딧
-            processing_time=processing_time
-        )
+        strategy_id = save_execution_strategy(db, user_id, data, hook, flow, cta, start_time)
         
         return ExecutionResponse(
             status="ok",
@@ -116,6 +145,52 @@ async def create_execution_strategy(
             detail=f"Failed to generate execution strategy: {str(e)}"
         )
 
+@router.post("/execution/stream")
+async def stream_execution_strategy_endpoint(
+    data: ExecutionRequest,
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    실행 전략을 Server-Sent Events로 스트리밍합니다.
+    token 이벤트로 토큰을, section 이벤트로 완료된 HOOK/FLOW/CTA 섹션을 바로 전달하고,
+    저장이 끝나면 done 이벤트로 전략 ID를 전달합니다.
+    요청 의존성의 세션은 스트리밍 시작 전에 닫히므로 저장할 때 세션을 따로 엽니다.
+    
+    Args:
+        data: 분석 ID와 입력 텍스트를 포함한 요청 데이터
+        user_id: 현재 사용자 ID
+        
+    Returns:
+        StreamingResponse: text/event-stream 응답
+    """
+    logger.info(f"Starting execution strategy streaming for analysis_id: {data.analysis_id}")
+    start_time = time.time()
+    
+    async def events():
+        async for event in stream_execution_strategy(data.input_text):
+            if event["type"] != "done":
+                yield event
+                continue
+            db_session = get_db()
+            db = next(db_session)
+            try:
+                strategy_id = save_execution_strategy(
+                    db, user_id, data, event["hook"], event["flow"], event["cta"], start_time
+                )
+            finally:
+                db_session.close()
+            yield {
+                "type": "done",
+                "status": "ok",
+                "id": strategy_id,
+                "hook": event["hook"],
+                "flow": event["flow"],
+                "cta": event["cta"],
+                "created_at": datetime.now()
+            }
+    
+    return sse_response(events())
+
 @router.get("/execution/{analysis_id}", response_model=ExecutionResponse)
 async def get_execution_strategy(
     analysis_id: str,
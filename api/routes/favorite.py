@@ -4,7 +4,6 @@ from uuid import uuid4
 from typing import Dict, List, Optional, Any
 from sqlalchemy import desc
 import os
-import glob
 import logging
 
 from api.dependencies.auth import get_current_user_id
@@ -13,7 +12,7 @@ from api.models.favorite import FavoriteAnalysis
 from api.models.history import AnalysisHistory
 from pydantic import BaseModel
 from api.services.exporter import get_latest_html_file
-from api.utils.file_utils import find_latest_pdf_filename, find_latest_html_filename
+from api.utils.file_utils import find_latest_export_filenames
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -31,25 +30,6 @@ class FavoriteListResponse(BaseModel):
 class FavoriteStatusResponse(BaseModel):
     favorited: bool
 
-def find_latest_pdf_filename(analysis_id: str) -> Optional[str]:
-    """
-    주어진 분석 ID에 대한 가장 최근 PDF 파일명을 찾습니다.
-    
-    Args:
-        analysis_id (str): 분석 ID
-        
-    Returns:
-        Optional[str]: 가장 최근 PDF 파일명 또는 None
-    """
-    try:
-        files = glob.glob(f"exported_pdfs/{analysis_id}_*.pdf")
-        if not files:
-            return None
-        return os.path.basename(max(files, key=os.path.getctime))
-    except Exception as e:
-        print(f"PDF 파일명 검색 중 오류: {str(e)}")
-        return None
-
 @router.post("/favorite/{analysis_id}", response_model=Dict[str, str])
 async def toggle_favorite(
     analysis_id: str,
@@ -241,15 +221,15 @@ async def get_favorite_list(
             FavoriteAnalysis.created_at.desc()
         ).offset(skip).limit(limit).all()
         
-        # 파일명 정보를 포함하여 응답 생성
+        # 파일명 정보를 포함하여 응답 생성 (페이지 단위로 한 번에 조회)
+        filenames = find_latest_export_filenames([r.analysis_id for r in records])
         items = [
             {
                 "id": r.analysis_id,
                 "input_text": r.input_text,
                 "result_json": r.result_json,
                 "created_at": r.created_at.isoformat(),
-                "html_filename": find_latest_html_filename(r.analysis_id),
-                "pdf_filename": find_latest_pdf_filename(r.analysis_id)
+                **filenames[r.analysis_id]
             }
             for r in records
         ]
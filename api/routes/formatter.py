@@ -59,7 +59,7 @@ async def format_report(
         logger.info(f"HTML saved to file: {html_filepath}")
         
         # Save PDF
-        pdf_path = save_html_as_pdf(data.analysis_id, html_result)
+        pdf_path = await save_html_as_pdf(data.analysis_id, html_result)
         
         if not pdf_path:
             logger.error(f"PDF 저장 실패: {data.analysis_id}")
@@ -81,4 +81,4 @@ async def format_report(
         raise HTTPException(
             status_code=500,
             detail=f"Report formatting failed: {str(e)}"
-        ) 
\ No newline at end of file
+        )
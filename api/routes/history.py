@@ -1,11 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import desc
+from typing import List, Literal, Optional, Dict, Any
 from uuid import uuid4
 import json
 import os
-import glob
 import logging
 
 from api.dependencies.auth import get_current_user_id
@@ -14,7 +13,14 @@ from api.models.history import AnalysisHistory, StrategyHistory, CrawlHistory, H
 from pydantic import BaseModel
 from api.utils.auth import get_current_user
 from api.services.exporter import get_latest_html_file
-from api.utils.file_utils import find_latest_pdf_filename, find_latest_html_filename
+from api.utils.file_utils import find_latest_export_filenames
+from api.services.history_pagination import (
+    paginate_latest,
+    get_history_count,
+    summary_projection,
+    preview_text,
+    fill_missing_summaries
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -38,33 +44,15 @@ class CrawlSaveRequest(BaseModel):
 class HistoryResponse(BaseModel):
     id: str
     input_text: str
-    result_json: str
+    result_json: Optional[str] = None  # view=summary 목록에서는 생략 (상세 조회 사용)
+    summary: Optional[str] = None
     created_at: str
 
 class HistoryListResponse(BaseModel):
     total_count: int
     items: List[HistoryResponse]
+    next_cursor: Optional[str] = None
 
-def find_latest_pdf_filename(analysis_id: str) -> Optional[str]:
-    """
-    주어진 분석 ID에 대한 가장 최근 PDF 파일명을 찾습니다.
-    
-    Args:
-        analysis_id (str): 분석 ID
-        
-    Returns:
-        Optional[str]: 가장 최근 PDF 파일명 또는 None
-    """
-    try:
-        files = glob.glob(f"exported_pdfs/{analysis_id}_*.pdf")
-        if not files:
-            return None
-        return os.path.basename(max(files, key=os.path.getctime))
-    except Exception as e:
-        print(f"PDF 파일명 검색 중 오류: {str(e)}")
-        return None
-
-# 분석 결과 저장
 @router.post("/analysis")
 async def save_analysis_history(
     data: HistorySaveRequest,
@@ -130,146 +118,225 @@ async def save_crawl_history(
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
-# 분석 이력 조회
-@router.get("/analysis", response_model=List[HistoryResponse])
+# 분석 이력 조회 (view=summary는 요약만, view=full은 result_json 포함)
+@router.get("/analysis", response_model=HistoryListResponse, response_model_exclude_none=True)
 async def get_analysis_history(
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     limit: int = Query(10, ge=1, le=100),
+    view: Literal["summary", "full"] = Query("summary"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     try:
-        # 총 결과 수 조회
-        total_count = (
-            db.query(func.count(AnalysisHistory.id))
-            .filter(AnalysisHistory.user_id == current_user["id"])
-            .scalar()
-        )
+        # 총 결과 수 조회 (사용자별 카운터)
+        total_count = get_history_count(db, AnalysisHistory, current_user["id"])
 
-        # 페이지네이션 적용하여 결과 조회
-        records = (
-            db.query(AnalysisHistory)
-            .filter(AnalysisHistory.user_id == current_user["id"])
-            .order_by(AnalysisHistory.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        # 커서 페이지네이션 적용하여 결과 조회
+        query = db.query(AnalysisHistory).filter(AnalysisHistory.user_id == current_user["id"])
+        if view == "summary":
+            query = summary_projection(query, AnalysisHistory)
+        records, next_cursor = paginate_latest(query, AnalysisHistory, cursor, limit)
+        fill_missing_summaries(db, AnalysisHistory, records)
         
         # 각 기록에 대해 PDF 파일명 추가
+        filenames = find_latest_export_filenames([record.id for record in records])
         for record in records:
-            record.pdf_filename = find_latest_pdf_filename(record.id)
+            record.pdf_filename = filenames[record.id]["pdf_filename"]
         
         return HistoryListResponse(
             total_count=total_count,
             items=[
                 HistoryResponse(
                     id=r.id,
-                    input_text=r.input_text,
-                    result_json=r.result_json,
+                    input_text=preview_text(r.input_text) if view == "summary" else r.input_text,
+                    result_json=r.result_json if view == "full" else None,
+                    summary=r.summary,
                     created_at=r.created_at.isoformat(),
                 )
                 for r in records
-            ]
+            ],
+            next_cursor=next_cursor
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"분석 이력 조회 중 오류가 발생했습니다: {str(e)}"
         )
 
-# 전략 이력 조회
-@router.get("/strategy", response_model=List[HistoryResponse])
+# 분석 이력 상세 조회
+@router.get("/analysis/{history_id}", response_model=HistoryResponse)
+async def get_analysis_history_detail(
+    history_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    record = db.query(AnalysisHistory).filter(
+        AnalysisHistory.id == history_id,
+        AnalysisHistory.user_id == current_user["id"]
+    ).first()
+    if record is None:
+        raise HTTPException(status_code=404, detail="분석 이력을 찾을 수 없습니다")
+    
+    return HistoryResponse(
+        id=record.id,
+        input_text=record.input_text,
+        result_json=record.result_json,
+        summary=record.summary,
+        created_at=record.created_at.isoformat(),
+    )
+
+# 전략 이력 조회 (다음 페이지 커서는 X-Next-Cursor 헤더로 전달)
+@router.get("/strategy", response_model=List[HistoryResponse], response_model_exclude_none=True)
 async def get_strategy_history(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor"),
     limit: int = Query(10, ge=1, le=100),
+    view: Literal["summary", "full"] = Query("summary"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    records = db.query(StrategyHistory)\
-        .filter(StrategyHistory.user_id == current_user["id"])\
-        .order_by(StrategyHistory.created_at.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    query = db.query(StrategyHistory).filter(StrategyHistory.user_id == current_user["id"])
+    if view == "summary":
+        query = summary_projection(query, StrategyHistory, StrategyHistory.strategy_type)
+    records, next_cursor = paginate_latest(query, StrategyHistory, cursor, limit)
+    fill_missing_summaries(db, StrategyHistory, records)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return [
         HistoryResponse(
             id=record.id,
             input_text=f"전략 유형: {record.strategy_type}",
-            result_json=record.result_json,
+            result_json=record.result_json if view == "full" else None,
+            summary=record.summary,
             created_at=record.created_at.isoformat(),
         )
         for record in records
     ]
 
-# 크롤링 이력 조회
-@router.get("/crawl", response_model=List[HistoryResponse])
+# 전략 이력 상세 조회
+@router.get("/strategy/{history_id}", response_model=HistoryResponse)
+async def get_strategy_history_detail(
+    history_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    record = db.query(StrategyHistory).filter(
+        StrategyHistory.id == history_id,
+        StrategyHistory.user_id == current_user["id"]
+    ).first()
+    if record is None:
+        raise HTTPException(status_code=404, detail="전략 이력을 찾을 수 없습니다")
+    
+    return HistoryResponse(
+        id=record.id,
+        input_text=f"전략 유형: {record.strategy_type}",
+        result_json=record.result_json,
+        summary=record.summary,
+        created_at=record.created_at.isoformat(),
+    )
+
+# 크롤링 이력 조회 (다음 페이지 커서는 X-Next-Cursor 헤더로 전달)
+@router.get("/crawl", response_model=List[HistoryResponse], response_model_exclude_none=True)
 async def get_crawl_history(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor"),
     limit: int = Query(10, ge=1, le=100),
+    view: Literal["summary", "full"] = Query("summary"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    records = db.query(CrawlHistory)\
-        .filter(CrawlHistory.user_id == current_user["id"])\
-        .order_by(CrawlHistory.created_at.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    query = db.query(CrawlHistory).filter(CrawlHistory.user_id == current_user["id"])
+    if view == "summary":
+        query = summary_projection(query, CrawlHistory, CrawlHistory.channels)
+    records, next_cursor = paginate_latest(query, CrawlHistory, cursor, limit)
+    fill_missing_summaries(db, CrawlHistory, records)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return [
         HistoryResponse(
             id=record.id,
-            input_text=f"{record.input_text} ({json.loads(record.channels)})",
-            result_json=record.result_json,
+            input_text=f"{preview_text(record.input_text) if view == 'summary' else record.input_text} ({json.loads(record.channels)})",
+            result_json=record.result_json if view == "full" else None,
+            summary=record.summary,
             created_at=record.created_at.isoformat(),
         )
         for record in records
     ]
 
+# 크롤링 이력 상세 조회
+@router.get("/crawl/{history_id}", response_model=HistoryResponse)
+async def get_crawl_history_detail(
+    history_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    record = db.query(CrawlHistory).filter(
+        CrawlHistory.id == history_id,
+        CrawlHistory.user_id == current_user["id"]
+    ).first()
+    if record is None:
+        raise HTTPException(status_code=404, detail="크롤링 이력을 찾을 수 없습니다")
+    
+    return HistoryResponse(
+        id=record.id,
+        input_text=f"{record.input_text} ({json.loads(record.channels)})",
+        result_json=record.result_json,
+        summary=record.summary,
+        created_at=record.created_at.isoformat(),
+    )
+
 @router.get("/history")
 async def get_history_list(
-    skip: int = 0,
-    limit: int = 10,
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=100),
+    view: Literal["summary", "full"] = Query("summary"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """
-    사용자의 분석 이력을 조회합니다.
+    사용자의 분석 이력을 최신순으로 조회합니다.
+    다음 페이지는 응답의 next_cursor를 cursor로 넘겨 조회합니다.
+    view=summary(기본값)는 result_json을 읽지 않으며, 전체 결과는 view=full이나 상세 조회로 가져옵니다.
+    History 모델은 이력 카운터(HistoryCounter)와 (user_id, created_at, id) 인덱스 대상이 아니므로
+    total_count는 요청마다 COUNT(*)로 계산합니다.
     """
     try:
-        # 전체 레코드 수 조회
-        total_count = db.query(History).filter(
-            History.user_id == current_user.id
-        ).count()
+        # 전체 레코드 수 조회 (카운터 미등록 모델이라 COUNT(*))
+        total_count = get_history_count(db, History, current_user.id)
         
-        # 페이지네이션된 레코드 조회
-        records = db.query(History).filter(
-            History.user_id == current_user.id
-        ).order_by(
-            History.created_at.desc()
-        ).offset(skip).limit(limit).all()
+        # 커서 페이지네이션된 레코드 조회
+        query = db.query(History).filter(History.user_id == current_user.id)
+        if view == "summary":
+            query = query.options(defer(History.result_json))
+        records, next_cursor = paginate_latest(query, History, cursor, limit)
         
-        # 파일명 정보를 포함하여 응답 생성
-        items = [
-            {
+        # 파일명 정보를 포함하여 응답 생성 (페이지 단위로 한 번에 조회)
+        filenames = find_latest_export_filenames([r.id for r in records])
+        items = []
+        for r in records:
+            item = {
                 "id": r.id,
-                "input_text": r.input_text,
-                "result_json": r.result_json,
+                "input_text": preview_text(r.input_text) if view == "summary" else r.input_text,
                 "created_at": r.created_at.isoformat(),
-                "html_filename": find_latest_html_filename(r.id),
-                "pdf_filename": find_latest_pdf_filename(r.id)
+                **filenames[r.id]
             }
-            for r in records
-        ]
+            if view == "full":
+                item["result_json"] = r.result_json
+            items.append(item)
         
         logger.info(f"이력 조회 완료: {len(items)}개 항목")
         return {
             "total_count": total_count,
-            "items": items
+            "items": items,
+            "next_cursor": next_cursor
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"이력 조회 중 오류 발생: {str(e)}")
         raise HTTPException(
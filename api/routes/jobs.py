@@ -0,0 +1,110 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+import os
+import logging
+from typing import Any, Dict
+from pydantic import BaseModel
+from api.dependencies.auth import get_current_user_id
+from api.services.job_queue import job_queue
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+class FormatJobRequest(BaseModel):
+    analysis_id: str
+    strategy: Dict[str, Any]
+    analysis: Dict[str, Any]
+    copy: Dict[str, Any]
+
+def _get_user_job(job_id: str, user_id: str) -> Dict[str, Any]:
+    job = job_queue.get(job_id)
+    if job is None or job["user_id"] != user_id:
+        raise HTTPException(
+            status_code=404,
+            detail="작업이 존재하지 않습니다."
+        )
+    return job
+
+@router.get("/jobs/{job_id}")
+async def get_job_status(
+    job_id: str,
+    user_id: str = Depends(get_current_user_id)
+) -> Dict[str, Any]:
+    """
+    백그라운드 작업의 상태와 결과를 조회합니다.
+    
+    Args:
+        job_id: 작업 ID
+        user_id: 현재 사용자 ID
+        
+    Returns:
+        Dict[str, Any]: 작업 상태
+            - status: queued / running / succeeded / failed
+            - attempts / max_attempts: 시도 횟수
+            - result: 성공 시 작업 결과 (파일 결과는 /jobs/{job_id}/download로 다운로드)
+            - error: 마지막 오류 메시지
+    """
+    job = _get_user_job(job_id, user_id)
+    job.pop("worker", None)
+    return job
+
+@router.get("/jobs/{job_id}/download")
+async def download_job_result(
+    job_id: str,
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    파일을 결과로 만드는 작업(즐겨찾기 ZIP 등)의 결과 파일을 다운로드합니다.
+    
+    Args:
+        job_id: 작업 ID
+        user_id: 현재 사용자 ID
+        
+    Returns:
+        FileResponse: 결과 파일
+        
+    Raises:
+        HTTPException: 작업이 없거나, 아직 끝나지 않았거나, 파일 결과가 없는 경우
+    """
+    job = _get_user_job(job_id, user_id)
+    if job["status"] != "succeeded":
+        raise HTTPException(
+            status_code=409,
+            detail=f"작업이 완료되지 않았습니다 (상태: {job['status']})."
+        )
+    
+    result = job["result"] or {}
+    file_path = result.get("file_path")
+    if not file_path or not os.path.exists(file_path):
+        logger.warning(f"Job result file not found: {job_id}")
+        raise HTTPException(
+            status_code=404,
+            detail="결과 파일을 찾을 수 없습니다."
+        )
+    
+    return FileResponse(
+        path=file_path,
+        filename=result.get("filename", os.path.basename(file_path)),
+        media_type=result.get("media_type", "application/octet-stream")
+    )
+
+@router.post("/format/jobs", status_code=202)
+async def enqueue_format_report(
+    data: FormatJobRequest,
+    user_id: str = Depends(get_current_user_id)
+) -> Dict[str, Any]:
+    """
+    HTML/PDF 리포트 포맷팅을 작업 워커에 맡깁니다.
+    
+    Args:
+        data: analysis_id, strategy, analysis, copy
+        user_id: 현재 사용자 ID (작업 소유자)
+        
+    Returns:
+        Dict[str, Any]: /jobs/{job_id}로 조회할 작업 ID
+    """
+    job_id = job_queue.enqueue("format_report", data.dict(), user_id=user_id)
+    logger.info(f"Queued report formatting for analysis_id {data.analysis_id}: job {job_id}")
+    return {"job_id": job_id, "status": "queued"}
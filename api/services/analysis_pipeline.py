@@ -0,0 +1,81 @@
+"""
+Analysis pipeline (analysis → strategy → copy → report) shared by API endpoints and job workers
+"""
+
+from functools import partial
+from typing import Dict
+
+from api.services.analyzer_claude import Analyzer
+from api.services.strategist import Strategist
+from api.services.copywriter import Copywriter
+from api.services.formatter_claude import Formatter
+from api.services.llm_clients import llm_clients
+from api.services.pipeline import Pipeline
+
+# Initialize services
+analyzer = Analyzer()
+strategist = Strategist()
+copywriter = Copywriter()
+formatter = Formatter()
+
+def build_analysis_pipeline(name: str, input_text: str, variant_count: int = 1) -> Pipeline:
+    """
+    분석 → 전략 → 카피 → 리포트 파이프라인을 구성합니다.
+    여러 변형을 만들 때는 분석/전략을 한 번만 실행해 공유하고 카피와 리포트만 변형별로 동시에 생성합니다.
+    (크롤링 결과는 어느 단계에서도 쓰지 않으므로 크롤링 단계는 두지 않음)
+
+    Args:
+        name (str): 로그에 표시할 파이프라인 이름
+        input_text (str): 분석할 입력 텍스트
+        variant_count (int): 생성할 카피 변형 수
+
+    Returns:
+        Pipeline: 실행 준비된 파이프라인
+            (결과 키: analysis_call, analysis, strategy, copy, report / 변형이 여러 개면 copy_1, report_1, ...
+             analysis_call은 분석 응답 원본으로 prompt_meta(패킹 토큰 수, max_tokens 등)를 담음)
+    """
+    pipeline = (
+        Pipeline(name)
+        .stage("analysis_call", lambda: analyzer.analyze_texts([input_text]))
+        .stage("analysis", lambda analysis_call: analysis_call["content"], depends_on=["analysis_call"])
+        .stage("strategy", lambda analysis: strategist.generate_strategy(analysis), depends_on=["analysis"])
+    )
+    for variant in range(1, variant_count + 1):
+        suffix = "" if variant_count == 1 else f"_{variant}"
+        add_variant_stages(pipeline, f"copy{suffix}", f"report{suffix}", bypass_cache=variant_count > 1)
+    return pipeline
+
+def add_variant_stages(pipeline: Pipeline, copy_stage: str, report_stage: str, bypass_cache: bool = False) -> None:
+    """
+    카피/리포트 생성 단계를 추가합니다. 동기 SDK 호출은 제공자별 동시 요청 제한 안에서 스레드로 실행됩니다.
+
+    Args:
+        pipeline (Pipeline): 단계를 추가할 파이프라인
+        copy_stage (str): 카피 단계 이름
+        report_stage (str): 리포트 단계 이름
+        bypass_cache (bool): 카피를 캐시 없이 새로 생성할지 여부 (변형마다 다른 카피가 필요할 때)
+    """
+    pipeline.stage(
+        copy_stage,
+        lambda strategy, analysis: llm_clients.run_sync(
+            "openai", partial(copywriter.generate_copy, bypass_cache=bypass_cache), strategy, analysis
+        ),
+        depends_on=["strategy", "analysis"]
+    )
+    pipeline.stage(
+        report_stage,
+        lambda strategy: llm_clients.run_sync("anthropic", render_report, strategy),
+        depends_on=["strategy"]
+    )
+
+def render_report(strategy: Dict) -> Dict[str, str]:
+    """
+    전략을 HTML 리포트로 만듭니다 (Formatter는 전략만 입력으로 받음).
+
+    Args:
+        strategy (Dict): 마케팅 전략
+
+    Returns:
+        Dict[str, str]: html(완성된 HTML 문서)
+    """
+    return {"html": formatter.generate_html(strategy)}
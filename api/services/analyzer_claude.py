@@ -2,20 +2,108 @@
 Sentiment and Desire Analysis Service using Claude
 """
 
+import asyncio
 import json
 import os
-from typing import Dict, List, Optional
+import re
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
 import logging
 
 from anthropic import Anthropic
 from dotenv import load_dotenv
 from fastapi import HTTPException
 from api.services.claude_caller import ClaudeCaller
+from api.services.llm_router import llm_router
+from api.utils.prompt_packer import pack_prompt, chunk_texts
+from api.utils.token_counter import estimate_tokens
 
 load_dotenv()
 
 logger = logging.getLogger("uvicorn.access")
 
+ANALYSIS_PROMPT_TEMPLATE = """
+다음 텍스트를 분석해주세요:
+{content}
+
+분석 결과는 다음 형식으로 제공해주세요:
+1. 주요 키워드
+2. 감성 분석
+3. 주요 주제
+4. 인사이트
+"""
+
+BATCH_ANALYSIS_PROMPT_TEMPLATE = """
+다음은 고객 리뷰/게시물 묶음입니다 (빈 줄로 구분):
+{content}
+
+묶음 전체를 분석해 아래 JSON 형식으로만 답해주세요.
+텍스트마다 결과를 만들지 말고, sentiments에는 묶음을 대표하는 근거 문장만 최대 10개,
+desires와 key_phrases는 각각 최대 10개까지 적어주세요:
+{"sentiments": [{"text": "근거 문장", "sentiment": "positive|neutral|negative"}],
+ "desires": ["드러난 욕구"],
+ "key_phrases": ["핵심 표현"],
+ "overall_sentiment": "positive|neutral|negative"}
+"""
+
+# 배치 분석: 호출당 입력 토큰 예산과 작업당 동시 Claude 호출 수
+BATCH_CHUNK_TOKEN_BUDGET = int(os.getenv("BATCH_CHUNK_TOKEN_BUDGET", "6000"))
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+# 배치 분석 응답 토큰 예산 (근거 문장/목록 개수를 제한한 JSON 응답 기준, 입력 크기와 무관)
+BATCH_CHUNK_MAX_TOKENS = int(os.getenv("BATCH_CHUNK_MAX_TOKENS", "4096"))
+
+_JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+def empty_analysis() -> Dict[str, Any]:
+    """배치 분석 결과를 합칠 빈 결과를 만듭니다."""
+    return {
+        "sentiments": [],
+        "desires": [],
+        "key_phrases": [],
+        "overall_sentiment": "neutral",
+        "sentiment_counts": {}
+    }
+
+def merge_analysis(combined: Dict[str, Any], analysis: Dict[str, Any], text_count: int) -> Dict[str, Any]:
+    """
+    묶음 분석 결과를 누적 결과에 합칩니다.
+    욕구/핵심 표현은 중복 없이 순서대로 추가하고, 전체 감성은 묶음별 감성을 텍스트 수로 가중해 다수결로 정합니다.
+
+    Args:
+        combined (Dict[str, Any]): 누적 결과 (empty_analysis()로 생성)
+        analysis (Dict[str, Any]): 묶음 분석 결과
+        text_count (int): 묶음에 포함된 텍스트 수
+
+    Returns:
+        Dict[str, Any]: 갱신된 누적 결과
+    """
+    combined["sentiments"].extend(analysis.get("sentiments", []))
+    for field in ("desires", "key_phrases"):
+        seen = set(combined[field])
+        for item in analysis.get(field, []):
+            if item not in seen:
+                seen.add(item)
+                combined[field].append(item)
+
+    counts = Counter(combined["sentiment_counts"])
+    counts[analysis.get("overall_sentiment", "neutral")] += text_count
+    combined["sentiment_counts"] = dict(counts)
+    combined["overall_sentiment"] = counts.most_common(1)[0][0]
+    return combined
+
+def _parse_analysis_json(content: str) -> Dict[str, Any]:
+    """Claude 응답에서 JSON 객체를 꺼내 필드 형식을 맞춥니다."""
+    match = _JSON_OBJECT_PATTERN.search(content)
+    if not match:
+        raise ValueError("분석 응답에 JSON 객체가 없습니다")
+    data = json.loads(match.group(0))
+    return {
+        "sentiments": [item for item in data.get("sentiments", []) if item],
+        "desires": [str(item) for item in data.get("desires", []) if item],
+        "key_phrases": [str(item) for item in data.get("key_phrases", []) if item],
+        "overall_sentiment": data.get("overall_sentiment") or "neutral"
+    }
+
 class Analyzer:
     def __init__(self):
         self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
@@ -31,24 +119,38 @@ class Analyzer:
     async def analyze_text(self, text: str) -> Dict:
         """
         입력 텍스트를 Claude를 사용하여 분석합니다.
+        분석 결과만 반환하므로 prompt_meta가 필요하면 analyze_texts를 사용합니다.
+        """
+        result = await self.analyze_texts([text])
+        return result["content"]
+
+    async def analyze_texts(self, texts: List[str]) -> Dict:
+        """
+        여러 텍스트를 입력 토큰 예산에 맞게 하나의 프롬프트로 합쳐 Claude로 분석합니다.
+
+        Args:
+            texts (List[str]): 분석할 텍스트 (우선순위 순)
+
+        Returns:
+            Dict: content(분석 결과)와 prompt_meta(패킹 토큰 수, max_tokens 등)
         """
         try:
-            logger.info(f"[ANALYZER] 텍스트 분석 시작: 길이={len(text)}")
+            logger.info(f"[ANALYZER] 텍스트 분석 시작: {len(texts)}개, 길이={sum(len(text) for text in texts)}")
             
-            prompt = f"""
-            다음 텍스트를 분석해주세요:
-            {text}
-            
-            분석 결과는 다음 형식으로 제공해주세요:
-            1. 주요 키워드
-            2. 감성 분석
-            3. 주요 주제
-            4. 인사이트
-            """
+            packed = pack_prompt(ANALYSIS_PROMPT_TEMPLATE, texts)
+            prompt = packed.pop("prompt")
+            logger.info(
+                f"[ANALYZER] 프롬프트 패킹: {packed['packed_tokens']}토큰 "
+                f"({packed['included_count']}/{packed['total_count']}개 포함, {packed['trimmed_count']}개 축약), "
+                f"max_tokens={packed['max_tokens']}"
+            )
             
-            response = await self.claude.call(
+            # Claude가 늦거나 실패하면 GPT로 헤지/대체 요청
+            response = await llm_router.call(
                 prompt=prompt,
-                system="You are an expert text analyzer."
+                system="You are an expert text analyzer.",
+                max_tokens=packed["max_tokens"],
+                primary="anthropic"
             )
             
             if not response or "content" not in response:
@@ -56,42 +158,91 @@ class Analyzer:
                 raise Exception("Claude 응답 형식 오류")
             
             logger.info(f"[ANALYZER] 텍스트 분석 완료")
-            return response["content"]
+            return {
+                "content": response["content"],
+                "prompt_meta": packed
+            }
             
         except Exception as e:
-            logger.error(f"[ANALYZER ERROR] 입력값={text}, 에러={str(e)}", exc_info=True)
+            logger.error(f"[ANALYZER ERROR] 입력값={texts}, 에러={str(e)}", exc_info=True)
             raise HTTPException(
                 status_code=500,
                 detail="텍스트 분석 중 오류가 발생했습니다"
             )
             
-    def analyze_multiple_texts(self, texts: List[str]) -> Dict:
+    async def analyze_chunk(self, texts: List[str]) -> Dict[str, Any]:
         """
-        Analyze multiple texts and combine the results
-        
+        텍스트 묶음 하나를 Claude로 분석해 구조화된 결과로 반환합니다.
+
         Args:
-            texts: List of texts to analyze
-            
+            texts (List[str]): 토큰 예산에 맞춘 텍스트 묶음
+
         Returns:
-            Dictionary containing combined analysis results
+            Dict[str, Any]: sentiments, desires, key_phrases, overall_sentiment
         """
-        all_analyses = []
-        
-        for text in texts:
-            analysis = self.analyze_text(text)
-            all_analyses.append(analysis)
-            
-        # Combine analyses (implement your combination logic here)
-        combined_analysis = {
-            "sentiments": [],
-            "desires": [],
-            "key_phrases": [],
-            "overall_sentiment": "neutral"
-        }
-        
-        for analysis in all_analyses:
-            combined_analysis["sentiments"].extend(analysis.get("sentiments", []))
-            combined_analysis["desires"].extend(analysis.get("desires", []))
-            combined_analysis["key_phrases"].extend(analysis.get("key_phrases", []))
-            
-        return combined_analysis 
\ No newline at end of file
+        # 묶음은 이미 예산에 맞춰져 있으므로 지시문 토큰만큼 예산을 더해 잘리지 않게 함
+        packed = pack_prompt(
+            BATCH_ANALYSIS_PROMPT_TEMPLATE,
+            texts,
+            input_budget=BATCH_CHUNK_TOKEN_BUDGET + estimate_tokens(BATCH_ANALYSIS_PROMPT_TEMPLATE),
+            max_tokens=BATCH_CHUNK_MAX_TOKENS
+        )
+        response = await llm_router.call(
+            prompt=packed["prompt"],
+            system="You are an expert text analyzer. Respond with JSON only.",
+            max_tokens=packed["max_tokens"],
+            primary="anthropic"
+        )
+        return _parse_analysis_json(response["content"])
+
+    async def analyze_multiple_texts(
+        self,
+        texts: List[str],
+        on_progress: Optional[Callable[[Dict[str, Any], int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 텍스트를 토큰 예산 단위 묶음으로 나눠 동시에 분석하고 결과를 합칩니다.
+        동시 호출 수는 BATCH_MAX_CONCURRENCY로 제한하며(제공자 전체 한도는 llm_clients가 관리),
+        묶음이 끝날 때마다 결과를 누적합니다.
+
+        Args:
+            texts (List[str]): 분석할 텍스트
+            on_progress (Optional[Callable]): 묶음 완료마다 (누적 결과, 완료 묶음 수, 전체 묶음 수)로 호출
+
+        Returns:
+            Dict[str, Any]: 합친 분석 결과 (failed_chunks 포함)
+
+        Raises:
+            HTTPException: 모든 묶음 분석이 실패한 경우
+        """
+        chunks = chunk_texts([text for text in texts if text and text.strip()], BATCH_CHUNK_TOKEN_BUDGET)
+        semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+        logger.info(f"[ANALYZER] 배치 분석 시작: {len(texts)}개 텍스트, {len(chunks)}개 묶음")
+
+        async def run_chunk(chunk: List[str]):
+            async with semaphore:
+                return chunk, await self.analyze_chunk(chunk)
+
+        combined = empty_analysis()
+        combined["failed_chunks"] = 0
+        completed = 0
+        if on_progress:
+            on_progress(combined, completed, len(chunks))
+        for future in asyncio.as_completed([run_chunk(chunk) for chunk in chunks]):
+            try:
+                chunk, analysis = await future
+                merge_analysis(combined, analysis, len(chunk))
+            except Exception as e:
+                combined["failed_chunks"] += 1
+                logger.error(f"[ANALYZER ERROR] 배치 묶음 분석 실패: {str(e)}")
+            completed += 1
+            if on_progress:
+                on_progress(combined, completed, len(chunks))
+
+        if chunks and combined["failed_chunks"] == len(chunks):
+            raise HTTPException(
+                status_code=500,
+                detail="텍스트 분석 중 오류가 발생했습니다"
+            )
+        logger.info(f"[ANALYZER] 배치 분석 완료: 실패 묶음 {combined['failed_chunks']}/{len(chunks)}개")
+        return combined
@@ -0,0 +1,130 @@
+"""
+Background batch analysis jobs with progress tracking
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from .job_queue import job_queue
+
+logger = logging.getLogger(__name__)
+
+# 배치 작업당 최대 텍스트 수
+BATCH_MAX_TEXTS = int(os.getenv("BATCH_MAX_TEXTS", "5000"))
+
+BATCH_JOB_TYPE = "batch_analysis"
+
+# 작업 큐 상태 → 배치 API 상태
+_STATUS_NAMES = {"queued": "queued", "running": "running", "succeeded": "completed", "failed": "failed"}
+
+def parse_jsonl_texts(content: bytes) -> List[str]:
+    """
+    JSONL 업로드에서 분석할 텍스트를 읽습니다.
+    각 줄은 JSON 문자열이거나 text(또는 content) 필드를 가진 객체입니다.
+
+    Args:
+        content (bytes): 업로드 파일 내용 (UTF-8)
+
+    Returns:
+        List[str]: 텍스트 목록
+
+    Raises:
+        ValueError: JSON 형식이 잘못되었거나 텍스트가 없는 줄이 있는 경우
+    """
+    texts = []
+    for line_number, line in enumerate(content.decode("utf-8-sig").splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{line_number}번째 줄이 올바른 JSON이 아닙니다: {str(e)}")
+        text = item.get("text") or item.get("content") if isinstance(item, dict) else item
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError(f"{line_number}번째 줄에 분석할 텍스트가 없습니다")
+        texts.append(text)
+    return texts
+
+def build_batch_progress(text_count: int, combined: Dict[str, Any], completed: int, total: int) -> Dict[str, Any]:
+    """
+    작업 큐에 저장할 배치 분석 진행 상황을 만듭니다.
+
+    Args:
+        text_count (int): 전체 텍스트 수
+        combined (Dict[str, Any]): 현재까지 합친 분석 결과
+        completed (int): 완료된 묶음 수
+        total (int): 전체 묶음 수
+
+    Returns:
+        Dict[str, Any]: 진행률 필드와 합친 분석 결과
+    """
+    return {
+        "total_texts": text_count,
+        "total_chunks": total,
+        "completed_chunks": completed,
+        "failed_chunks": combined["failed_chunks"],
+        "analysis": combined
+    }
+
+class BatchAnalysisManager:
+    def __init__(self, queue=job_queue):
+        """
+        배치 분석 작업을 작업 큐에 등록하고 진행 상황을 조회하는 관리자를 초기화합니다.
+        작업은 공유 작업 큐(SQLite)에 저장되므로 어느 웹 워커에서든 조회할 수 있고 재시작 후에도 유지됩니다.
+
+        Args:
+            queue (JobQueue): 작업 큐
+        """
+        self.queue = queue
+
+    def submit(self, texts: List[str], user_id: str) -> Dict[str, Any]:
+        """
+        배치 분석 작업을 작업 큐에 등록합니다. 작업 워커가 가져가 실행합니다.
+
+        Args:
+            texts (List[str]): 분석할 텍스트
+            user_id (str): 요청 사용자 ID
+
+        Returns:
+            Dict[str, Any]: 등록된 작업 상태
+        """
+        job_id = self.queue.enqueue(BATCH_JOB_TYPE, {"texts": texts}, user_id=user_id)
+        logger.info(f"[BATCH] 작업 등록: job_id={job_id}, 텍스트 {len(texts)}개")
+        return self.get_job(job_id)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태와 진행률, 현재까지 합쳐진 결과를 반환합니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 상태 또는 None (없거나 보관 기간이 지난 경우)
+        """
+        job = self.queue.get(job_id)
+        if job is None or job["job_type"] != BATCH_JOB_TYPE:
+            return None
+        progress = job["result"] or {}
+        total = progress.get("total_chunks", 0)
+        completed = progress.get("completed_chunks", 0)
+        return {
+            "job_id": job_id,
+            "user_id": job["user_id"],
+            "status": _STATUS_NAMES[job["status"]],
+            "total_texts": progress.get("total_texts"),
+            "total_chunks": total,
+            "completed_chunks": completed,
+            "failed_chunks": progress.get("failed_chunks", 0),
+            "progress_percent": round(completed / total * 100, 1) if total else 0,
+            "result": progress.get("analysis"),
+            "error": job["error"] if job["status"] == "failed" else None,
+            "attempts": job["attempts"],
+            "created_at": job["created_at"],
+            "finished_at": job["finished_at"]
+        }
+
+# 전역 BatchAnalysisManager 인스턴스 생성
+batch_analysis_manager = BatchAnalysisManager()
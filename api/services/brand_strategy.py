@@ -10,6 +10,7 @@ import os
 from typing import Dict, Optional
 from openai import OpenAI
 from dotenv import load_dotenv
+from .llm_cache import llm_response_cache, llm_cache_key, LLM_CACHE_TTL
 
 load_dotenv()
 
@@ -67,18 +68,23 @@ class BrandStrategyGenerator:
         """
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a brand strategy expert."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
+            system = "You are a brand strategy expert."
+            content = llm_response_cache.get_or_call_sync(
+                llm_cache_key("brand_strategy", "gpt-4", system, prompt, 0.7, 500),
+                lambda: self.client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[
+                        {"role": "system", "content": system},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=500
+                ).choices[0].message.content,
+                LLM_CACHE_TTL["brand_strategy"]
             )
             
             # Parse the response
-            result = json.loads(response.choices[0].message.content)
+            result = json.loads(content)
             return result
             
         except Exception as e:
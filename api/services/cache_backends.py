@@ -0,0 +1,272 @@
+"""
+Cache storage backends for CacheManager
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+class CacheBackend(ABC):
+    """
+    캐시 저장소 인터페이스 (Redis와 같은 get/set/delete 형태).
+    각 항목은 저장 시각과 만료 시각을 함께 보관합니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        만료되지 않은 항목을 조회합니다.
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            Optional[Tuple[Any, float]]: (값, 저장 시각) 또는 None
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """
+        항목을 저장합니다.
+
+        Args:
+            key (str): 캐시 키
+            value (Any): 저장할 값
+            ttl_seconds (float): 만료까지 남은 시간 (초 단위)
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """항목을 삭제합니다."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """
+        만료된 항목을 정리합니다.
+
+        Returns:
+            int: 정리된 항목 수
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """
+        저장소 상태를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 항목 수, 사용 바이트, 제거 횟수 등
+        """
+        pass
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 64 * 1024 * 1024):
+        """
+        프로세스 내 LRU 캐시 저장소를 초기화합니다.
+
+        Args:
+            max_entries (int): 최대 항목 수
+            max_bytes (int): 최대 사용 바이트 (직렬화 크기 기준)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (value, stored_at, expires_at, size)
+        self._store: "OrderedDict[str, Tuple[Any, float, float, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _remove(self, key: str) -> None:
+        _, _, _, size = self._store.pop(key)
+        self._total_bytes -= size
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            item = self._store.get(key)
+            if item is None:
+                return None
+            value, stored_at, expires_at, _ = item
+            if time.time() > expires_at:
+                self._remove(key)
+                return None
+            self._store.move_to_end(key)
+            return value, stored_at
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            if key in self._store:
+                self._remove(key)
+            self._store[key] = (value, now, now + ttl_seconds, size)
+            self._total_bytes += size
+            # LRU 순서대로 한도를 넘는 항목 제거
+            while len(self._store) > self.max_entries or self._total_bytes > self.max_bytes:
+                oldest_key = next(iter(self._store))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._store:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+            self._total_bytes = 0
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired_keys = [key for key, item in self._store.items() if now > item[2]]
+            for key in expired_keys:
+                self._remove(key)
+        return len(expired_keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._store),
+                "bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions
+            }
+
+class SqliteCacheBackend(CacheBackend):
+    def __init__(self, path: str, max_entries: int = 10000, max_bytes: int = 256 * 1024 * 1024):
+        """
+        SQLite 파일 기반 LRU 캐시 저장소를 초기화합니다.
+        같은 파일을 가리키는 여러 uvicorn 워커가 캐시를 공유할 수 있습니다.
+
+        Args:
+            path (str): SQLite 파일 경로
+            max_entries (int): 최대 항목 수
+            max_bytes (int): 최대 사용 바이트 (직렬화 크기 기준)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._evictions = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache_entries (last_access)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires_at ON cache_entries (expires_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, stored_at, expires_at FROM cache_entries WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, stored_at, expires_at = row
+            if now > expires_at:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE cache_entries SET last_access = ? WHERE key = ?", (now, key))
+        return pickle.loads(value), stored_at
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, size, stored_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now + ttl_seconds, now)
+            )
+            self._evict(conn)
+            conn.execute("COMMIT")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """항목 수/바이트 한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다."""
+        count, total_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        if count <= self.max_entries and total_bytes <= self.max_bytes:
+            return
+        rows = conn.execute("SELECT key, size FROM cache_entries ORDER BY last_access ASC").fetchall()
+        evicted_keys = []
+        for key, size in rows:
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            evicted_keys.append((key,))
+            count -= 1
+            total_bytes -= size
+        conn.executemany("DELETE FROM cache_entries WHERE key = ?", evicted_keys)
+        self._evictions += len(evicted_keys)
+
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache_entries")
+
+    def purge_expired(self) -> int:
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (time.time(),))
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._connect() as conn:
+            count, total_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()
+        return {
+            "backend": "sqlite",
+            "path": self.path,
+            "entries": count,
+            "bytes": total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": self._evictions
+        }
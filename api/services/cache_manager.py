@@ -1,112 +1,229 @@
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Awaitable, Callable, Optional, Tuple
+import asyncio
 import hashlib
-import json
+import logging
+import os
 import time
-from datetime import datetime, timedelta
+from .cache_backends import CacheBackend, MemoryCacheBackend, SqliteCacheBackend
+
+logger = logging.getLogger(__name__)
+
+# 캐시 저장소 설정 (memory: 워커별 메모리, sqlite: 워커 간 공유 파일)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+CACHE_SQLITE_PATH = os.getenv("CACHE_SQLITE_PATH", "cache/crawl_cache.sqlite3")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1000"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+CACHE_SWEEP_INTERVAL = float(os.getenv("CACHE_SWEEP_INTERVAL", "60"))
+# 하드 TTL: soft TTL(ttl_seconds)이 지난 항목을 stale 상태로 제공할 수 있는 최대 시간 (초)
+CACHE_HARD_TTL = int(os.getenv("CACHE_HARD_TTL", "3600"))
+
+def create_backend() -> CacheBackend:
+    """
+    환경 변수 설정에 맞는 캐시 저장소를 생성합니다.
+
+    Returns:
+        CacheBackend: 캐시 저장소
+    """
+    if CACHE_BACKEND == "sqlite":
+        return SqliteCacheBackend(CACHE_SQLITE_PATH, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES)
+    return MemoryCacheBackend(max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES)
 
 class CacheManager:
-    def __init__(self, ttl_seconds: int = 600):
+    def __init__(
+        self,
+        ttl_seconds: int = 600,
+        backend: Optional[CacheBackend] = None,
+        hard_ttl_seconds: int = CACHE_HARD_TTL
+    ):
         """
         캐시 매니저를 초기화합니다.
-        
+
         Args:
-            ttl_seconds (int): 캐시 유효 시간 (초 단위, 기본값: 600초 = 10분)
+            ttl_seconds (int): 캐시 유효 시간 (soft TTL, 초 단위, 기본값: 600초 = 10분)
+            backend (Optional[CacheBackend]): 캐시 저장소 (기본값: 환경 변수 설정)
+            hard_ttl_seconds (int): stale 항목을 제공할 수 있는 최대 시간 (hard TTL, 초 단위)
         """
-        self._cache_store: Dict[str, Tuple[Any, float]] = {}
+        self.backend = backend if backend is not None else create_backend()
         self.ttl_seconds = ttl_seconds
-        self._default_ttl = timedelta(hours=24)  # Default cache duration: 24 hours
+        self.hard_ttl_seconds = max(hard_ttl_seconds, ttl_seconds)
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._expired_purged = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._sweeper_task: Optional[asyncio.Task] = None
 
     def generate_key(self, input_text: str, channels: list[str]) -> str:
         """
         입력 텍스트와 채널 목록으로 캐시 키를 생성합니다.
-        
+
         Args:
             input_text (str): 검색어
             channels (list[str]): 채널 목록
-            
+
         Returns:
             str: 생성된 캐시 키
         """
         # 입력값 정규화
         normalized_input = input_text.strip().lower()
         normalized_channels = sorted([ch.strip().lower() for ch in channels])
-        
+
         # 키 생성용 문자열 조합
         key_string = f"{normalized_input}:{':'.join(normalized_channels)}"
-        
+
         # SHA-256 해시 생성
         return hashlib.sha256(key_string.encode()).hexdigest()
 
     def get(self, key: str) -> Optional[Any]:
         """
         캐시에서 값을 조회합니다.
-        
+
         Args:
             key (str): 캐시 키
-            
+
         Returns:
             Optional[Any]: 캐시된 값 또는 None
         """
-        item = self._cache_store.get(key)
-        if not item:
+        item = self.backend.get(key)
+        if item is None or time.time() - item[1] > self.ttl_seconds:
+            self._misses += 1
+            logger.debug(f"[CACHE] 캐시 미스: key={key}")
             return None
-            
-        value, timestamp = item
-        current_time = time.time()
-        
-        # TTL 체크
-        if current_time - timestamp > self.ttl_seconds:
-            print(f"[CACHE] 캐시 만료: key={key}")
-            del self._cache_store[key]  # 만료된 항목 제거
-            return None
-            
-        print(f"[CACHE] 캐시 히트: key={key}")
+
+        self._hits += 1
+        logger.debug(f"[CACHE] 캐시 히트: key={key}")
+        value, _ = item
         return value
 
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float, bool]]:
+        """
+        hard TTL 이내의 항목을 stale 여부와 함께 조회합니다 (stale-while-revalidate 용).
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            Optional[Tuple[Any, float, bool]]: (캐시된 값, 저장 후 경과 시간(초), stale 여부) 또는 None
+        """
+        item = self.backend.get(key)
+        if item is None:
+            self._misses += 1
+            logger.debug(f"[CACHE] 캐시 미스: key={key}")
+            return None
+
+        value, stored_at = item
+        age_seconds = round(time.time() - stored_at, 1)
+        is_stale = age_seconds > self.ttl_seconds
+        if is_stale:
+            self._stale_hits += 1
+            logger.debug(f"[CACHE] stale 캐시 히트: key={key}, age={age_seconds}초")
+        else:
+            self._hits += 1
+            logger.debug(f"[CACHE] 캐시 히트: key={key}")
+        return value, age_seconds, is_stale
+
+    def refresh_in_background(self, key: str, refresh_func: Callable[[], Awaitable[Any]]) -> None:
+        """
+        stale 항목을 백그라운드에서 갱신합니다. 같은 키의 갱신이 진행 중이면 무시합니다.
+        refresh_func는 새 값을 계산해 set()으로 저장해야 합니다.
+
+        Args:
+            key (str): 캐시 키
+            refresh_func (Callable[[], Awaitable[Any]]): 갱신 작업 코루틴 함수
+        """
+        if key in self._refreshing:
+            return
+        task = asyncio.ensure_future(self._refresh(key, refresh_func))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, key: str, refresh_func: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await refresh_func()
+            self._refreshes += 1
+            logger.info(f"[CACHE] 백그라운드 갱신 완료: key={key}")
+        except Exception as e:
+            self._refresh_failures += 1
+            logger.error(f"[CACHE] 백그라운드 갱신 실패: key={key}, 에러={str(e)}")
+
     def set(self, key: str, value: Any) -> None:
         """
         캐시에 값을 저장합니다.
-        
+
         Args:
             key (str): 캐시 키
             value (Any): 저장할 값
         """
-        current_time = time.time()
-        self._cache_store[key] = (value, current_time)
-        print(f"[CACHE] 캐시 저장: key={key}")
+        # 저장소에는 hard TTL로 저장하고, soft TTL 경과 여부는 조회 시 판단
+        self.backend.set(key, value, self.hard_ttl_seconds)
+        logger.debug(f"[CACHE] 캐시 저장: key={key}")
 
     def clear(self) -> None:
         """캐시를 모두 비웁니다."""
-        self._cache_store.clear()
-        print("[CACHE] 캐시 초기화")
+        self.backend.clear()
+        logger.info("[CACHE] 캐시 초기화")
 
     def cleanup_expired(self) -> None:
         """
         만료된 캐시 항목을 정리합니다.
         """
-        current_time = time.time()
-        expired_keys = [
-            key for key, (_, timestamp) in self._cache_store.items()
-            if current_time - timestamp > self.ttl_seconds
-        ]
-        
-        for key in expired_keys:
-            del self._cache_store[key]
-            
-        if expired_keys:
-            print(f"[CACHE] 만료된 항목 {len(expired_keys)}개 정리 완료")
-
-    def _is_expired(self, cache_entry: Dict[str, Any]) -> bool:
-        """
-        Check if a cache entry is expired
-        
-        Args:
-            cache_entry: Cache entry to check
-            
+        purged = self.backend.purge_expired()
+        self._expired_purged += purged
+        if purged:
+            logger.info(f"[CACHE] 만료된 항목 {purged}개 정리 완료")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 히트/미스/제거 통계를 반환합니다.
+
         Returns:
-            Boolean indicating if entry is expired
+            Dict[str, Any]: 캐시 통계
+        """
+        lookups = self._hits + self._stale_hits + self._misses
+        stats = self.backend.stats()
+        stats.update({
+            "ttl_seconds": self.ttl_seconds,
+            "hard_ttl_seconds": self.hard_ttl_seconds,
+            "hits": self._hits,
+            "stale_hits": self._stale_hits,
+            "misses": self._misses,
+            "hit_rate_percent": round(((self._hits + self._stale_hits) / lookups) * 100, 1) if lookups > 0 else 0,
+            "expired_purged": self._expired_purged,
+            "refreshes": self._refreshes,
+            "refresh_failures": self._refresh_failures,
+            "refreshing": len(self._refreshing)
+        })
+        return stats
+
+    async def _sweep_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.cleanup_expired()
+            except Exception as e:
+                logger.error(f"[CACHE] 만료 항목 정리 실패: {str(e)}")
+
+    def start_sweeper(self, interval: float = CACHE_SWEEP_INTERVAL) -> None:
         """
-        return datetime.now() > cache_entry["expires_at"]
+        만료 항목을 주기적으로 정리하는 백그라운드 작업을 시작합니다.
+
+        Args:
+            interval (float): 정리 주기 (초 단위)
+        """
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.ensure_future(self._sweep_loop(interval))
+
+    async def stop_sweeper(self) -> None:
+        """백그라운드 만료 항목 정리 작업을 중지합니다."""
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            try:
+                await self._sweeper_task
+            except asyncio.CancelledError:
+                pass
+            self._sweeper_task = None
 
 # Create a singleton instance
-cache_manager = CacheManager() 
\ No newline at end of file
+cache_manager = CacheManager()
@@ -1,23 +1,170 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, AsyncIterator, Optional, List
 import anthropic
-from anthropic import Anthropic
-import time
+import asyncio
 from ..config import Config
+from .single_flight import single_flight
+from .llm_clients import llm_clients, LLM_MAX_RETRIES, backoff_delay
+from .llm_cache import llm_response_cache, llm_cache_key, LLM_CACHE_TTL
 
 class ClaudeCaller:
     def __init__(self):
         """Initialize Claude caller with configuration"""
         Config.validate_api_keys()
         self.config = Config.get_claude_config()
-        self.client = Anthropic(api_key=self.config["api_key"])
+        self.client = llm_clients.anthropic()
     
+    def _request_key(
+        self,
+        prompt: str,
+        system: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> str:
+        """Build a key identifying identical Claude requests"""
+        return llm_cache_key(
+            "claude",
+            self.config["model"],
+            system,
+            prompt,
+            temperature or self.config["temperature"],
+            max_tokens or self.config["max_tokens"]
+        )
+
     async def call(
         self,
         prompt: str,
         system: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        cache_ttl: Optional[int] = None,
+        bypass_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Call Claude API, serving repeated requests from the response cache and
+        sharing one in-flight request between identical concurrent calls
+        
+        Args:
+            prompt: The user's prompt
+            system: Optional system message
+            temperature: Optional temperature parameter
+            max_tokens: Optional max tokens parameter
+            timeout: Optional timeout in seconds
+            cache_ttl: Optional cache TTL in seconds for this call site
+            bypass_cache: Skip the cache and in-flight sharing to get a fresh sample
+            
+        Returns:
+            Dictionary containing the API response
+        """
+        key = self._request_key(prompt, system, temperature, max_tokens)
+        ttl_seconds = cache_ttl or LLM_CACHE_TTL["claude"]
+        if bypass_cache:
+            response = await llm_response_cache.get_or_call(
+                key,
+                lambda: self._call(prompt, system, temperature, max_tokens, timeout),
+                ttl_seconds,
+                bypass=True
+            )
+            return dict(response)
+
+        response, _ = await single_flight.do(
+            key,
+            lambda: llm_response_cache.get_or_call(
+                key,
+                lambda: self._call(prompt, system, temperature, max_tokens, timeout),
+                ttl_seconds
+            )
+        )
+        return dict(response)
+
+    async def stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[int] = None,
+        cache_ttl: Optional[int] = None,
+        bypass_cache: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        Stream Claude API text deltas as they arrive.
+        A cached response is replayed as a single chunk; a completed stream is cached
+        under the same key as call().
+        
+        Args:
+            prompt: The user's prompt
+            system: Optional system message
+            temperature: Optional temperature parameter
+            max_tokens: Optional max tokens parameter
+            timeout: Optional timeout in seconds
+            cache_ttl: Optional cache TTL in seconds for this call site
+            bypass_cache: Skip the cache lookup to get a fresh sample
+            
+        Yields:
+            Text deltas of the response
+        """
+        key = self._request_key(prompt, system, temperature, max_tokens)
+        if not bypass_cache:
+            cached = await asyncio.to_thread(llm_response_cache.get, key)
+            if cached is not None:
+                yield cached["content"]
+                return
+
+        params = self._params(prompt, system, temperature, max_tokens, timeout)
+
+        async def open_stream() -> AsyncIterator[str]:
+            async with self.client.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        chunks: List[str] = []
+        try:
+            async for text in llm_clients.stream("anthropic", open_stream):
+                chunks.append(text)
+                yield text
+        except anthropic.APITimeoutError as e:
+            raise TimeoutError(f"Anthropic API timeout: {str(e)}")
+        except anthropic.APIError as e:
+            raise ValueError(f"Anthropic API error: {str(e)}")
+
+        await asyncio.to_thread(
+            llm_response_cache.set,
+            key,
+            {"content": "".join(chunks), "usage": None, "model": self.config["model"]},
+            cache_ttl or LLM_CACHE_TTL["claude"]
+        )
+
+    def _params(
+        self,
+        prompt: str,
+        system: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        timeout: Optional[int]
+    ) -> Dict[str, Any]:
+        """Build Messages API parameters"""
+        messages: List[Dict[str, str]] = [{"role": "user", "content": prompt}]
+        params: Dict[str, Any] = {
+            "model": self.config["model"],
+            "messages": messages,
+            "temperature": temperature or self.config["temperature"],
+            "max_tokens": max_tokens or self.config["max_tokens"],
+            "timeout": timeout or self.config["timeout"]
+        }
+        # Messages API takes the system prompt as a separate parameter
+        if system:
+            params["system"] = system
+        return params
+
+    async def _call(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[int] = None,
+        max_retries: int = LLM_MAX_RETRIES
     ) -> Dict[str, Any]:
         """
         Call Claude API with the given parameters
@@ -28,6 +175,7 @@ class ClaudeCaller:
             temperature: Optional temperature parameter
             max_tokens: Optional max tokens parameter
             timeout: Optional timeout in seconds
+            max_retries: Retries on transient errors (0 when the caller fails over itself)
             
         Returns:
             Dictionary containing the API response
@@ -37,17 +185,11 @@ class ClaudeCaller:
             TimeoutError: If the API call times out
         """
         try:
-            messages: List[Dict[str, str]] = []
-            if system:
-                messages.append({"role": "system", "content": system})
-            messages.append({"role": "user", "content": prompt})
-            
-            response = await self.client.messages.create(
-                model=self.config["model"],
-                messages=messages,
-                temperature=temperature or self.config["temperature"],
-                max_tokens=max_tokens or self.config["max_tokens"],
-                timeout=timeout or self.config["timeout"]
+            params = self._params(prompt, system, temperature, max_tokens, timeout)
+            response = await llm_clients.request(
+                "anthropic",
+                lambda: self.client.messages.create(**params),
+                max_retries=max_retries
             )
             
             return {
@@ -59,12 +201,12 @@ class ClaudeCaller:
                 "model": response.model
             }
             
-        except anthropic.APIError as e:
-            raise ValueError(f"Anthropic API error: {str(e)}")
         except anthropic.APITimeoutError as e:
             raise TimeoutError(f"Anthropic API timeout: {str(e)}")
         except anthropic.AuthenticationError as e:
             raise ValueError(f"Anthropic API authentication error: {str(e)}")
+        except anthropic.APIError as e:
+            raise ValueError(f"Anthropic API error: {str(e)}")
         except Exception as e:
             raise ValueError(f"Unexpected error in Claude API call: {str(e)}")
     
@@ -105,5 +247,5 @@ class ClaudeCaller:
             except (ValueError, TimeoutError) as e:
                 if attempt == max_retries - 1:
                     raise
-                time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
+                await asyncio.sleep(backoff_delay(attempt, base=retry_delay))  # Exponential backoff with jitter
         raise ValueError("Maximum retry attempts reached") 
\ No newline at end of file
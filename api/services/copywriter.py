@@ -4,9 +4,13 @@ Copy Generation Service
 
 import json
 import os
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from openai import OpenAI
 from dotenv import load_dotenv
+from .llm_cache import llm_response_cache, llm_cache_key, LLM_CACHE_TTL
+from .gpt_caller import GPTCaller
+
+COPY_SYSTEM_PROMPT = "You are a professional copywriter. Generate short, impactful copy within 20 words. No explanations or emojis."
 
 class Copywriter:
     def __init__(self):
@@ -74,7 +78,8 @@ class Copywriter:
     def generate_copy(self, 
                      strategy: Dict,
                      analysis_result: Dict,
-                     style: Optional[str] = None) -> Dict:
+                     style: Optional[str] = None,
+                     bypass_cache: bool = False) -> Dict:
         """
         Generate marketing copy based on strategy and analysis
         
@@ -82,51 +87,104 @@ class Copywriter:
             strategy: Marketing strategy
             analysis_result: Analysis results from Claude
             style: Optional specific style to use
+            bypass_cache: Skip the response cache to get a fresh sample (e.g. A/B variants)
             
         Returns:
             Dictionary containing the generated copy and style
         """
         try:
-            # 욕구 태그 추출
-            desire_tags = analysis_result.get("desires", [])
-            if not desire_tags:
-                raise ValueError("No desire tags found in analysis result")
-                
-            # 스타일 결정
-            selected_style = style if style else self._determine_style(desire_tags)
-            
-            # 프롬프트 로드
-            prompt = self._load_style_prompt(selected_style)
-            
-            # 프롬프트 포맷팅
-            formatted_prompt = prompt.format(
-                strategy=json.dumps(strategy, ensure_ascii=False),
-                analysis=json.dumps(analysis_result, ensure_ascii=False)
-            )
+            selected_style, formatted_prompt = self._prepare_prompt(strategy, analysis_result, style)
             
-            # GPT-4 호출
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a professional copywriter. Generate short, impactful copy within 20 words. No explanations or emojis."},
-                    {"role": "user", "content": formatted_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=50
+            # GPT-4 호출 (같은 프롬프트는 응답 캐시 사용)
+            copy_text = llm_response_cache.get_or_call_sync(
+                llm_cache_key("copy", "gpt-4", COPY_SYSTEM_PROMPT, formatted_prompt, 0.7, 50),
+                lambda: self.client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[
+                        {"role": "system", "content": COPY_SYSTEM_PROMPT},
+                        {"role": "user", "content": formatted_prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=50
+                ).choices[0].message.content,
+                LLM_CACHE_TTL["copy"],
+                bypass=bypass_cache
             )
             
-            # 응답 처리
-            copy_text = response.choices[0].message.content.strip()
-            
-            # 20단어 제한 확인
-            words = copy_text.split()
-            if len(words) > 20:
-                copy_text = " ".join(words[:20])
-                
             return {
                 "style": selected_style,
-                "copy": copy_text
+                "copy": self._limit_words(copy_text)
             }
             
         except Exception as e:
-            raise Exception(f"Copy generation failed: {str(e)}") 
\ No newline at end of file
+            raise Exception(f"Copy generation failed: {str(e)}")
+            
+    async def stream_copy(self,
+                          strategy: Dict,
+                          analysis_result: Dict,
+                          style: Optional[str] = None) -> AsyncIterator[Dict]:
+        """
+        Generate marketing copy, forwarding tokens as they arrive
+        
+        Args:
+            strategy: Marketing strategy
+            analysis_result: Analysis results from Claude
+            style: Optional specific style to use
+            
+        Yields:
+            {"type": "token", "text": ...} for each delta, then
+            {"type": "done", "style": ..., "copy": ...} with the 20-word limited copy
+        """
+        selected_style, formatted_prompt = self._prepare_prompt(strategy, analysis_result, style)
+        chunks = []
+        async for text in GPTCaller().stream(
+            prompt=formatted_prompt,
+            system=COPY_SYSTEM_PROMPT,
+            temperature=0.7,
+            max_tokens=50,
+            cache_ttl=LLM_CACHE_TTL["copy"]
+        ):
+            chunks.append(text)
+            yield {"type": "token", "text": text}
+        yield {
+            "type": "done",
+            "style": selected_style,
+            "copy": self._limit_words("".join(chunks))
+        }
+        
+    def _prepare_prompt(self, strategy: Dict, analysis_result: Dict, style: Optional[str]) -> Tuple[str, str]:
+        """
+        Select the copy style and format its prompt
+        
+        Args:
+            strategy: Marketing strategy
+            analysis_result: Analysis results from Claude
+            style: Optional specific style to use
+            
+        Returns:
+            Tuple of (selected style, formatted prompt)
+        """
+        # 욕구 태그 추출
+        desire_tags = analysis_result.get("desires", [])
+        if not desire_tags:
+            raise ValueError("No desire tags found in analysis result")
+            
+        # 스타일 결정
+        selected_style = style if style else self._determine_style(desire_tags)
+        
+        # 프롬프트 로드
+        prompt = self._load_style_prompt(selected_style)
+        
+        # 프롬프트 포맷팅
+        formatted_prompt = prompt.format(
+            strategy=json.dumps(strategy, ensure_ascii=False),
+            analysis=json.dumps(analysis_result, ensure_ascii=False)
+        )
+        return selected_style, formatted_prompt
+        
+    def _limit_words(self, copy_text: str) -> str:
+        """Trim the copy and enforce the 20-word limit"""
+        words = copy_text.strip().split()
+        if len(words) > 20:
+            return " ".join(words[:20])
+        return copy_text.strip() 
\ No newline at end of file
@@ -0,0 +1,152 @@
+import asyncio
+import os
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# 채널별 크롤링 제한 시간 (초)
+CHANNEL_TIMEOUT_SECONDS = float(os.getenv("CRAWL_CHANNEL_TIMEOUT", "8"))
+# 요청 전체 크롤링 예산 (초) - 초과 시 완료된 채널 결과만 반환
+REQUEST_BUDGET_SECONDS = float(os.getenv("CRAWL_REQUEST_BUDGET", "10"))
+
+CrawlerFunc = Callable[[str], Awaitable[Any]]
+
+class CrawlFanout:
+    def __init__(
+        self,
+        channel_timeout: float = CHANNEL_TIMEOUT_SECONDS,
+        request_budget: float = REQUEST_BUDGET_SECONDS
+    ):
+        """
+        여러 채널 크롤러를 동시에 실행하는 팬아웃 실행기를 초기화합니다.
+
+        Args:
+            channel_timeout (float): 채널별 제한 시간 (초 단위)
+            request_budget (float): 요청 전체 제한 시간 (초 단위)
+        """
+        self.channel_timeout = channel_timeout
+        self.request_budget = request_budget
+
+    async def _run_channel(self, channel: str, crawler_func: CrawlerFunc, input_text: str) -> Dict[str, Any]:
+        """
+        단일 채널 크롤러를 채널 제한 시간 안에서 실행합니다.
+
+        Args:
+            channel (str): 채널 키
+            crawler_func (CrawlerFunc): 채널 크롤러 함수
+            input_text (str): 검색어
+
+        Returns:
+            Dict[str, Any]: 채널 실행 결과 (status, results, error, elapsed)
+        """
+        start_time = time.time()
+        try:
+            result = await asyncio.wait_for(crawler_func(input_text), timeout=self.channel_timeout)
+            if isinstance(result, Exception):
+                raise result
+            if not isinstance(result, list):
+                result = [result]
+            return {
+                "status": "success",
+                "results": result,
+                "error": None,
+                "elapsed": round(time.time() - start_time, 2)
+            }
+        except asyncio.TimeoutError:
+            return {
+                "status": "timeout",
+                "results": [],
+                "error": f"채널 제한 시간 초과 ({self.channel_timeout}초)",
+                "elapsed": round(time.time() - start_time, 2)
+            }
+        except Exception as e:
+            return {
+                "status": "failed",
+                "results": [],
+                "error": str(e),
+                "elapsed": round(time.time() - start_time, 2)
+            }
+
+    async def iter_completed(
+        self,
+        channels: List[str],
+        crawler_map: Dict[str, CrawlerFunc],
+        input_text: str,
+        request_budget: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        선택된 채널을 동시에 크롤링하고, 완료되는 순서대로 채널별 결과를 전달합니다.
+        요청 예산을 넘긴 채널은 취소되고 "timeout" 상태로 마지막에 전달됩니다.
+
+        Args:
+            channels (List[str]): 크롤링할 채널 목록
+            crawler_map (Dict[str, CrawlerFunc]): 채널별 크롤러 함수 매핑
+            input_text (str): 검색어
+            request_budget (Optional[float]): 요청 전체 제한 시간 (기본값: 인스턴스 설정)
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: (채널 키, 채널 실행 결과)
+        """
+        budget = request_budget if request_budget is not None else self.request_budget
+        deadline = time.monotonic() + budget
+        tasks: Dict[asyncio.Task, str] = {}
+
+        for channel in dict.fromkeys(channels):
+            if channel not in crawler_map:
+                yield channel, {
+                    "status": "unsupported",
+                    "results": [],
+                    "error": "지원하지 않는 채널",
+                    "elapsed": 0.0
+                }
+                continue
+            task = asyncio.ensure_future(self._run_channel(channel, crawler_map[channel], input_text))
+            tasks[task] = channel
+
+        pending = set(tasks.keys())
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield tasks[task], task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        for task in pending:
+            print(f"[CRAWL][{tasks[task]}] 요청 예산 초과로 취소됨")
+            yield tasks[task], {
+                "status": "timeout",
+                "results": [],
+                "error": f"요청 제한 시간 초과 ({budget}초)",
+                "elapsed": budget
+            }
+
+    async def run(
+        self,
+        channels: List[str],
+        crawler_map: Dict[str, CrawlerFunc],
+        input_text: str,
+        request_budget: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        선택된 채널을 동시에 크롤링하고 채널별 결과를 반환합니다.
+
+        Args:
+            channels (List[str]): 크롤링할 채널 목록
+            crawler_map (Dict[str, CrawlerFunc]): 채널별 크롤러 함수 매핑
+            input_text (str): 검색어
+            request_budget (Optional[float]): 요청 전체 제한 시간 (기본값: 인스턴스 설정)
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 채널별 실행 결과 (요청 채널 순서 유지)
+        """
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        async for channel, outcome in self.iter_completed(channels, crawler_map, input_text, request_budget):
+            outcomes[channel] = outcome
+        return {channel: outcomes[channel] for channel in dict.fromkeys(channels)}
+
+# 전역 CrawlFanout 인스턴스 생성
+crawl_fanout = CrawlFanout()
@@ -3,6 +3,8 @@ from typing import Dict, List, Optional
 from api.routes.crawler import CRAWLER_MAP
 from api.utils.cache import get_cache, set_cache
 from api.utils.text_cleaner import filter_short_results
+from api.utils.near_duplicate import remove_near_duplicates
+from api.utils.result_ranker import select_results
 from api.constants.channel_config import format_result_with_channel
 
 logger = logging.getLogger("uvicorn.access")
@@ -43,8 +45,13 @@ class CrawlerDispatcher:
                         labeled_result = {
                             "title": format_result_with_channel(channel, result["title"]),
                             "content": format_result_with_channel(channel, result["content"]),
-                            "url": result["url"]
+                            "url": result["url"],
+                            "channel": channel
                         }
+                        # 결과 선택 점수 계산용 반응도/게시 시각 필드 유지
+                        for field in ("score", "views", "date", "created_utc"):
+                            if field in result:
+                                labeled_result[field] = result[field]
                         labeled_results.append(labeled_result)
                     except Exception as e:
                         logger.error(f"[CRAWLER] 결과 포맷팅 실패: 채널={channel}, 결과={result}, 에러={str(e)}")
@@ -59,21 +66,15 @@ class CrawlerDispatcher:
                 channel_stats[channel] = 0
                 continue
         
-        # 중복 제거
-        unique_results = []
-        seen = set()
-        for result in results:
-            key = f"{result['title']}{result['content']}"
-            if key not in seen:
-                seen.add(key)
-                unique_results.append(result)
+        # 근사 중복 제거
+        unique_results = remove_near_duplicates(results)
         
         # 짧은 결과 필터링
         filtered_results = filter_short_results(unique_results)
         
-        # 최대 결과 수 제한
+        # 관련도/반응도/최신성과 채널 균형을 고려해 최대 결과 수만큼 선택
         MAX_RESULT_COUNT = 30
-        final_results = filtered_results[:MAX_RESULT_COUNT]
+        final_results = select_results(filtered_results, input_text, max_count=MAX_RESULT_COUNT)
         
         # 캐시에 저장
         cache_key = f"crawl:{input_text}:{','.join(channels)}"
@@ -1,9 +1,8 @@
 from typing import List, Dict, Any
-import time
-import requests
 from bs4 import BeautifulSoup
 from ..config import Config
 from ....utils.text_cleaner import clean_text
+from ..http_client import http_client
 
 class DcinsideCrawler:
     def __init__(self):
@@ -22,9 +21,6 @@ class DcinsideCrawler:
             List of dictionaries containing post information
         """
         try:
-            # Simulate API delay
-            await time.sleep(1)
-            
             # Search DC Inside
             params = {
                 "q": keyword,
@@ -32,11 +28,7 @@ class DcinsideCrawler:
                 "sort": "date"
             }
             
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            
-            response = requests.get(self.search_url, params=params, headers=headers)
+            response = await http_client.get(self.search_url, params=params)
             soup = BeautifulSoup(response.text, 'html.parser')
             
             results = []
@@ -1,9 +1,11 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import time
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from ..config import Config
 from ....utils.text_cleaner import clean_text
+from ..http_client import http_client
+from ...utils.post_date import parse_post_date
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,9 +27,6 @@ class PpomppuCrawler:
             List of dictionaries containing post information
         """
         try:
-            # Simulate API delay
-            await time.sleep(1)
-            
             # Search Ppomppu
             params = {
                 "keyword": keyword,
@@ -35,15 +34,11 @@ class PpomppuCrawler:
                 "page": 1
             }
             
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            
             logger.info(f"[PPOMPPU] 크롤링 시작: {keyword}")
             start_time = time.time()
             
             # 타임아웃 5초로 설정하여 요청
-            response = requests.get(self.search_url, params=params, headers=headers, timeout=5)
+            response = await http_client.get(self.search_url, params=params, timeout=5)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -67,11 +62,11 @@ class PpomppuCrawler:
             logger.info(f"[PPOMPPU] 크롤링 완료: {len(results)}개 결과, {elapsed_time:.2f}초 소요")
             return results
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.warning(f"[PPOMPPU] 요청 시간 초과: {keyword}")
             return []
         
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"[PPOMPPU] 요청 실패: {str(e)}")
             return []
         
@@ -79,12 +74,13 @@ class PpomppuCrawler:
             logger.error(f"[PPOMPPU] 예상치 못한 오류: {str(e)}")
             return []
 
-async def crawl_ppomppu(keyword: str) -> List[Dict[str, Any]]:
+async def crawl_ppomppu(keyword: str, since: Optional[float] = None) -> List[Dict[str, Any]]:
     """
     뽐뿌에서 키워드 관련 게시물을 크롤링합니다.
     
     Args:
         keyword (str): 검색할 키워드
+        since (Optional[float]): 이 시각 이후 게시물만 수집 (증분 크롤링)
         
     Returns:
         List[Dict[str, Any]]: 크롤링 결과 리스트
@@ -98,16 +94,11 @@ async def crawl_ppomppu(keyword: str) -> List[Dict[str, Any]]:
             "page": 1
         }
         
-        # 요청 헤더 설정
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        
         logger.info(f"[PPOMPPU] 크롤링 시작: {keyword}")
         start_time = time.time()
         
         # 타임아웃 5초로 설정하여 요청
-        response = requests.get(url, params=params, headers=headers, timeout=5)
+        response = await http_client.get(url, params=params, timeout=5)
         response.raise_for_status()
         
         # HTML 파싱
@@ -122,10 +113,15 @@ async def crawl_ppomppu(keyword: str) -> List[Dict[str, Any]]:
             date_elem = post.select_one('.date')
             
             if title_elem and content_elem:
+                date_text = date_elem.get_text(strip=True) if date_elem else ""
+                if since:
+                    posted_at = parse_post_date(date_text)
+                    if posted_at is not None and posted_at <= since:
+                        continue
                 results.append({
                     "title": title_elem.get_text(strip=True),
                     "content": content_elem.get_text(strip=True),
-                    "date": date_elem.get_text(strip=True) if date_elem else "",
+                    "date": date_text,
                     "url": f"https://www.ppomppu.co.kr{title_elem.get('href', '')}"
                 })
         
@@ -133,11 +129,11 @@ async def crawl_ppomppu(keyword: str) -> List[Dict[str, Any]]:
         logger.info(f"[PPOMPPU] 크롤링 완료: {len(results)}개 결과, {elapsed_time:.2f}초 소요")
         return results
         
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         logger.warning(f"[PPOMPPU] 요청 시간 초과: {keyword}")
         return []
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"[PPOMPPU] 요청 실패: {str(e)}")
         return []
         
@@ -1,42 +1,41 @@
-import requests
+import asyncio
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 from bs4 import BeautifulSoup
 from ....utils.text_cleaner import clean_text
 import random
+from urllib.parse import quote
+import httpx
+from ..http_client import http_client
 
 logger = logging.getLogger(__name__)
 
-async def crawl_reddit(keyword: str) -> List[Dict[str, Any]]:
+async def crawl_reddit(keyword: str, since: Optional[float] = None) -> List[Dict[str, Any]]:
     """
     Reddit에서 키워드 관련 게시물을 크롤링합니다.
     
     Args:
         keyword (str): 검색할 키워드
+        since (Optional[float]): 이 시각(created_utc) 이후 게시물만 수집 (증분 크롤링)
         
     Returns:
         List[Dict[str, Any]]: 크롤링 결과 리스트
     """
     try:
-        # API 엔드포인트 설정
+        # API 엔드포인트 설정 (증분 크롤링 시 최신순 정렬)
         url = "https://www.reddit.com/search.json"
         params = {
             "q": keyword,
-            "sort": "relevance",
+            "sort": "new" if since else "relevance",
             "limit": 10
         }
         
-        # 요청 헤더 설정
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        
         logger.info(f"[REDDIT] 크롤링 시작: {keyword}")
         start_time = time.time()
         
-        # 타임아웃 5초로 설정하여 요청
-        response = requests.get(url, params=params, headers=headers, timeout=5)
+        # 타임아웃 5초로 설정하여 요청 (공유 비동기 클라이언트 사용)
+        response = await http_client.get(url, params=params, timeout=5)
         response.raise_for_status()
         
         # 응답 처리
@@ -47,6 +46,8 @@ async def crawl_reddit(keyword: str) -> List[Dict[str, Any]]:
         results = []
         for post in posts:
             post_data = post.get("data", {})
+            if since and post_data.get("created_utc", 0) <= since:
+                continue
             results.append({
                 "title": post_data.get("title", ""),
                 "content": post_data.get("selftext", ""),
@@ -59,11 +60,11 @@ async def crawl_reddit(keyword: str) -> List[Dict[str, Any]]:
         logger.info(f"[REDDIT] 크롤링 완료: {len(results)}개 결과, {elapsed_time:.2f}초 소요")
         return results
         
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         logger.warning(f"[REDDIT] 요청 시간 초과: {keyword}")
         return []
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"[REDDIT] 요청 실패: {str(e)}")
         return []
         
@@ -83,7 +84,7 @@ async def crawl_reddit_old(input_text: str) -> List[str]:
     """
     try:
         # 검색 URL 구성
-        encoded_query = requests.utils.quote(input_text)
+        encoded_query = quote(input_text)
         url = f"https://www.reddit.com/search/?q={encoded_query}&sort=relevance"
         
         # User-Agent 랜덤 선택 (차단 방지)
@@ -103,11 +104,10 @@ async def crawl_reddit_old(input_text: str) -> List[str]:
         print(f"[reddit_crawler] 요청 시작: {url}")
         
         # HTTP 요청 수행
-        response = requests.get(
+        response = await http_client.get(
             url,
             headers=headers,
-            timeout=10,
-            allow_redirects=True
+            timeout=10
         )
         response.raise_for_status()
         
@@ -150,7 +150,7 @@ async def crawl_reddit_old(input_text: str) -> List[str]:
             
         return results
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"[reddit_crawler] HTTP 요청 실패: {str(e)}")
         return []
     except Exception as e:
@@ -158,4 +158,4 @@ async def crawl_reddit_old(input_text: str) -> List[str]:
         return []
     finally:
         # 요청 간 딜레이
-        time.sleep(random.uniform(1, 2)) 
\ No newline at end of file
+        await asyncio.sleep(random.uniform(1, 2)) 
\ No newline at end of file
@@ -3,14 +3,13 @@ PDF Download Handler Service
 """
 
 from fastapi import HTTPException
-from weasyprint import HTML
-from weasyprint.text.fonts import FontConfiguration
 import os
 from datetime import datetime
+from api.services.pdf_renderer import pdf_renderer
 
 async def download_pdf(input_html: str) -> bytes:
     """
-    Convert HTML to PDF using WeasyPrint
+    Convert HTML to PDF using WeasyPrint (render process pool, cached by content hash)
     
     Args:
         input_html: HTML content to convert
@@ -22,17 +21,11 @@ async def download_pdf(input_html: str) -> bytes:
         HTTPException: If PDF generation fails
     """
     try:
-        # Configure fonts
-        font_config = FontConfiguration()
-        
-        # Create HTML object
-        html = HTML(string=input_html)
-        
         # Generate PDF
-        pdf_bytes = html.write_pdf(font_config=font_config)
-        
-        return pdf_bytes
+        return await pdf_renderer.render(input_html)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
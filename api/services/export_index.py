@@ -0,0 +1,202 @@
+"""
+Metadata index of exported HTML/PDF report files
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 내보내기 인덱스 저장 위치
+EXPORT_INDEX_PATH = os.getenv("EXPORT_INDEX_PATH", "cache/exports.sqlite3")
+
+# 인덱스를 처음 만들 때 기존 파일을 등록할 디렉토리 (종류별)
+EXPORT_BACKFILL_DIRS = {
+    "html": ["exports", "exported_reports"],
+    "pdf": ["exported_pdfs"]
+}
+
+EXPORT_KINDS = ("html", "pdf")
+
+# {analysis_id}_{타임스탬프}.{html|pdf} 형식의 파일명
+_EXPORT_FILENAME_PATTERN = re.compile(r"^(?P<analysis_id>.+?)_\d{8}_?\d{6}\.(?P<ext>html|pdf)$")
+
+class ExportIndex:
+    def __init__(self, path: str = EXPORT_INDEX_PATH):
+        """
+        내보낸 HTML/PDF 파일의 (analysis_id, 종류, 파일명, 생성 시각, 크기)를 기록하는 인덱스를 초기화합니다.
+        파일 조회가 디렉토리 스캔 대신 인덱스 조회로 처리되어 파일 수와 관계없이 일정한 시간이 걸립니다.
+
+        Args:
+            path (str): SQLite 파일 경로
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS exports (
+                    directory TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    analysis_id TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    PRIMARY KEY (directory, filename)
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_exports_lookup ON exports (analysis_id, kind, created_at)")
+            conn.execute("CREATE TABLE IF NOT EXISTS export_index_meta (key TEXT PRIMARY KEY, value TEXT)")
+            backfilled = conn.execute("SELECT value FROM export_index_meta WHERE key = 'backfilled'").fetchone()
+        if backfilled is None:
+            self._backfill()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _backfill(self) -> None:
+        """인덱스 도입 전에 저장된 파일을 한 번만 등록합니다."""
+        rows = []
+        for kind, directories in EXPORT_BACKFILL_DIRS.items():
+            for directory in directories:
+                if not os.path.isdir(directory):
+                    continue
+                for entry in os.scandir(directory):
+                    match = _EXPORT_FILENAME_PATTERN.match(entry.name)
+                    if not match or match.group("ext") != kind or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    rows.append((directory, entry.name, match.group("analysis_id"), kind, stat.st_ctime, stat.st_size))
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR IGNORE INTO exports (directory, filename, analysis_id, kind, created_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.execute("INSERT OR REPLACE INTO export_index_meta (key, value) VALUES ('backfilled', ?)", (str(time.time()),))
+            conn.execute("COMMIT")
+        logger.info(f"[EXPORT_INDEX] 기존 파일 {len(rows)}개 등록")
+
+    def record(self, analysis_id: str, kind: str, filepath: str) -> None:
+        """
+        저장한 파일을 인덱스에 기록합니다.
+
+        Args:
+            analysis_id (str): 분석 ID
+            kind (str): 파일 종류 (html, pdf)
+            filepath (str): 저장된 파일 경로
+        """
+        if kind not in EXPORT_KINDS:
+            raise ValueError(f"지원하지 않는 파일 종류입니다: {kind}")
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO exports (directory, filename, analysis_id, kind, created_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    os.path.dirname(filepath),
+                    os.path.basename(filepath),
+                    analysis_id,
+                    kind,
+                    time.time(),
+                    os.path.getsize(filepath)
+                )
+            )
+
+    def remove(self, filepath: str) -> None:
+        """
+        삭제한 파일을 인덱스에서 제거합니다.
+
+        Args:
+            filepath (str): 삭제된 파일 경로
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM exports WHERE directory = ? AND filename = ?",
+                (os.path.dirname(filepath), os.path.basename(filepath))
+            )
+
+    def latest(self, analysis_id: str, kind: str, directory: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        분석 ID의 가장 최근 파일 정보를 반환합니다.
+
+        Args:
+            analysis_id (str): 분석 ID
+            kind (str): 파일 종류 (html, pdf)
+            directory (Optional[str]): 지정하면 이 디렉토리에 저장된 파일만 조회
+
+        Returns:
+            Optional[Dict[str, Any]]: directory, filename, analysis_id, kind, created_at, size 또는 None
+        """
+        query = "SELECT * FROM exports WHERE analysis_id = ? AND kind = ?"
+        params: List[Any] = [analysis_id, kind]
+        if directory is not None:
+            query += " AND directory = ?"
+            params.append(directory)
+        with self._connect() as conn:
+            row = conn.execute(query + " ORDER BY created_at DESC LIMIT 1", params).fetchone()
+        return dict(row) if row is not None else None
+
+    def latest_many(
+        self,
+        analysis_ids: List[str],
+        kind: str,
+        directory: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 분석 ID의 가장 최근 파일 정보를 한 번의 조회로 반환합니다 (목록 페이지용).
+
+        Args:
+            analysis_ids (List[str]): 분석 ID 목록
+            kind (str): 파일 종류 (html, pdf)
+            directory (Optional[str]): 지정하면 이 디렉토리에 저장된 파일만 조회
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 분석 ID별 파일 정보 (파일이 없는 ID는 제외)
+        """
+        if not analysis_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in analysis_ids)
+        query = f"SELECT * FROM exports WHERE kind = ? AND analysis_id IN ({placeholders})"
+        params: List[Any] = [kind, *analysis_ids]
+        if directory is not None:
+            query += " AND directory = ?"
+            params.append(directory)
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY created_at", params).fetchall()
+        # 생성 시각 오름차순이므로 마지막 값이 가장 최근 파일
+        return {row["analysis_id"]: dict(row) for row in rows}
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        인덱스 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 종류별 파일 수와 전체 크기
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT kind, COUNT(*), COALESCE(SUM(size), 0) FROM exports GROUP BY kind").fetchall()
+        stats = {}
+        for kind, count, size in rows:
+            stats[f"{kind}_files"] = count
+            stats[f"{kind}_bytes"] = size
+        return stats
+
+# 전역 ExportIndex 인스턴스 생성
+export_index = ExportIndex()
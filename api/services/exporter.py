@@ -2,6 +2,7 @@ from datetime import datetime
 import os
 import json
 from typing import Dict, Any, Optional
+from api.services.export_index import export_index
 
 # HTML 템플릿
 HTML_TEMPLATE = """
@@ -138,6 +139,7 @@ def save_result_as_html(analysis_id: str, html_content: str) -> str:
         # HTML 파일 저장
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(html_content)
+        export_index.record(analysis_id, "html", filepath)
             
         return filepath
         
@@ -155,18 +157,11 @@ def get_html_file(analysis_id: str) -> Optional[str]:
         Optional[str]: 파일 경로 (없으면 None)
     """
     try:
-        # 분석 ID로 시작하는 가장 최근 파일 찾기
-        files = [
-            f for f in os.listdir(EXPORT_DIR)
-            if f.startswith(analysis_id) and f.endswith(".html")
-        ]
-        
-        if not files:
+        # 분석 ID의 가장 최근 파일 찾기
+        latest = export_index.latest(analysis_id, "html")
+        if latest is None:
             return None
-            
-        # 가장 최근 파일 반환
-        latest_file = max(files, key=lambda x: os.path.getctime(os.path.join(EXPORT_DIR, x)))
-        return os.path.join(EXPORT_DIR, latest_file)
+        return os.path.join(latest["directory"], latest["filename"])
         
     except Exception as e:
         raise Exception(f"HTML 파일 조회 중 오류 발생: {str(e)}")
@@ -182,16 +177,11 @@ def get_latest_html_file(analysis_id: str) -> Optional[str]:
         Optional[str]: 파일 경로 (파일이 없으면 None)
     """
     try:
-        # exported_reports 디렉토리에서 해당 ID로 시작하는 파일들 찾기
-        files = [f for f in os.listdir(EXPORT_DIR) 
-                if f.startswith(f"{analysis_id}_") and f.endswith(".html")]
-        
-        if not files:
+        # 가장 최근 파일 선택
+        latest = export_index.latest(analysis_id, "html")
+        if latest is None:
             return None
-            
-        # 가장 최근 파일 선택 (타임스탬프가 가장 큰 파일)
-        latest_file = max(files)
-        return os.path.join(EXPORT_DIR, latest_file)
+        return os.path.join(latest["directory"], latest["filename"])
         
     except Exception as e:
         print(f"Error getting latest HTML file: {str(e)}")
@@ -4,13 +4,17 @@ Report Formatting Service using Claude
 
 import json
 import os
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, Optional
 
 from anthropic import Anthropic
 from dotenv import load_dotenv
+from .llm_clients import llm_clients
 
 load_dotenv()
 
+FORMAT_MODEL = "claude-3-opus-20240229"
+FORMAT_MAX_TOKENS = 4000
+
 class Formatter:
     def __init__(self):
         self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
@@ -61,37 +65,67 @@ class Formatter:
             if not self._validate_strategy(strategy):
                 print("Warning: Proceeding with incomplete strategy data")
                 
-            # Prepare prompt
-            prompt = f"""다음 전략 데이터를 전문 리포트처럼 HTML로 정리해줘.
-각 섹션은 <h2> 태그로 제목을 표시하고, 내용은 <p> 태그로 감싸줘.
-전략 데이터:
-{json.dumps(strategy, ensure_ascii=False, indent=2)}
-"""
-            
             # Call Claude API
             response = self.client.messages.create(
-                model="claude-3-opus-20240229",
-                max_tokens=4000,
+                model=FORMAT_MODEL,
+                max_tokens=FORMAT_MAX_TOKENS,
                 messages=[
                     {
                         "role": "user",
-                        "content": prompt
+                        "content": self._build_prompt(strategy)
                     }
                 ]
             )
             
-            # Extract and clean HTML
-            html_content = response.content[0].text.strip()
-            
-            # Ensure proper HTML structure
-            if not html_content.startswith("<h2>"):
-                html_content = f"<h2>전략 개요</h2>\n<p>{html_content}</p>"
-                
-            return html_content
+            return self._clean_html(response.content[0].text)
             
         except Exception as e:
             raise Exception(f"Report formatting failed: {str(e)}")
             
+    async def stream_report(self, strategy: Dict) -> AsyncIterator[Dict]:
+        """
+        Format strategy into an HTML report, forwarding tokens as they arrive
+        
+        Args:
+            strategy: Strategy data to format
+            
+        Yields:
+            {"type": "token", "text": ...} for each delta, then
+            {"type": "done", "html": ...} with the cleaned HTML
+        """
+        if not self._validate_strategy(strategy):
+            print("Warning: Proceeding with incomplete strategy data")
+            
+        async def open_stream() -> AsyncIterator[str]:
+            async with llm_clients.anthropic().messages.stream(
+                model=FORMAT_MODEL,
+                max_tokens=FORMAT_MAX_TOKENS,
+                messages=[{"role": "user", "content": self._build_prompt(strategy)}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                    
+        chunks = []
+        async for text in llm_clients.stream("anthropic", open_stream):
+            chunks.append(text)
+            yield {"type": "token", "text": text}
+        yield {"type": "done", "html": self._clean_html("".join(chunks))}
+        
+    def _build_prompt(self, strategy: Dict) -> str:
+        """Build the report formatting prompt"""
+        return f"""다음 전략 데이터를 전문 리포트처럼 HTML로 정리해줘.
+각 섹션은 <h2> 태그로 제목을 표시하고, 내용은 <p> 태그로 감싸줘.
+전략 데이터:
+{json.dumps(strategy, ensure_ascii=False, indent=2)}
+"""
+        
+    def _clean_html(self, text: str) -> str:
+        """Ensure the report starts with a section heading"""
+        html_content = text.strip()
+        if not html_content.startswith("<h2>"):
+            html_content = f"<h2>전략 개요</h2>\n<p>{html_content}</p>"
+        return html_content
+            
     def generate_html(self, strategy: Dict) -> str:
         """
         Generate complete HTML document from strategy
@@ -1,23 +1,171 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, AsyncIterator, Optional, List
 import openai
-from openai import OpenAI
-import time
+import asyncio
 from ..config import Config
+from .single_flight import single_flight
+from .llm_clients import llm_clients, LLM_MAX_RETRIES, backoff_delay
+from .llm_cache import llm_response_cache, llm_cache_key, LLM_CACHE_TTL
 
 class GPTCaller:
     def __init__(self):
         """Initialize GPT caller with configuration"""
         Config.validate_api_keys()
         self.config = Config.get_openai_config()
-        self.client = OpenAI(api_key=self.config["api_key"])
+        self.client = llm_clients.openai()
     
+    def _request_key(
+        self,
+        prompt: str,
+        system: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> str:
+        """Build a key identifying identical GPT requests"""
+        return llm_cache_key(
+            "gpt",
+            self.config["model"],
+            system,
+            prompt,
+            temperature or self.config["temperature"],
+            max_tokens or self.config["max_tokens"]
+        )
+
     async def call(
         self,
         prompt: str,
         system: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        cache_ttl: Optional[int] = None,
+        bypass_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Call GPT API, serving repeated requests from the response cache and
+        sharing one in-flight request between identical concurrent calls
+        
+        Args:
+            prompt: The user's prompt
+            system: Optional system message
+            temperature: Optional temperature parameter
+            max_tokens: Optional max tokens parameter
+            timeout: Optional timeout in seconds
+            cache_ttl: Optional cache TTL in seconds for this call site
+            bypass_cache: Skip the cache and in-flight sharing to get a fresh sample
+            
+        Returns:
+            Dictionary containing the API response
+        """
+        key = self._request_key(prompt, system, temperature, max_tokens)
+        ttl_seconds = cache_ttl or LLM_CACHE_TTL["gpt"]
+        if bypass_cache:
+            response = await llm_response_cache.get_or_call(
+                key,
+                lambda: self._call(prompt, system, temperature, max_tokens, timeout),
+                ttl_seconds,
+                bypass=True
+            )
+            return dict(response)
+
+        response, _ = await single_flight.do(
+            key,
+            lambda: llm_response_cache.get_or_call(
+                key,
+                lambda: self._call(prompt, system, temperature, max_tokens, timeout),
+                ttl_seconds
+            )
+        )
+        return dict(response)
+
+    async def stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[int] = None,
+        cache_ttl: Optional[int] = None,
+        bypass_cache: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        Stream GPT API text deltas as they arrive.
+        A cached response is replayed as a single chunk; a completed stream is cached
+        under the same key as call().
+        
+        Args:
+            prompt: The user's prompt
+            system: Optional system message
+            temperature: Optional temperature parameter
+            max_tokens: Optional max tokens parameter
+            timeout: Optional timeout in seconds
+            cache_ttl: Optional cache TTL in seconds for this call site
+            bypass_cache: Skip the cache lookup to get a fresh sample
+            
+        Yields:
+            Text deltas of the response
+        """
+        key = self._request_key(prompt, system, temperature, max_tokens)
+        if not bypass_cache:
+            cached = await asyncio.to_thread(llm_response_cache.get, key)
+            if cached is not None:
+                yield cached["content"]
+                return
+
+        params = self._params(prompt, system, temperature, max_tokens, timeout)
+
+        async def open_stream() -> AsyncIterator[str]:
+            stream = await self.client.chat.completions.create(stream=True, **params)
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+
+        chunks: List[str] = []
+        try:
+            async for text in llm_clients.stream("openai", open_stream):
+                chunks.append(text)
+                yield text
+        except openai.APITimeoutError as e:
+            raise TimeoutError(f"OpenAI API timeout: {str(e)}")
+        except openai.APIError as e:
+            raise ValueError(f"OpenAI API error: {str(e)}")
+
+        await asyncio.to_thread(
+            llm_response_cache.set,
+            key,
+            {"content": "".join(chunks), "usage": None, "model": self.config["model"]},
+            cache_ttl or LLM_CACHE_TTL["gpt"]
+        )
+
+    def _params(
+        self,
+        prompt: str,
+        system: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        timeout: Optional[int]
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters"""
+        messages: List[Dict[str, str]] = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        return {
+            "model": self.config["model"],
+            "messages": messages,
+            "temperature": temperature or self.config["temperature"],
+            "max_tokens": max_tokens or self.config["max_tokens"],
+            "timeout": timeout or self.config["timeout"]
+        }
+
+    async def _call(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[int] = None,
+        max_retries: int = LLM_MAX_RETRIES
     ) -> Dict[str, Any]:
         """
         Call GPT API with the given parameters
@@ -28,6 +176,7 @@ class GPTCaller:
             temperature: Optional temperature parameter
             max_tokens: Optional max tokens parameter
             timeout: Optional timeout in seconds
+            max_retries: Retries on transient errors (0 when the caller fails over itself)
             
         Returns:
             Dictionary containing the API response
@@ -37,17 +186,11 @@ class GPTCaller:
             TimeoutError: If the API call times out
         """
         try:
-            messages: List[Dict[str, str]] = []
-            if system:
-                messages.append({"role": "system", "content": system})
-            messages.append({"role": "user", "content": prompt})
-            
-            response = await self.client.chat.completions.create(
-                model=self.config["model"],
-                messages=messages,
-                temperature=temperature or self.config["temperature"],
-                max_tokens=max_tokens or self.config["max_tokens"],
-                timeout=timeout or self.config["timeout"]
+            params = self._params(prompt, system, temperature, max_tokens, timeout)
+            response = await llm_clients.request(
+                "openai",
+                lambda: self.client.chat.completions.create(**params),
+                max_retries=max_retries
             )
             
             return {
@@ -56,12 +199,12 @@ class GPTCaller:
                 "model": response.model
             }
             
-        except openai.APIError as e:
-            raise ValueError(f"OpenAI API error: {str(e)}")
         except openai.APITimeoutError as e:
             raise TimeoutError(f"OpenAI API timeout: {str(e)}")
         except openai.AuthenticationError as e:
             raise ValueError(f"OpenAI API authentication error: {str(e)}")
+        except openai.APIError as e:
+            raise ValueError(f"OpenAI API error: {str(e)}")
         except Exception as e:
             raise ValueError(f"Unexpected error in GPT API call: {str(e)}")
     
@@ -102,5 +245,5 @@ class GPTCaller:
             except (ValueError, TimeoutError) as e:
                 if attempt == max_retries - 1:
                     raise
-                time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
+                await asyncio.sleep(backoff_delay(attempt, base=retry_delay))  # Exponential backoff with jitter
         raise ValueError("Maximum retry attempts reached") 
\ No newline at end of file
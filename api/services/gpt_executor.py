@@ -1,15 +1,12 @@
 import os
 import logging
-from typing import Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import openai
-from openai import AsyncOpenAI
+from .llm_clients import llm_clients
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-# OpenAI 클라이언트 초기화
-client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
 # 프롬프트 템플릿
 EXECUTION_STRATEGY_PROMPT = """
 너는 마케팅 콘텐츠 기획 전문가야. 다음 텍스트를 기반으로 콘텐츠 실행 전략을 3단계로 설계해.
@@ -26,6 +23,95 @@ FLOW: ...
 CTA: ...
 """
 
+EXECUTION_SYSTEM_PROMPT = "You are a marketing content strategy expert."
+
+# 섹션 헤더와 섹션 키
+SECTION_HEADERS = [("HOOK:", "hook"), ("FLOW:", "flow"), ("CTA:", "cta")]
+
+class ExecutionSectionParser:
+    """
+    GPT 응답을 줄 단위로 읽으며 HOOK/FLOW/CTA 섹션을 분리합니다.
+    다음 섹션 헤더가 나타나면 이전 섹션이 완료된 것으로 보고 바로 반환하므로,
+    스트리밍 응답을 조각 단위로 넣어도 섹션이 끝나는 즉시 받을 수 있습니다.
+    """
+
+    def __init__(self):
+        self.sections: Dict[str, str] = {}
+        self._buffer = ""
+        self._current_section: Optional[str] = None
+        self._current_content: List[str] = []
+
+    def feed(self, text: str) -> List[Tuple[str, str]]:
+        """
+        텍스트 조각을 추가합니다.
+
+        Args:
+            text: 응답 텍스트 조각
+
+        Returns:
+            List[Tuple[str, str]]: 이번 조각으로 완료된 (섹션 키, 내용) 목록
+        """
+        self._buffer += text
+        completed = []
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            completed.extend(self._process_line(line))
+        return completed
+
+    def finish(self) -> List[Tuple[str, str]]:
+        """
+        남은 텍스트를 처리하고 마지막 섹션을 완료합니다.
+
+        Returns:
+            List[Tuple[str, str]]: 완료된 (섹션 키, 내용) 목록
+        """
+        completed = self._process_line(self._buffer)
+        self._buffer = ""
+        if self._current_section:
+            completed.append(self._complete_section())
+        return completed
+
+    def _process_line(self, line: str) -> List[Tuple[str, str]]:
+        line = line.strip()
+        for header, section in SECTION_HEADERS:
+            if line.startswith(header):
+                completed = [self._complete_section()] if self._current_section else []
+                self._current_section = section
+                self._current_content = [line[len(header):].strip()]
+                return completed
+        if self._current_section and line:
+            self._current_content.append(line)
+        return []
+
+    def _complete_section(self) -> Tuple[str, str]:
+        section = self._current_section
+        self.sections[section] = '\n'.join(self._current_content)
+        self._current_section = None
+        self._current_content = []
+        return section, self.sections[section]
+
+    def result(self) -> Tuple[str, str, str]:
+        """
+        파싱된 (hook, flow, cta)를 반환합니다.
+
+        Raises:
+            ValueError: 필수 섹션이 없을 때
+        """
+        required_sections = {'hook', 'flow', 'cta'}
+        if not all(section in self.sections for section in required_sections):
+            raise ValueError("Missing required sections in GPT response")
+        return self.sections['hook'], self.sections['flow'], self.sections['cta']
+
+def _execution_params(input_text: str) -> Dict:
+    return {
+        "model": "gpt-4",
+        "messages": [
+            {"role": "system", "content": EXECUTION_SYSTEM_PROMPT},
+            {"role": "user", "content": EXECUTION_STRATEGY_PROMPT.format(input_text=input_text)}
+        ],
+        "temperature": 0.7
+    }
+
 async def generate_execution_strategy(input_text: str) -> Tuple[str, str, str]:
     """
     입력 텍스트를 기반으로 HOOK, FLOW, CTA 실행 전략을 생성합니다.
@@ -44,13 +130,9 @@ async def generate_execution_strategy(input_text: str) -> Tuple[str, str, str]:
         logger.info("Starting execution strategy generation")
         
         # GPT API 호출
-        response = await client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are a marketing content strategy expert."},
-                {"role": "user", "content": EXECUTION_STRATEGY_PROMPT.format(input_text=input_text)}
-            ],
-            temperature=0.7
+        response = await llm_clients.request(
+            "openai",
+            lambda: llm_clients.openai().chat.completions.create(**_execution_params(input_text))
         )
         
         content = response.choices[0].message.content
@@ -58,40 +140,13 @@ async def generate_execution_strategy(input_text: str) -> Tuple[str, str, str]:
         
         # 응답 파싱
         try:
-            # 각 섹션을 추출
-            sections = {}
-            current_section = None
-            current_content = []
-            
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('HOOK:'):
-                    current_section = 'hook'
-                    current_content = [line[5:].strip()]
-                elif line.startswith('FLOW:'):
-                    if current_section:
-                        sections[current_section] = '\n'.join(current_content)
-                    current_section = 'flow'
-                    current_content = [line[5:].strip()]
-                elif line.startswith('CTA:'):
-                    if current_section:
-                        sections[current_section] = '\n'.join(current_content)
-                    current_section = 'cta'
-                    current_content = [line[4:].strip()]
-                elif current_section and line:
-                    current_content.append(line)
-            
-            # 마지막 섹션 저장
-            if current_section:
-                sections[current_section] = '\n'.join(current_content)
-            
-            # 필수 섹션 확인
-            required_sections = {'hook', 'flow', 'cta'}
-            if not all(section in sections for section in required_sections):
-                raise ValueError("Missing required sections in GPT response")
+            parser = ExecutionSectionParser()
+            parser.feed(content)
+            parser.finish()
+            hook, flow, cta = parser.result()
             
             logger.info("Successfully parsed GPT response")
-            return sections['hook'], sections['flow'], sections['cta']
+            return hook, flow, cta
             
         except Exception as e:
             logger.error(f"Error parsing GPT response: {str(e)}")
@@ -99,4 +154,40 @@ async def generate_execution_strategy(input_text: str) -> Tuple[str, str, str]:
             
     except Exception as e:
         logger.error(f"Error generating execution strategy: {str(e)}")
-        raise Exception(f"Failed to generate execution strategy: {str(e)}") 
\ No newline at end of file
+        raise Exception(f"Failed to generate execution strategy: {str(e)}")
+
+async def stream_execution_strategy(input_text: str) -> AsyncIterator[Dict]:
+    """
+    HOOK, FLOW, CTA 실행 전략을 스트리밍으로 생성합니다.
+    토큰은 도착하는 대로, 각 섹션은 완료되는 즉시 전달합니다.
+    
+    Args:
+        input_text: Claude로 분석된 핵심 욕구 요약 텍스트
+        
+    Yields:
+        Dict: {"type": "token", "text": ...}, {"type": "section", "name": ..., "content": ...},
+              마지막으로 {"type": "done", "hook": ..., "flow": ..., "cta": ...}
+        
+    Raises:
+        ValueError: 필수 섹션이 없을 때
+    """
+    logger.info("Starting execution strategy streaming")
+    parser = ExecutionSectionParser()
+
+    async def open_stream() -> AsyncIterator[str]:
+        stream = await llm_clients.openai().chat.completions.create(stream=True, **_execution_params(input_text))
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+
+    async for text in llm_clients.stream("openai", open_stream):
+        yield {"type": "token", "text": text}
+        for name, content in parser.feed(text):
+            yield {"type": "section", "name": name, "content": content}
+    for name, content in parser.finish():
+        yield {"type": "section", "name": name, "content": content}
+
+    hook, flow, cta = parser.result()
+    logger.info("Execution strategy streaming completed")
+    yield {"type": "done", "hook": hook, "flow": flow, "cta": cta}
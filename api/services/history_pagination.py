@@ -0,0 +1,155 @@
+"""
+Keyset (cursor) pagination and per-user counters for history tables
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import func, tuple_, update
+from sqlalchemy.orm import Query, Session, load_only
+from sqlalchemy.orm.attributes import set_committed_value
+
+from api.models.history import HistoryCounter, build_result_summary
+
+logger = logging.getLogger(__name__)
+
+# 목록 조회 시 input_text 미리보기 최대 길이
+HISTORY_PREVIEW_LENGTH = 100
+
+def encode_cursor(created_at: datetime, record_id: str) -> str:
+    """
+    마지막 행의 (created_at, id)를 다음 페이지 커서 문자열로 만듭니다.
+
+    Args:
+        created_at (datetime): 마지막 행의 생성 시각
+        record_id (str): 마지막 행의 ID
+
+    Returns:
+        str: URL에 그대로 쓸 수 있는 커서
+    """
+    payload = json.dumps([created_at.isoformat(), record_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    커서 문자열을 (created_at, id)로 되돌립니다.
+
+    Args:
+        cursor (str): encode_cursor로 만든 커서
+
+    Returns:
+        Tuple[datetime, str]: (생성 시각, ID)
+
+    Raises:
+        HTTPException: 커서 형식이 잘못된 경우 (400)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), str(record_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+def paginate_latest(query: Query, model: Any, cursor: Optional[str], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    (created_at, id) 내림차순으로 커서 이후의 한 페이지를 조회합니다.
+    OFFSET 없이 (user_id, created_at, id) 인덱스를 따라 바로 시작 위치로 이동하므로 어느 페이지든 첫 페이지와 비용이 같습니다.
+
+    Args:
+        query (Query): user_id 등으로 필터링된 조회
+        model (Any): created_at, id 컬럼을 가진 모델
+        cursor (Optional[str]): 이전 페이지의 next_cursor (첫 페이지는 None)
+        limit (int): 페이지 크기
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: (행 목록, 다음 페이지 커서 또는 마지막 페이지면 None)
+    """
+    if cursor:
+        created_at, record_id = decode_cursor(cursor)
+        query = query.filter(tuple_(model.created_at, model.id) < tuple_(created_at, record_id))
+
+    # 다음 페이지 존재 여부를 알기 위해 한 행 더 조회
+    rows = query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+def get_history_count(db: Session, model: Any, user_id: str) -> int:
+    """
+    사용자의 이력 개수를 카운터 테이블에서 읽습니다.
+    카운터는 행 추가/삭제 시 같은 트랜잭션에서 upsert로 갱신되고, 도입 전 행은 스키마 업그레이드 때 채워집니다
+    (롤아웃 중 이전 버전 워커가 저장한 행은 schema_migration recount로 반영).
+    카운터가 없는 사용자나 카운터가 등록되지 않은 모델은 COUNT(*)로 계산합니다 (조회만 하고 쓰지 않음).
+
+    Args:
+        db (Session): 데이터베이스 세션
+        model (Any): 이력 모델
+        user_id (str): 사용자 ID
+
+    Returns:
+        int: 이력 개수
+    """
+    if getattr(model, "__history_counted__", False):
+        counter = db.get(HistoryCounter, (user_id, model.__tablename__))
+        if counter is not None:
+            return counter.count
+    return db.query(func.count(model.id)).filter(model.user_id == user_id).scalar()
+
+def summary_projection(query: Query, model: Any, *extra_columns: Any) -> Query:
+    """
+    목록 조회용으로 id, input_text, summary, created_at(과 추가 컬럼)만 읽도록 제한합니다.
+    result_json 등 큰 컬럼은 읽지 않습니다.
+
+    Args:
+        query (Query): 조회
+        model (Any): 이력 모델
+        *extra_columns (Any): 함께 읽을 컬럼
+
+    Returns:
+        Query: 컬럼이 제한된 조회
+    """
+    return query.options(load_only(model.id, model.input_text, model.summary, model.created_at, *extra_columns))
+
+def preview_text(text: str, max_length: int = HISTORY_PREVIEW_LENGTH) -> str:
+    """
+    목록 표시용으로 텍스트를 자릅니다.
+
+    Args:
+        text (str): 원문
+        max_length (int): 최대 길이
+
+    Returns:
+        str: 미리보기 텍스트
+    """
+    if len(text) <= max_length:
+        return text
+    return text[:max_length - 1].rstrip() + "…"
+
+def fill_missing_summaries(db: Session, model: Any, records: List[Any]) -> None:
+    """
+    summary 컬럼 도입 전에 저장된 행의 요약을 만들어 저장합니다.
+    해당 페이지의 빈 행만 result_json을 한 번에 읽으므로 행마다 한 번만 발생합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        model (Any): 이력 모델
+        records (List[Any]): 목록 조회 결과
+    """
+    missing = {record.id: record for record in records if record.summary is None}
+    if not missing:
+        return
+
+    rows = db.query(model.id, model.result_json).filter(model.id.in_(list(missing))).all()
+    summaries = {record_id: build_result_summary(result_json) for record_id, result_json in rows}
+    # 조회 세션을 커밋하면 읽은 행이 만료되므로 별도 트랜잭션으로 저장
+    with db.get_bind().begin() as conn:
+        for record_id, summary in summaries.items():
+            conn.execute(update(model.__table__).where(model.__table__.c.id == record_id).values(summary=summary))
+    for record_id, summary in summaries.items():
+        set_committed_value(missing[record_id], "summary", summary)
+    logger.info(f"[HISTORY] 요약 채움: table={model.__tablename__}, {len(rows)}개")
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  # HTTP/2 지원 여부 확인용
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# 호스트별 최대 동시 연결 수
+MAX_CONNECTIONS_PER_HOST = int(os.getenv("CRAWL_MAX_CONNECTIONS_PER_HOST", "4"))
+# 유휴 keep-alive 연결 유지 시간 (초)
+KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("CRAWL_KEEPALIVE_EXPIRY", "30"))
+# 기본 요청 제한 시간 (초)
+DEFAULT_TIMEOUT_SECONDS = float(os.getenv("CRAWL_HTTP_TIMEOUT", "5"))
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+class AsyncHttpClient:
+    def __init__(
+        self,
+        max_connections_per_host: int = MAX_CONNECTIONS_PER_HOST,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY_SECONDS,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS
+    ):
+        """
+        크롤러가 공유하는 비동기 HTTP 클라이언트를 초기화합니다.
+        호스트마다 별도의 연결 풀을 두어 keep-alive 연결(및 DNS 조회 결과)을 재사용하고,
+        호스트별 동시 요청 수를 제한합니다.
+
+        Args:
+            max_connections_per_host (int): 호스트별 최대 동시 연결 수
+            keepalive_expiry (float): 유휴 연결 유지 시간 (초 단위)
+            timeout (float): 기본 요청 제한 시간 (초 단위)
+        """
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self, host: str) -> httpx.AsyncClient:
+        """
+        호스트 전용 연결 풀을 반환합니다. 없으면 새로 생성합니다.
+
+        Args:
+            host (str): 요청 대상 호스트
+
+        Returns:
+            httpx.AsyncClient: 호스트 전용 클라이언트
+        """
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_host,
+                    max_keepalive_connections=self.max_connections_per_host,
+                    keepalive_expiry=self.keepalive_expiry
+                )
+            )
+            self._clients[host] = client
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+            logger.info(f"[HTTP] 연결 풀 생성: host={host}, http2={HTTP2_AVAILABLE}")
+        return client
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> httpx.Response:
+        """
+        이벤트 루프를 막지 않고 GET 요청을 수행합니다.
+
+        Args:
+            url (str): 요청 URL
+            params (Optional[Dict[str, Any]]): 쿼리 파라미터
+            headers (Optional[Dict[str, str]]): 추가 요청 헤더
+            timeout (Optional[float]): 요청 제한 시간 (기본값: 클라이언트 설정)
+
+        Returns:
+            httpx.Response: 응답 객체
+
+        Raises:
+            httpx.TimeoutException: 요청 시간 초과 시
+            httpx.HTTPError: 요청 실패 시
+        """
+        host = urlsplit(url).netloc
+        client = self._get_client(host)
+        async with self._host_semaphores[host]:
+            return await client.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=timeout if timeout is not None else self.timeout
+            )
+
+    async def aclose(self) -> None:
+        """모든 호스트 연결 풀을 닫습니다."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+        self._host_semaphores.clear()
+
+# 전역 AsyncHttpClient 인스턴스 생성
+http_client = AsyncHttpClient()
@@ -0,0 +1,231 @@
+"""
+Handlers for background jobs run by job workers
+"""
+
+import asyncio
+import json
+import logging
+import os
+import zipfile
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+# 파일 결과(ZIP 등)를 저장할 디렉토리
+JOB_RESULT_DIR = os.getenv("JOB_RESULT_DIR", "job_results")
+
+JobHandler = Callable[[str, Dict[str, Any], int], Awaitable[Dict[str, Any]]]
+
+async def run_full_analysis(job_id: str, payload: Dict[str, Any], attempt: int) -> Dict[str, Any]:
+    """
+    분석 → 전략 → 카피 → 리포트 파이프라인을 실행하고 크레딧을 차감합니다.
+
+    Args:
+        job_id (str): 작업 ID
+        payload (Dict[str, Any]): input_text, channels, user_id
+        attempt (int): 시도 번호 (1부터, 재시도마다 증가)
+
+    Returns:
+        Dict[str, Any]: copy, report_html, timings, meta(prompt 패킹 정보), final_credit
+    """
+    from api.services.analysis_pipeline import build_analysis_pipeline
+    from api.services.credit_manager import CreditManager
+
+    stage_results, timings = await build_analysis_pipeline(
+        f"full_analysis_job:{job_id}",
+        payload["input_text"]
+    ).run()
+
+    credit_info = CreditManager().process_request(
+        text=payload["input_text"],
+        community_channels=[],
+        sns_channels=[],
+        user_id=payload["user_id"]
+    )
+    return {
+        "final_credit": credit_info["final_credit"],
+        "from_cache": credit_info.get("from_cache"),
+        "free_trial": credit_info.get("free_trial"),
+        "copy": stage_results["copy"],
+        "report_html": stage_results["report"]["html"],
+        "timings": timings,
+        "meta": {"prompt": stage_results["analysis_call"]["prompt_meta"]}
+    }
+
+async def run_favorites_zip(job_id: str, payload: Dict[str, Any], attempt: int) -> Dict[str, Any]:
+    """
+    즐겨찾기 리포트 HTML을 PDF로 변환해 ZIP 파일로 저장합니다.
+
+    Args:
+        job_id (str): 작업 ID
+        payload (Dict[str, Any]): user_id, documents ([{filename, html}])
+        attempt (int): 시도 번호 (1부터, 재시도마다 증가)
+
+    Returns:
+        Dict[str, Any]: file_path, filename, media_type, document_count, failed_documents
+    """
+    from api.services.pdf_renderer import pdf_renderer
+
+    os.makedirs(JOB_RESULT_DIR, exist_ok=True)
+    # 제한 시간을 넘긴 이전 시도가 아직 쓰고 있을 수 있으므로 시도마다 다른 파일에 저장
+    path = os.path.join(JOB_RESULT_DIR, f"{job_id}-{attempt}.zip")
+    written = 0
+    failed = []
+    # PDF는 이미 압축되어 있으므로 저장(ZIP_STORED)만 함
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zip_file:
+        documents = [(document["filename"], document["html"]) for document in payload["documents"]]
+        async for filename, result in pdf_renderer.iter_rendered_files(documents):
+            if isinstance(result, BaseException):
+                logger.error(f"[JOB] PDF 변환 실패: {filename}, 에러={str(result)}")
+                failed.append({"filename": filename, "error": str(result)})
+                continue
+            await asyncio.to_thread(zip_file.write, result, filename)
+            written += 1
+    if written == 0:
+        os.remove(path)
+        raise ValueError("PDF로 변환된 리포트가 없습니다")
+    return {
+        "file_path": path,
+        "filename": f"favorite_reports_{payload['user_id']}.zip",
+        "media_type": "application/zip",
+        "document_count": written,
+        "failed_documents": failed
+    }
+
+async def run_format_report(job_id: str, payload: Dict[str, Any], attempt: int) -> Dict[str, Any]:
+    """
+    전략/분석/카피를 HTML 리포트로 포맷팅하고 HTML/PDF 파일로 저장합니다.
+
+    Args:
+        job_id (str): 작업 ID
+        payload (Dict[str, Any]): analysis_id, strategy, analysis, copy
+        attempt (int): 시도 번호 (1부터, 재시도마다 증가)
+
+    Returns:
+        Dict[str, Any]: formatted_html, html_filename, pdf_filename
+    """
+    from api.services.exporter import save_result_as_html
+    from api.services.formatter_claude import Formatter
+    from api.services.llm_clients import llm_clients
+    from api.services.pdf_exporter import save_html_as_pdf
+
+    html_result = await llm_clients.run_sync("anthropic", Formatter().generate_html, payload["strategy"])
+    html_filepath = save_result_as_html(payload["analysis_id"], html_result)
+    pdf_path = await save_html_as_pdf(payload["analysis_id"], html_result)
+    if not pdf_path:
+        raise ValueError("PDF 저장 중 오류가 발생했습니다.")
+    return {
+        "formatted_html": html_result,
+        "html_filename": os.path.basename(html_filepath),
+        "pdf_filename": os.path.basename(pdf_path)
+    }
+
+async def run_scheduled_analysis(job_id: str, payload: Dict[str, Any], attempt: int) -> Dict[str, Any]:
+    """
+    같은 예약 그룹의 구독자 전체를 위해 크롤링과 분석을 한 번만 실행하고,
+    구독자별 CrawlHistory/AnalysisHistory에 결과를 저장합니다.
+    크롤링은 일반 요청과 같은 캐시에 저장되므로 이후 같은 검색은 캐시에서 응답됩니다.
+
+    Args:
+        job_id (str): 작업 ID
+        payload (Dict[str, Any]): group_key, input_text, channels, subscribers ([{schedule_id, user_id}])
+        attempt (int): 시도 번호 (1부터, 재시도마다 증가)
+
+    Returns:
+        Dict[str, Any]: 구독자 수, 크롤링 결과 수, 저장한 분석 이력 ID
+    """
+    from api.routes.crawler import CrawlRequest, run_uncached_crawl
+    from api.services.analyzer_claude import Analyzer
+    from api.services.cache_manager import cache_manager
+    from api.db.database import get_db
+    from api.models.history import AnalysisHistory, CrawlHistory
+
+    input_text = payload["input_text"]
+    channels = payload["channels"]
+    subscribers = payload["subscribers"]
+    owner_id = subscribers[0]["user_id"]
+
+    # 예약 실행은 그룹당 한 번 크롤링하며 요청 단위 크레딧은 차감하지 않음
+    crawl = await run_uncached_crawl(
+        CrawlRequest(user_id=owner_id, input_text=input_text, channels=channels),
+        owner_id,
+        sorted(channels),
+        cache_manager.generate_key(input_text, channels),
+        credit_info={"final_credit": 0, "scheduled": True}
+    )
+    analysis = await Analyzer().analyze_texts([result["content"] for result in crawl.results])
+
+    crawl_json = json.dumps(crawl.results, ensure_ascii=False)
+    analysis_json = json.dumps(
+        {"analysis": analysis["content"], "crawl_meta": crawl.meta, "scheduled_job_id": job_id},
+        ensure_ascii=False
+    )
+    db_session = get_db()
+    db = next(db_session)
+    try:
+        analysis_ids = {}
+        for subscriber in subscribers:
+            db.add(CrawlHistory(
+                user_id=subscriber["user_id"],
+                input_text=input_text,
+                channels=json.dumps(channels),
+                result_count=len(crawl.results),
+                result_json=crawl_json
+            ))
+            record = AnalysisHistory(
+                user_id=subscriber["user_id"],
+                input_text=input_text,
+                result_json=analysis_json
+            )
+            db.add(record)
+            db.flush()
+            analysis_ids[subscriber["schedule_id"]] = record.id
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db_session.close()
+
+    logger.info(f"[JOB] 예약 분석 완료: 그룹={payload['group_key'][:12]}, 구독자 {len(subscribers)}명")
+    return {
+        "subscriber_count": len(subscribers),
+        "result_count": len(crawl.results),
+        "analysis_ids": analysis_ids
+    }
+
+async def run_batch_analysis(job_id: str, payload: Dict[str, Any], attempt: int) -> Dict[str, Any]:
+    """
+    업로드된 텍스트를 묶음 단위로 분석합니다. 묶음이 끝날 때마다 진행률과 중간 결과를 작업 큐에 저장합니다.
+
+    Args:
+        job_id (str): 작업 ID
+        payload (Dict[str, Any]): texts
+        attempt (int): 시도 번호 (1부터, 재시도마다 증가)
+
+    Returns:
+        Dict[str, Any]: total_texts, total_chunks, completed_chunks, failed_chunks, analysis
+    """
+    from api.services.analyzer_claude import Analyzer
+    from api.services.batch_analysis import build_batch_progress
+    from api.services.job_queue import job_queue
+
+    texts = payload["texts"]
+    chunk_count = {"total": 0}
+
+    def on_progress(combined: Dict[str, Any], completed: int, total: int) -> None:
+        chunk_count["total"] = total
+        job_queue.update_progress(job_id, build_batch_progress(len(texts), combined, completed, total))
+
+    combined = await Analyzer().analyze_multiple_texts(texts, on_progress=on_progress)
+    logger.info(f"[JOB] 배치 분석 완료: 텍스트 {len(texts)}개, 실패 묶음 {combined['failed_chunks']}/{chunk_count['total']}개")
+    return build_batch_progress(len(texts), combined, chunk_count["total"], chunk_count["total"])
+
+# 작업 종류별 처리 함수
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    "full_analysis": run_full_analysis,
+    "favorites_zip": run_favorites_zip,
+    "format_report": run_format_report,
+    "scheduled_analysis": run_scheduled_analysis,
+    "batch_analysis": run_batch_analysis
+}
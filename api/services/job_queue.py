@@ -0,0 +1,298 @@
+"""
+SQLite-backed job queue shared by web workers and background job workers
+"""
+
+import json
+import os
+import random
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from uuid import uuid4
+
+# 작업 큐 저장 위치 (웹 워커와 작업 워커가 같은 파일을 공유)
+JOB_QUEUE_PATH = os.getenv("JOB_QUEUE_PATH", "cache/jobs.sqlite3")
+# 작업당 기본 최대 시도 횟수
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# 이 시간(초)보다 오래 running 상태인 작업은 워커가 죽은 것으로 보고 다시 대기열에 넣음
+JOB_TIMEOUT = int(os.getenv("JOB_TIMEOUT", "900"))
+# 재시도 대기 시간 (지수 백오프, 초)
+JOB_RETRY_BASE = float(os.getenv("JOB_RETRY_BASE", "5"))
+JOB_RETRY_MAX = float(os.getenv("JOB_RETRY_MAX", "300"))
+# 완료/실패한 작업 보관 시간 (초)
+JOB_RETENTION = int(os.getenv("JOB_RETENTION", str(7 * 24 * 3600)))
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+class JobQueue:
+    def __init__(self, path: str = JOB_QUEUE_PATH):
+        """
+        SQLite 파일 기반 작업 큐를 초기화합니다.
+        여러 프로세스가 같은 파일로 작업을 넣고 가져가며, 가져가기는 쓰기 잠금 안에서 처리해 중복 실행을 막습니다.
+
+        Args:
+            path (str): SQLite 파일 경로
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    user_id TEXT,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    worker TEXT,
+                    created_at REAL NOT NULL,
+                    available_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_available ON jobs (status, available_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(
+        self,
+        job_type: str,
+        payload: Dict[str, Any],
+        user_id: Optional[str] = None,
+        max_attempts: int = JOB_MAX_ATTEMPTS
+    ) -> str:
+        """
+        작업을 대기열에 추가합니다.
+
+        Args:
+            job_type (str): 작업 종류 (job_handlers.JOB_HANDLERS 키)
+            payload (Dict[str, Any]): JSON으로 직렬화 가능한 작업 입력
+            user_id (Optional[str]): 작업을 요청한 사용자 ID
+            max_attempts (int): 최대 시도 횟수
+
+        Returns:
+            str: 작업 ID
+        """
+        job_id = str(uuid4())
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, job_type, user_id, payload, status, max_attempts, created_at, available_at) "
+                "VALUES (?, ?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, job_type, user_id, json.dumps(payload, ensure_ascii=False, default=str), max_attempts, now, now)
+            )
+        return job_id
+
+    def claim(self, worker: str) -> Optional[Dict[str, Any]]:
+        """
+        실행할 수 있는 가장 오래된 작업 하나를 running 상태로 바꿔 가져옵니다.
+        제한 시간을 넘긴 running 작업(워커 종료 등)은 먼저 다시 대기열로 돌립니다.
+
+        Args:
+            worker (str): 작업을 가져가는 워커 이름
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 (payload 포함) 또는 None
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL, error = 'worker timeout' "
+                "WHERE status = 'running' AND started_at < ? AND attempts < max_attempts",
+                (now - JOB_TIMEOUT,)
+            )
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'worker timeout', finished_at = ? "
+                "WHERE status = 'running' AND started_at < ?",
+                (now, now - JOB_TIMEOUT)
+            )
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' AND available_at <= ? "
+                "ORDER BY available_at ASC LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker = ?, started_at = ? WHERE id = ?",
+                (worker, now, row["id"])
+            )
+            conn.execute("COMMIT")
+        job = self._to_dict(row, include_payload=True)
+        job.update({"status": "running", "attempts": row["attempts"] + 1, "worker": worker, "started_at": now})
+        return job
+
+    def complete(self, job_id: str, result: Any, worker: str, attempt: int) -> bool:
+        """
+        작업을 성공으로 표시하고 결과를 저장합니다.
+        제한 시간을 넘겨 다른 워커가 다시 가져간 작업이면 늦게 끝난 이전 시도의 결과는 기록하지 않습니다.
+
+        Args:
+            job_id (str): 작업 ID
+            result (Any): JSON으로 직렬화 가능한 작업 결과
+            worker (str): 작업을 가져간 워커 이름 (claim 결과의 worker)
+            attempt (int): 가져간 시도 번호 (claim 결과의 attempts)
+
+        Returns:
+            bool: 결과를 기록했는지 여부 (이 시도가 더 이상 작업을 소유하지 않으면 False)
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'succeeded', result = ?, error = NULL, finished_at = ? "
+                "WHERE id = ? AND status = 'running' AND worker = ? AND attempts = ?",
+                (json.dumps(result, ensure_ascii=False, default=str), time.time(), job_id, worker, attempt)
+            )
+        return cursor.rowcount > 0
+
+    def update_progress(self, job_id: str, result: Any) -> None:
+        """
+        실행 중인 작업의 중간 결과를 저장합니다 (진행률 조회용, 완료 시 complete가 덮어씀).
+
+        Args:
+            job_id (str): 작업 ID
+            result (Any): JSON으로 직렬화 가능한 중간 결과
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET result = ? WHERE id = ? AND status = 'running'",
+                (json.dumps(result, ensure_ascii=False, default=str), job_id)
+            )
+
+    def fail(self, job_id: str, error: str, worker: str, attempt: int) -> Optional[str]:
+        """
+        작업 실패를 기록합니다. 시도 횟수가 남아 있으면 백오프 후 다시 대기열에 넣습니다.
+        제한 시간을 넘겨 다른 워커가 다시 가져간 작업이면 이전 시도의 실패는 기록하지 않습니다.
+
+        Args:
+            job_id (str): 작업 ID
+            error (str): 오류 메시지
+            worker (str): 작업을 가져간 워커 이름 (claim 결과의 worker)
+            attempt (int): 가져간 시도 번호 (claim 결과의 attempts)
+
+        Returns:
+            Optional[str]: 변경된 상태 ("queued" 또는 "failed"), 이 시도가 더 이상 작업을 소유하지 않으면 None
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs "
+                "WHERE id = ? AND status = 'running' AND worker = ? AND attempts = ?",
+                (job_id, worker, attempt)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            if row["attempts"] < row["max_attempts"]:
+                delay = random.uniform(0, min(JOB_RETRY_MAX, JOB_RETRY_BASE * (2 ** row["attempts"])))
+                conn.execute(
+                    "UPDATE jobs SET status = 'queued', error = ?, worker = NULL, available_at = ? WHERE id = ?",
+                    (error, now + delay, job_id)
+                )
+                status = "queued"
+            else:
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                    (error, now, job_id)
+                )
+                status = "failed"
+            conn.execute("COMMIT")
+        return status
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태와 결과를 조회합니다 (입력 payload 제외).
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 또는 None
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def purge_finished(self, retention: int = JOB_RETENTION) -> int:
+        """
+        보관 시간이 지난 완료/실패 작업과 작업이 남긴 결과 파일(result.file_path)을 삭제합니다.
+
+        Args:
+            retention (int): 보관 시간 (초)
+
+        Returns:
+            int: 삭제한 작업 수
+        """
+        cutoff = time.time() - retention
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT id, result FROM jobs WHERE status IN ('succeeded', 'failed') AND finished_at < ?",
+                (cutoff,)
+            ).fetchall()
+            conn.executemany("DELETE FROM jobs WHERE id = ?", [(row["id"],) for row in rows])
+            conn.execute("COMMIT")
+
+        for row in rows:
+            result = json.loads(row["result"]) if row["result"] else None
+            file_path = result.get("file_path") if isinstance(result, dict) else None
+            if file_path:
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+        return len(rows)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        상태별 작업 수를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 상태별 작업 수
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        stats = {status: 0 for status in JOB_STATUSES}
+        stats.update({status: count for status, count in rows})
+        return stats
+
+    def _to_dict(self, row: sqlite3.Row, include_payload: bool = False) -> Dict[str, Any]:
+        job = {
+            "job_id": row["id"],
+            "job_type": row["job_type"],
+            "user_id": row["user_id"],
+            "status": row["status"],
+            "attempts": row["attempts"],
+            "max_attempts": row["max_attempts"],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "worker": row["worker"],
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"]
+        }
+        if include_payload:
+            job["payload"] = json.loads(row["payload"])
+        return job
+
+# 전역 JobQueue 인스턴스 생성
+job_queue = JobQueue()
@@ -0,0 +1,174 @@
+"""
+Background job workers running in separate processes
+
+Run standalone (e.g. with JOB_WORKER_COUNT=0 on the web server):
+    python -m api.services.job_worker
+"""
+
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import socket
+from typing import Any, List, Optional
+
+from .job_queue import JobQueue, JOB_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# 웹 서버와 함께 띄울 작업 워커 프로세스 수 (0이면 별도로 실행)
+JOB_WORKER_COUNT = int(os.getenv("JOB_WORKER_COUNT", "2"))
+# 프로세스당 동시에 실행할 작업 수
+JOB_WORKER_CONCURRENCY = int(os.getenv("JOB_WORKER_CONCURRENCY", "2"))
+# 대기열이 비었을 때 다시 확인하기까지 대기 시간 (초)
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+# 보관 시간이 지난 작업과 결과 파일을 정리하는 주기 (초)
+JOB_PURGE_INTERVAL = float(os.getenv("JOB_PURGE_INTERVAL", "3600"))
+
+async def _worker_loop(worker_name: str, stop_event) -> None:
+    from .job_handlers import JOB_HANDLERS
+
+    queue = JobQueue()
+
+    async def run_slot(slot: int) -> None:
+        name = f"{worker_name}/{slot}"
+        while not stop_event.is_set():
+            job = await asyncio.to_thread(queue.claim, name)
+            if job is None:
+                await asyncio.sleep(JOB_POLL_INTERVAL)
+                continue
+
+            job_id = job["job_id"]
+            attempt = job["attempts"]
+            logger.info(f"[JOB_WORKER][{name}] 작업 시작: {job['job_type']} {job_id} ({attempt}번째 시도)")
+            try:
+                handler = JOB_HANDLERS[job["job_type"]]
+                result = await asyncio.wait_for(handler(job_id, job["payload"], attempt), timeout=JOB_TIMEOUT)
+            except Exception as e:
+                error = f"{type(e).__name__}: {str(e)}"
+                status = await asyncio.to_thread(queue.fail, job_id, error, name, attempt)
+                if status is None:
+                    logger.warning(f"[JOB_WORKER][{name}] 다른 시도가 가져간 작업의 실패는 기록하지 않음: {job_id}, 에러={error}")
+                else:
+                    logger.error(f"[JOB_WORKER][{name}] 작업 실패: {job_id}, 상태={status}, 에러={error}")
+                continue
+            if not await asyncio.to_thread(queue.complete, job_id, result, name, attempt):
+                # 이 시도의 결과 파일은 어느 작업 기록에도 남지 않으므로 purge 대상이 아님 → 바로 삭제
+                file_path = result.get("file_path") if isinstance(result, dict) else None
+                if file_path and os.path.exists(file_path):
+                    os.remove(file_path)
+                logger.warning(f"[JOB_WORKER][{name}] 다른 시도가 가져간 작업의 결과는 버림: {job_id} ({attempt}번째 시도)")
+                continue
+            logger.info(f"[JOB_WORKER][{name}] 작업 완료: {job_id}")
+
+    async def purge_loop() -> None:
+        # 여러 워커가 동시에 실행해도 같은 작업을 두 번 지우지 않음 (쓰기 잠금 안에서 삭제)
+        while not stop_event.is_set():
+            try:
+                purged = await asyncio.to_thread(queue.purge_finished)
+                if purged:
+                    logger.info(f"[JOB_WORKER][{worker_name}] 보관 기간이 지난 작업 {purged}개 정리")
+            except Exception as e:
+                logger.error(f"[JOB_WORKER][{worker_name}] 작업 정리 실패: {str(e)}")
+            for _ in range(int(JOB_PURGE_INTERVAL / JOB_POLL_INTERVAL) or 1):
+                if stop_event.is_set():
+                    break
+                await asyncio.sleep(JOB_POLL_INTERVAL)
+
+    await asyncio.gather(purge_loop(), *(run_slot(slot) for slot in range(JOB_WORKER_CONCURRENCY)))
+
+def run_worker(worker_name: str, stop_event) -> None:
+    """
+    작업 워커 프로세스의 진입점입니다. stop_event가 설정될 때까지 작업을 가져와 실행합니다.
+
+    Args:
+        worker_name (str): 워커 이름 (작업 기록에 남음)
+        stop_event: 종료 신호 (multiprocessing.Event)
+    """
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_worker_loop(worker_name, stop_event))
+    finally:
+        # 작업 중 띄운 PDF 렌더링 프로세스 풀 정리
+        from .pdf_renderer import pdf_renderer
+        pdf_renderer.shutdown()
+
+class JobWorkerPool:
+    def __init__(self, worker_count: int = JOB_WORKER_COUNT):
+        """
+        작업 워커 프로세스 풀을 초기화합니다.
+        LLM 호출과 PDF 렌더링을 웹 워커 밖에서 처리해 웹 워커가 빠른 요청에 집중하도록 합니다.
+
+        Args:
+            worker_count (int): 워커 프로세스 수
+        """
+        self.worker_count = worker_count
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event: Optional[Any] = None
+        self._processes: List[multiprocessing.Process] = []
+
+    def start(self) -> None:
+        """워커 프로세스를 시작합니다 (이미 실행 중이면 무시)."""
+        if self._processes or self.worker_count <= 0:
+            return
+        self._stop_event = self._context.Event()
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        for index in range(self.worker_count):
+            process = self._context.Process(
+                target=run_worker,
+                args=(f"{prefix}:{index}", self._stop_event),
+                name=f"job-worker-{index}",
+                # 작업 안에서 PDF 렌더링 프로세스 풀을 띄우므로 daemon 프로세스로 만들 수 없음
+                daemon=False
+            )
+            process.start()
+            self._processes.append(process)
+        # daemon이 아니므로 shutdown 이벤트 없이 종료될 때도 워커를 멈춰 인터프리터 종료가 막히지 않게 함
+        atexit.register(self.stop)
+        logger.info(f"[JOB_WORKER] 워커 프로세스 {self.worker_count}개 시작")
+
+    def stop(self, timeout: float = 10) -> None:
+        """
+        워커에 종료 신호를 보내고 기다립니다. 제한 시간 안에 끝나지 않으면 강제 종료합니다.
+        (실행 중이던 작업은 JOB_TIMEOUT 후 다른 워커가 다시 가져감)
+
+        Args:
+            timeout (float): 프로세스별 종료 대기 시간 (초)
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+    def join(self) -> None:
+        """모든 워커 프로세스가 끝날 때까지 기다립니다 (단독 실행용)."""
+        for process in self._processes:
+            process.join()
+
+    def get_stats(self) -> dict:
+        """
+        워커 프로세스 상태를 반환합니다.
+
+        Returns:
+            dict: 설정된 워커 수, 살아 있는 워커 수, 프로세스당 동시 작업 수
+        """
+        return {
+            "worker_count": self.worker_count,
+            "alive": sum(1 for process in self._processes if process.is_alive()),
+            "concurrency": JOB_WORKER_CONCURRENCY
+        }
+
+# 전역 JobWorkerPool 인스턴스 생성
+job_workers = JobWorkerPool()
+
+if __name__ == "__main__":
+    pool = JobWorkerPool(max(JOB_WORKER_COUNT, 1))
+    pool.start()
+    try:
+        pool.join()
+    except KeyboardInterrupt:
+        pool.stop()
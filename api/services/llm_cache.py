@@ -0,0 +1,189 @@
+"""
+Persistent content-addressed cache for LLM responses
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .cache_backends import CacheBackend, SqliteCacheBackend
+
+logger = logging.getLogger(__name__)
+
+# LLM 응답 캐시 설정
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "cache/llm_cache.sqlite3")
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# 호출 위치별 캐시 유효 시간 (초)
+LLM_CACHE_TTL = {
+    "claude": int(os.getenv("LLM_CACHE_TTL_CLAUDE", str(24 * 3600))),
+    "gpt": int(os.getenv("LLM_CACHE_TTL_GPT", str(24 * 3600))),
+    "copy": int(os.getenv("LLM_CACHE_TTL_COPY", str(6 * 3600))),
+    "brand_strategy": int(os.getenv("LLM_CACHE_TTL_BRAND_STRATEGY", str(24 * 3600)))
+}
+
+def llm_cache_key(
+    namespace: str,
+    model: str,
+    system: Optional[str],
+    prompt: str,
+    temperature: Optional[float],
+    max_tokens: Optional[int]
+) -> str:
+    """
+    모델, 시스템 프롬프트, 프롬프트, 샘플링 파라미터의 해시로 캐시 키를 생성합니다.
+
+    Args:
+        namespace (str): 키 접두사 (제공자 또는 호출 위치)
+        model (str): 모델 이름
+        system (Optional[str]): 시스템 프롬프트
+        prompt (str): 사용자 프롬프트
+        temperature (Optional[float]): temperature
+        max_tokens (Optional[int]): 최대 응답 토큰 수
+
+    Returns:
+        str: 캐시 키
+    """
+    key_source = json.dumps([model, system, prompt, temperature, max_tokens], ensure_ascii=False)
+    return f"{namespace}:" + hashlib.sha256(key_source.encode()).hexdigest()
+
+class LLMResponseCache:
+    def __init__(self, backend: Optional[CacheBackend] = None, enabled: bool = LLM_CACHE_ENABLED):
+        """
+        LLM 응답 캐시를 초기화합니다. 저장소는 처음 사용할 때 생성합니다.
+
+        Args:
+            backend (Optional[CacheBackend]): 캐시 저장소 (기본값: 크기 제한 SQLite 파일)
+            enabled (bool): 캐시 사용 여부
+        """
+        self._backend = backend
+        self.enabled = enabled
+        self._hits = 0
+        self._misses = 0
+        self._bypassed = 0
+
+    @property
+    def backend(self) -> CacheBackend:
+        if self._backend is None:
+            self._backend = SqliteCacheBackend(
+                LLM_CACHE_PATH,
+                max_entries=LLM_CACHE_MAX_ENTRIES,
+                max_bytes=LLM_CACHE_MAX_BYTES
+            )
+        return self._backend
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시된 응답을 조회합니다.
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            Optional[Any]: 캐시된 응답 또는 None
+        """
+        item = self.backend.get(key)
+        if item is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        logger.debug(f"[LLM_CACHE] 캐시 히트: key={key}")
+        return item[0]
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """
+        응답을 캐시에 저장합니다.
+
+        Args:
+            key (str): 캐시 키
+            value (Any): 저장할 응답
+            ttl_seconds (float): 캐시 유효 시간 (초)
+        """
+        try:
+            self.backend.set(key, value, ttl_seconds)
+        except Exception as e:
+            logger.error(f"[LLM_CACHE] 캐시 저장 실패: key={key}, 에러={str(e)}")
+
+    async def get_or_call(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        ttl_seconds: float,
+        bypass: bool = False
+    ) -> Any:
+        """
+        캐시된 응답이 있으면 반환하고, 없으면 func를 호출해 결과를 저장합니다.
+
+        Args:
+            key (str): 캐시 키
+            func (Callable[[], Awaitable[Any]]): 모델 호출 코루틴 함수
+            ttl_seconds (float): 캐시 유효 시간 (초)
+            bypass (bool): True면 캐시를 읽지 않고 새로 호출 (새 샘플이 필요한 경우, 결과는 저장)
+
+        Returns:
+            Any: 모델 응답
+        """
+        if not self.enabled:
+            return await func()
+        if bypass:
+            self._bypassed += 1
+        else:
+            cached = await asyncio.to_thread(self.get, key)
+            if cached is not None:
+                return cached
+
+        result = await func()
+        await asyncio.to_thread(self.set, key, result, ttl_seconds)
+        return result
+
+    def get_or_call_sync(self, key: str, func: Callable[[], Any], ttl_seconds: float, bypass: bool = False) -> Any:
+        """
+        동기 SDK 클라이언트를 쓰는 호출 위치용 get_or_call입니다.
+
+        Args:
+            key (str): 캐시 키
+            func (Callable[[], Any]): 모델 호출 함수
+            ttl_seconds (float): 캐시 유효 시간 (초)
+            bypass (bool): True면 캐시를 읽지 않고 새로 호출 (결과는 저장)
+
+        Returns:
+            Any: 모델 응답
+        """
+        if not self.enabled:
+            return func()
+        if bypass:
+            self._bypassed += 1
+        else:
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+
+        result = func()
+        self.set(key, result, ttl_seconds)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        LLM 응답 캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 캐시 통계
+        """
+        lookups = self._hits + self._misses
+        stats = self.backend.stats() if self.enabled else {}
+        stats.update({
+            "enabled": self.enabled,
+            "hits": self._hits,
+            "misses": self._misses,
+            "bypassed": self._bypassed,
+            "hit_rate_percent": round((self._hits / lookups) * 100, 1) if lookups > 0 else 0
+        })
+        return stats
+
+# 전역 LLMResponseCache 인스턴스 생성
+llm_response_cache = LLMResponseCache()
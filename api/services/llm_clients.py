@@ -0,0 +1,416 @@
+"""
+Shared async LLM clients with per-provider concurrency limits, retry backoff,
+rolling health statistics and circuit breakers
+"""
+
+import asyncio
+import logging
+import math
+import os
+import random
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+import anthropic
+import httpx
+import openai
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+# 제공자별 동시 요청 수 제한 (워커 단위)
+LLM_MAX_CONCURRENCY = {
+    "anthropic": int(os.getenv("CLAUDE_MAX_CONCURRENCY", "8")),
+    "openai": int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+}
+# 제공자별 HTTP 연결 풀 크기
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
+# 재시도 설정 (지수 백오프 + full jitter)
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "1"))
+LLM_BACKOFF_MAX = float(os.getenv("LLM_BACKOFF_MAX", "30"))
+# 제공자 상태 추적 설정 (최근 N개 요청 기준)
+LLM_HEALTH_WINDOW = int(os.getenv("LLM_HEALTH_WINDOW", "100"))
+LLM_HEALTH_MIN_SAMPLES = int(os.getenv("LLM_HEALTH_MIN_SAMPLES", "20"))
+# 서킷 브레이커 설정 (연속 실패 횟수, 열린 상태 유지 시간)
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+LLM_BREAKER_COOLDOWN = float(os.getenv("LLM_BREAKER_COOLDOWN", "30"))
+
+# 재시도 대상 예외 (요청 제한, 서버 오류, 연결/타임아웃 오류)
+RETRYABLE_ERRORS = (
+    anthropic.RateLimitError,
+    anthropic.InternalServerError,
+    anthropic.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APIConnectionError
+)
+
+class ProviderUnavailableError(Exception):
+    """서킷 브레이커가 열려 있어 제공자 호출을 건너뛸 때 발생합니다."""
+
+def backoff_delay(attempt: int, base: float = LLM_BACKOFF_BASE, cap: float = LLM_BACKOFF_MAX) -> float:
+    """
+    지수 백오프 대기 시간을 full jitter로 계산합니다.
+
+    Args:
+        attempt (int): 재시도 횟수 (0부터 시작)
+        base (float): 기본 대기 시간 (초)
+        cap (float): 최대 대기 시간 (초)
+
+    Returns:
+        float: 대기 시간 (초)
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    API 오류 응답의 Retry-After 헤더에서 대기 시간을 읽습니다.
+
+    Args:
+        error (Exception): API 오류
+
+    Returns:
+        Optional[float]: 대기 시간 (초) 또는 None (헤더가 없을 때)
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+class ProviderHealth:
+    def __init__(self, provider: str):
+        """
+        제공자의 최근 응답 시간/오류율을 추적하고 서킷 브레이커 상태를 관리합니다.
+        연속 실패가 LLM_BREAKER_FAILURES번이면 열리고, LLM_BREAKER_COOLDOWN초 뒤
+        시험 요청 하나만 통과시켜(half-open) 성공하면 닫고 실패하면 다시 엽니다.
+
+        Args:
+            provider (str): 제공자 키
+        """
+        self.provider = provider
+        self._latencies: deque = deque(maxlen=LLM_HEALTH_WINDOW)
+        self._outcomes: deque = deque(maxlen=LLM_HEALTH_WINDOW)
+        self._consecutive_failures = 0
+        self._state = "closed"
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._rejected = 0
+
+    def allow_request(self) -> bool:
+        """
+        서킷 브레이커 상태에 따라 요청을 보내도 되는지 확인합니다.
+
+        Returns:
+            bool: 요청 허용 여부
+        """
+        if self._state == "closed":
+            return True
+        if self._state == "open" and time.monotonic() - self._opened_at >= LLM_BREAKER_COOLDOWN:
+            self._state = "half_open"
+        if self._state == "half_open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self._rejected += 1
+        return False
+
+    def is_available(self) -> bool:
+        """요청을 소비하지 않고 현재 호출 가능한 상태인지 확인합니다."""
+        if self._state == "open":
+            return time.monotonic() - self._opened_at >= LLM_BREAKER_COOLDOWN
+        return not (self._state == "half_open" and self._probe_in_flight)
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        """
+        성공한 요청을 기록하고 서킷 브레이커를 닫습니다.
+
+        Args:
+            latency (Optional[float]): 응답 시간 (초), 스트리밍처럼 비교할 수 없으면 None
+        """
+        if latency is not None:
+            self._latencies.append(latency)
+        self._outcomes.append(True)
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+        if self._state != "closed":
+            logger.info(f"[LLM][{self.provider}] 서킷 브레이커 닫힘")
+        self._state = "closed"
+
+    def record_failure(self) -> None:
+        """실패한 요청을 기록하고, 조건을 넘으면 서킷 브레이커를 엽니다."""
+        self._outcomes.append(False)
+        self._consecutive_failures += 1
+        self._probe_in_flight = False
+        if self._state == "half_open" or (
+            self._state == "closed" and self._consecutive_failures >= LLM_BREAKER_FAILURES
+        ):
+            self._state = "open"
+            self._opened_at = time.monotonic()
+            logger.warning(
+                f"[LLM][{self.provider}] 서킷 브레이커 열림: 연속 실패 {self._consecutive_failures}회, "
+                f"{LLM_BREAKER_COOLDOWN}초 후 재시도"
+            )
+
+    def release_probe(self) -> None:
+        """결과 없이 끝난 요청(취소, 요청 오류)이 시험 요청이었다면 다음 시험 요청을 허용합니다."""
+        self._probe_in_flight = False
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        최근 응답 시간의 백분위수를 반환합니다.
+
+        Args:
+            percentile (float): 백분위 (0~100)
+
+        Returns:
+            Optional[float]: 응답 시간 (초) 또는 None (표본이 LLM_HEALTH_MIN_SAMPLES개 미만일 때)
+        """
+        if len(self._latencies) < LLM_HEALTH_MIN_SAMPLES:
+            return None
+        latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, max(0, math.ceil(percentile / 100 * len(latencies)) - 1))
+        return latencies[index]
+
+    def error_rate(self) -> float:
+        """최근 요청의 오류율 (0~1)을 반환합니다."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        제공자 상태 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 서킷 상태, 오류율, 응답 시간 백분위수
+        """
+        p50 = self.latency_percentile(50)
+        p95 = self.latency_percentile(95)
+        return {
+            "circuit": self._state,
+            "consecutive_failures": self._consecutive_failures,
+            "rejected": self._rejected,
+            "error_rate_percent": round(self.error_rate() * 100, 1),
+            "latency_p50": round(p50, 3) if p50 is not None else None,
+            "latency_p95": round(p95, 3) if p95 is not None else None,
+            "samples": len(self._outcomes)
+        }
+
+class LLMClientPool:
+    def __init__(self):
+        """
+        제공자별 async 클라이언트와 동시 요청 세마포어를 관리하는 풀을 초기화합니다.
+        클라이언트와 세마포어는 이벤트 루프 안에서 처음 사용할 때 생성합니다.
+        """
+        self._clients: Dict[str, Any] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight = {provider: 0 for provider in LLM_MAX_CONCURRENCY}
+        self._retries = {provider: 0 for provider in LLM_MAX_CONCURRENCY}
+        self.health = {provider: ProviderHealth(provider) for provider in LLM_MAX_CONCURRENCY}
+
+    def _http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY
+            ),
+            timeout=Config.DEFAULT_TIMEOUT
+        )
+
+    def anthropic(self) -> AsyncAnthropic:
+        """공유 AsyncAnthropic 클라이언트를 반환합니다 (SDK 자체 재시도는 끄고 풀에서 재시도)."""
+        if "anthropic" not in self._clients:
+            self._clients["anthropic"] = AsyncAnthropic(
+                api_key=Config.ANTHROPIC_API_KEY,
+                http_client=self._http_client(),
+                max_retries=0
+            )
+        return self._clients["anthropic"]
+
+    def openai(self) -> AsyncOpenAI:
+        """공유 AsyncOpenAI 클라이언트를 반환합니다 (SDK 자체 재시도는 끄고 풀에서 재시도)."""
+        if "openai" not in self._clients:
+            self._clients["openai"] = AsyncOpenAI(
+                api_key=Config.OPENAI_API_KEY,
+                http_client=self._http_client(),
+                max_retries=0
+            )
+        return self._clients["openai"]
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        if provider not in self._semaphores:
+            self._semaphores[provider] = asyncio.Semaphore(LLM_MAX_CONCURRENCY[provider])
+        return self._semaphores[provider]
+
+    async def request(
+        self,
+        provider: str,
+        request_func: Callable[[], Awaitable[Any]],
+        max_retries: int = LLM_MAX_RETRIES
+    ) -> Any:
+        """
+        제공자 세마포어 안에서 요청을 실행하고, 일시적 오류는 백오프 후 재시도합니다.
+        재시도 대기 중에는 세마포어를 반납해 다른 요청이 진행되도록 합니다.
+        시도마다 응답 시간과 실패를 제공자 상태에 기록하며, 서킷 브레이커가 열려 있으면 바로 실패합니다.
+
+        Args:
+            provider (str): 제공자 키 ("anthropic" 또는 "openai")
+            request_func (Callable[[], Awaitable[Any]]): API 요청 코루틴 함수
+            max_retries (int): 최대 재시도 횟수
+
+        Returns:
+            Any: API 응답
+
+        Raises:
+            ProviderUnavailableError: 서킷 브레이커가 열려 있을 때
+        """
+        health = self.health[provider]
+        for attempt in range(max_retries + 1):
+            if not health.allow_request():
+                raise ProviderUnavailableError(f"{provider} 서킷 브레이커가 열려 있습니다")
+            try:
+                async with self.slot(provider):
+                    started_at = time.perf_counter()
+                    result = await request_func()
+            except RETRYABLE_ERRORS as e:
+                health.record_failure()
+                if attempt == max_retries:
+                    raise
+                await self._wait_before_retry(provider, e, attempt, max_retries)
+                continue
+            except BaseException:
+                health.release_probe()
+                raise
+            health.record_success(time.perf_counter() - started_at)
+            return result
+
+    async def stream(
+        self,
+        provider: str,
+        open_stream: Callable[[], AsyncIterator[str]],
+        max_retries: int = LLM_MAX_RETRIES
+    ) -> AsyncIterator[str]:
+        """
+        스트리밍 요청을 제공자 세마포어 안에서 실행하며 텍스트 조각을 전달합니다.
+        첫 조각을 받기 전의 일시적 오류만 재시도합니다 (이미 전달한 내용은 되돌릴 수 없으므로).
+
+        Args:
+            provider (str): 제공자 키 ("anthropic" 또는 "openai")
+            open_stream (Callable[[], AsyncIterator[str]]): 텍스트 조각을 내보내는 async generator 함수
+            max_retries (int): 최대 재시도 횟수
+
+        Yields:
+            str: 모델이 생성한 텍스트 조각
+        """
+        health = self.health[provider]
+        for attempt in range(max_retries + 1):
+            if not health.allow_request():
+                raise ProviderUnavailableError(f"{provider} 서킷 브레이커가 열려 있습니다")
+            started = False
+            try:
+                async with self.slot(provider):
+                    async for chunk in open_stream():
+                        if not started:
+                            started = True
+                            health.record_success()
+                        yield chunk
+                return
+            except RETRYABLE_ERRORS as e:
+                if started:
+                    raise
+                health.record_failure()
+                if attempt == max_retries:
+                    raise
+                await self._wait_before_retry(provider, e, attempt, max_retries)
+            except BaseException:
+                if not started:
+                    health.release_probe()
+                raise
+
+    @asynccontextmanager
+    async def slot(self, provider: str) -> AsyncIterator[None]:
+        """제공자 동시 요청 제한 안에서 실행 구간을 확보합니다."""
+        async with self._semaphore(provider):
+            self._in_flight[provider] += 1
+            try:
+                yield
+            finally:
+                self._in_flight[provider] -= 1
+
+    async def _wait_before_retry(self, provider: str, error: Exception, attempt: int, max_retries: int) -> None:
+        retry_after = retry_after_seconds(error)
+        delay = min(retry_after, LLM_BACKOFF_MAX) if retry_after is not None else backoff_delay(attempt)
+        self._retries[provider] += 1
+        logger.warning(
+            f"[LLM][{provider}] 요청 실패, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {str(error)}"
+        )
+        await asyncio.sleep(delay)
+
+    async def run_sync(self, provider: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        동기 SDK 클라이언트를 쓰는 함수를 제공자 세마포어 안에서 스레드로 실행합니다.
+        async 클라이언트로 옮기지 않은 서비스도 같은 동시 요청 제한을 받도록 합니다.
+
+        Args:
+            provider (str): 제공자 키 ("anthropic" 또는 "openai")
+            func (Callable[..., Any]): 실행할 동기 함수
+            *args (Any): 함수 인자
+
+        Returns:
+            Any: 함수 반환값
+        """
+        async with self.slot(provider):
+            return await asyncio.to_thread(func, *args)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        제공자별 동시 요청/재시도 통계와 상태(서킷, 오류율, 응답 시간)를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 제공자별 통계
+        """
+        return {
+            provider: {
+                "max_concurrency": limit,
+                "in_flight": self._in_flight[provider],
+                "retries": self._retries[provider],
+                **self.health[provider].get_stats()
+            }
+            for provider, limit in LLM_MAX_CONCURRENCY.items()
+        }
+
+    async def aclose(self) -> None:
+        """모든 클라이언트의 HTTP 연결을 닫습니다."""
+        for client in self._clients.values():
+            await client.close()
+        self._clients.clear()
+
+# 전역 LLMClientPool 인스턴스 생성
+llm_clients = LLMClientPool()
@@ -0,0 +1,205 @@
+"""
+Route LLM calls across Claude and GPT with hedged requests and failover
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from .claude_caller import ClaudeCaller
+from .gpt_caller import GPTCaller
+from .llm_cache import llm_response_cache, llm_cache_key, LLM_CACHE_TTL
+from .llm_clients import llm_clients
+from .single_flight import single_flight
+
+logger = logging.getLogger(__name__)
+
+# 헤지 요청 설정: 주 제공자가 최근 응답 시간의 LLM_HEDGE_PERCENTILE 백분위를 넘기면 보조 제공자에게도 요청
+LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "true").lower() == "true"
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+# 응답 시간 표본이 부족할 때 쓰는 헤지 대기 시간과 하한 (초)
+LLM_HEDGE_DEFAULT_DELAY = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY", "20"))
+LLM_HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "2"))
+
+# 라우팅된 요청의 재시도 횟수 (실패하면 제공자 안에서 재시도하지 않고 바로 보조 제공자로 넘김)
+LLM_ROUTER_MAX_RETRIES = int(os.getenv("LLM_ROUTER_MAX_RETRIES", "0"))
+
+# 제공자별 캐시 유효 시간 키
+CACHE_NAMESPACE = {
+    "anthropic": "claude",
+    "openai": "gpt"
+}
+
+# 제공자별 보조 제공자
+FALLBACK_PROVIDER = {
+    "anthropic": "openai",
+    "openai": "anthropic"
+}
+
+class LLMRouter:
+    def __init__(self):
+        """
+        Claude/GPT 호출을 제공자 상태에 따라 라우팅하는 라우터를 초기화합니다.
+        호출 클래스는 처음 사용할 때 생성합니다.
+        """
+        self._callers: Dict[str, Any] = {}
+        self._stats = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "failovers": 0,
+            "skipped_open_circuit": 0
+        }
+
+    def _caller(self, provider: str) -> Any:
+        if provider not in self._callers:
+            self._callers[provider] = ClaudeCaller() if provider == "anthropic" else GPTCaller()
+        return self._callers[provider]
+
+    def _hedge_delay(self, provider: str) -> float:
+        latency = llm_clients.health[provider].latency_percentile(LLM_HEDGE_PERCENTILE)
+        if latency is None:
+            return LLM_HEDGE_DEFAULT_DELAY
+        return max(latency, LLM_HEDGE_MIN_DELAY)
+
+    def _providers(self, primary: str) -> List[str]:
+        """서킷 브레이커가 열린 제공자를 뒤로 미룬 호출 순서를 반환합니다."""
+        providers = [primary, FALLBACK_PROVIDER[primary]]
+        available = [provider for provider in providers if llm_clients.health[provider].is_available()]
+        if available and available[0] != primary:
+            self._stats["skipped_open_circuit"] += 1
+            logger.warning(f"[LLM_ROUTER] {primary} 서킷 브레이커 열림, {available[0]}로 요청")
+        return available + [provider for provider in providers if provider not in available]
+
+    async def call(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[int] = None,
+        primary: str = "anthropic",
+        cache_ttl: Optional[int] = None,
+        bypass_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        주 제공자에 요청하고, 응답이 늦으면 보조 제공자에게 헤지 요청을, 실패하면 바로 대체 요청을 보냅니다.
+        먼저 성공한 응답을 사용하고 나머지 요청은 취소합니다.
+
+        Args:
+            prompt (str): 사용자 프롬프트
+            system (Optional[str]): 시스템 프롬프트
+            max_tokens (Optional[int]): 최대 응답 토큰 수
+            timeout (Optional[int]): 요청 타임아웃 (초)
+            primary (str): 주 제공자 ("anthropic" 또는 "openai")
+            cache_ttl (Optional[int]): 캐시 유효 시간 (초)
+            bypass_cache (bool): 캐시와 진행 중 요청 공유를 건너뛰고 새로 호출할지 여부
+
+        Returns:
+            Dict[str, Any]: content, usage, model과 응답한 provider
+        """
+        self._stats["requests"] += 1
+        providers = [primary, FALLBACK_PROVIDER[primary]]
+        keys = {
+            provider: self._caller(provider)._request_key(prompt, system, None, max_tokens)
+            for provider in providers
+        }
+        if bypass_cache:
+            return await self._hedged_call(prompt, system, max_tokens, timeout, primary, keys, cache_ttl)
+
+        # 어느 제공자의 응답이든 같은 요청에 대한 답이므로 두 키를 모두 확인
+        for provider in providers:
+            cached = await asyncio.to_thread(llm_response_cache.get, keys[provider])
+            if cached is not None:
+                return {**cached, "provider": provider}
+
+        route_key = llm_cache_key("route:" + primary, "", system, prompt, None, max_tokens)
+        response, _ = await single_flight.do(
+            route_key,
+            lambda: self._hedged_call(prompt, system, max_tokens, timeout, primary, keys, cache_ttl)
+        )
+        return dict(response)
+
+    async def _hedged_call(
+        self,
+        prompt: str,
+        system: Optional[str],
+        max_tokens: Optional[int],
+        timeout: Optional[int],
+        primary: str,
+        keys: Dict[str, str],
+        cache_ttl: Optional[int]
+    ) -> Dict[str, Any]:
+        providers = self._providers(primary)
+        tasks: Dict[asyncio.Task, str] = {}
+
+        def launch(provider: str) -> None:
+            task = asyncio.ensure_future(
+                self._caller(provider)._call(
+                    prompt, system, None, max_tokens, timeout, max_retries=LLM_ROUTER_MAX_RETRIES
+                )
+            )
+            tasks[task] = provider
+
+        launch(providers[0])
+        pending = set(tasks)
+        hedged = False
+        last_error: Optional[BaseException] = None
+        try:
+            # 주 제공자를 헤지 대기 시간만큼 기다린 뒤, 늦으면 헤지 요청을, 실패하면 대체 요청을 시작
+            wait_timeout = self._hedge_delay(providers[0]) if LLM_HEDGE_ENABLED else None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=wait_timeout,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                wait_timeout = None
+                for task in done:
+                    provider = tasks[task]
+                    if task.exception() is None:
+                        if hedged and provider != providers[0]:
+                            self._stats["hedge_wins"] += 1
+                        response = task.result()
+                        await asyncio.to_thread(
+                            llm_response_cache.set,
+                            keys[provider],
+                            response,
+                            cache_ttl or LLM_CACHE_TTL[CACHE_NAMESPACE[provider]]
+                        )
+                        return {**response, "provider": provider}
+                    last_error = task.exception()
+                    logger.warning(f"[LLM_ROUTER] {provider} 요청 실패: {str(last_error)}")
+
+                if len(tasks) == len(providers):
+                    continue
+                if done:
+                    self._stats["failovers"] += 1
+                    logger.warning(f"[LLM_ROUTER] {providers[0]} 실패, {providers[1]}로 대체 요청")
+                else:
+                    hedged = True
+                    self._stats["hedged"] += 1
+                    logger.info(
+                        f"[LLM_ROUTER] {providers[0]} 응답 지연 ({self._hedge_delay(providers[0]):.1f}초 초과), "
+                        f"{providers[1]}로 헤지 요청"
+                    )
+                launch(providers[1])
+                pending = {task for task in tasks if not task.done()}
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        raise last_error
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        라우팅 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 요청 수, 헤지 요청 수, 헤지 성공 수, 대체 요청 수, 서킷 브레이커로 건너뛴 수
+        """
+        return dict(self._stats)
+
+# 전역 LLMRouter 인스턴스 생성
+llm_router = LLMRouter()
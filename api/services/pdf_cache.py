@@ -0,0 +1,166 @@
+"""
+Content-addressed on-disk cache for rendered PDF artifacts
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 렌더링된 PDF 저장 위치와 최대 사용량
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", "cache/pdf")
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# 이 시간(초) 안에 저장/조회된 파일은 용량을 넘어도 지우지 않음 (반환된 경로를 읽는 중인 요청 보호)
+PDF_CACHE_EVICT_GRACE = int(os.getenv("PDF_CACHE_EVICT_GRACE", "600"))
+# 리포트 템플릿/폰트가 바뀌면 올려서 기존 PDF를 무효화
+PDF_TEMPLATE_VERSION = os.getenv("PDF_TEMPLATE_VERSION", "1")
+PDF_FONT_VERSION = os.getenv("PDF_FONT_VERSION", "1")
+
+def _weasyprint_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("weasyprint")
+    except Exception:
+        return "unknown"
+
+class PDFArtifactCache:
+    def __init__(
+        self,
+        directory: str = PDF_CACHE_DIR,
+        max_bytes: int = PDF_CACHE_MAX_BYTES,
+        evict_grace: int = PDF_CACHE_EVICT_GRACE
+    ):
+        """
+        최종 HTML, 템플릿 버전, 폰트 설정의 해시를 키로 렌더링된 PDF를 디스크에 저장하는 캐시를 초기화합니다.
+        같은 디렉토리를 쓰는 여러 프로세스가 캐시를 공유하며, 최대 사용량을 넘으면 가장 오래 사용되지 않은 파일부터 지웁니다.
+        get/put이 반환한 경로는 다른 프로세스가 읽는 중일 수 있으므로 최근 evict_grace초 안에 사용된 파일은 지우지 않습니다.
+
+        Args:
+            directory (str): 저장 디렉토리
+            max_bytes (int): 최대 사용 바이트
+            evict_grace (int): 제거하지 않는 최근 사용 시간 (초)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.evict_grace = evict_grace
+        self._fingerprint = f"{PDF_TEMPLATE_VERSION}:{PDF_FONT_VERSION}:{_weasyprint_version()}"
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key_for(self, html: str) -> str:
+        """
+        HTML과 템플릿/폰트 버전으로 캐시 키(ETag로도 사용)를 만듭니다.
+
+        Args:
+            html (str): 렌더링할 최종 HTML
+
+        Returns:
+            str: 캐시 키
+        """
+        digest = hashlib.sha256()
+        digest.update(self._fingerprint.encode())
+        digest.update(b"\0")
+        digest.update(html.encode("utf-8"))
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> str:
+        """캐시 키에 해당하는 파일 경로를 반환합니다."""
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 PDF 경로를 반환하고 최근 사용 시각을 갱신합니다.
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            Optional[str]: PDF 파일 경로 또는 None
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return path
+
+    def put(self, key: str, pdf: bytes) -> str:
+        """
+        렌더링된 PDF를 저장합니다. 임시 파일에 쓴 뒤 이름을 바꿔 읽는 쪽이 불완전한 파일을 보지 않게 합니다.
+
+        Args:
+            key (str): 캐시 키
+            pdf (bytes): PDF 내용
+
+        Returns:
+            str: 저장된 PDF 파일 경로
+        """
+        path = self.path_for(key)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pdf)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._evict()
+        return path
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            total_bytes = 0
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith(".pdf"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_bytes += stat.st_size
+            if total_bytes <= self.max_bytes:
+                return
+
+            cutoff = time.time() - self.evict_grace
+            for mtime, size, path in sorted(entries):
+                if total_bytes <= self.max_bytes or mtime >= cutoff:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total_bytes -= size
+                self._evictions += 1
+            logger.info(f"[PDF_CACHE] 용량 초과로 정리: 현재 {total_bytes} bytes")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        PDF 캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 파일 수, 사용 바이트, 히트/미스/제거 횟수
+        """
+        files = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".pdf")]
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(files),
+            "bytes": sum(entry.stat().st_size for entry in files),
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate_percent": round((self._hits / lookups) * 100, 1) if lookups > 0 else 0
+        }
+
+# 전역 PDFArtifactCache 인스턴스 생성
+pdf_cache = PDFArtifactCache()
@@ -1,8 +1,12 @@
-from weasyprint import HTML
+import asyncio
 import os
+import shutil
 from datetime import datetime
 from typing import Optional
 import logging
+from fastapi import HTTPException
+from api.services.pdf_renderer import pdf_renderer
+from api.services.export_index import export_index
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -12,9 +16,10 @@ logger = logging.getLogger(__name__)
 PDF_EXPORT_DIR = "exported_pdfs"
 os.makedirs(PDF_EXPORT_DIR, exist_ok=True)
 
-def save_html_as_pdf(analysis_id: str, html_content: str) -> Optional[str]:
+async def save_html_as_pdf(analysis_id: str, html_content: str) -> Optional[str]:
     """
     Convert HTML content to PDF and save it to the export directory.
+    Rendering runs in the PDF render pool; identical HTML is copied from the rendered-PDF cache.
     
     Args:
         analysis_id (str): Unique identifier for the analysis
@@ -29,11 +34,15 @@ def save_html_as_pdf(analysis_id: str, html_content: str) -> Optional[str]:
         filepath = os.path.join(PDF_EXPORT_DIR, filename)
         
         # Convert HTML to PDF
-        HTML(string=html_content).write_pdf(filepath)
+        _, cached_path = await pdf_renderer.render_to_file(html_content)
+        await asyncio.to_thread(shutil.copyfile, cached_path, filepath)
+        export_index.record(analysis_id, "pdf", filepath)
         
         logger.info(f"PDF successfully generated: {filepath}")
         return filepath
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error converting HTML to PDF: {str(e)}")
         return None
@@ -55,6 +64,7 @@ def cleanup_old_pdfs(max_age_days: int = 7) -> None:
                 
                 if age_days > max_age_days:
                     os.remove(filepath)
+                    export_index.remove(filepath)
                     logger.info(f"Removed old PDF file: {filepath}")
                     
     except Exception as e:
@@ -0,0 +1,207 @@
+"""
+WeasyPrint rendering off the event loop in a pre-warmed process pool
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from fastapi import HTTPException
+
+from .pdf_cache import pdf_cache
+from .single_flight import single_flight
+
+logger = logging.getLogger(__name__)
+
+# 렌더링 프로세스 수
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", str(max(1, min(4, (os.cpu_count() or 2) // 2)))))
+# 렌더링 중 + 대기 중인 요청 최대 수 (넘으면 503으로 거절)
+PDF_RENDER_QUEUE_LIMIT = int(os.getenv("PDF_RENDER_QUEUE_LIMIT", "32"))
+# 거절 시 Retry-After (초)
+PDF_RENDER_RETRY_AFTER = int(os.getenv("PDF_RENDER_RETRY_AFTER", "5"))
+
+WARMUP_HTML = "<html><body><p>warmup</p></body></html>"
+
+# 렌더링 프로세스 안에서 재사용하는 FontConfiguration
+_font_config = None
+
+def _init_render_worker() -> None:
+    """렌더링 프로세스 초기화: WeasyPrint를 불러오고 FontConfiguration을 만든 뒤 한 번 렌더링해 예열합니다."""
+    global _font_config
+    from weasyprint import HTML
+    from weasyprint.text.fonts import FontConfiguration
+
+    _font_config = FontConfiguration()
+    HTML(string=WARMUP_HTML).write_pdf(font_config=_font_config)
+
+def _render_pdf(html: str) -> bytes:
+    from weasyprint import HTML
+
+    return HTML(string=html).write_pdf(font_config=_font_config)
+
+def _ping() -> int:
+    return os.getpid()
+
+class PDFRenderer:
+    def __init__(self, workers: int = PDF_RENDER_WORKERS, queue_limit: int = PDF_RENDER_QUEUE_LIMIT):
+        """
+        WeasyPrint 렌더링을 이벤트 루프 밖의 프로세스 풀에서 실행하는 렌더러를 초기화합니다.
+        결과는 pdf_cache에 저장되어 같은 HTML은 다시 렌더링하지 않습니다.
+
+        Args:
+            workers (int): 렌더링 프로세스 수
+            queue_limit (int): 렌더링 중 + 대기 중인 요청 최대 수
+        """
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._capacity: Optional[asyncio.Condition] = None
+        self._pending = 0
+        self._rendered = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_render_worker
+            )
+        return self._executor
+
+    async def start(self) -> None:
+        """렌더링 프로세스를 미리 띄우고 예열합니다."""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(executor, _ping) for _ in range(self.workers)))
+        logger.info(f"[PDF] 렌더링 프로세스 {self.workers}개 준비 완료")
+
+    def _get_capacity(self) -> asyncio.Condition:
+        if self._capacity is None:
+            self._capacity = asyncio.Condition()
+        return self._capacity
+
+    async def _render_and_store(self, key: str, html: str, wait: bool = False) -> str:
+        if wait and self._pending >= self.queue_limit:
+            # 내부 일괄 렌더링은 거절하지 않고 자리가 날 때까지 기다림
+            capacity = self._get_capacity()
+            async with capacity:
+                await capacity.wait_for(lambda: self._pending < self.queue_limit)
+        if self._pending >= self.queue_limit:
+            self._rejected += 1
+            logger.warning(f"[PDF] 렌더링 대기열 초과: {self._pending}/{self.queue_limit}")
+            raise HTTPException(
+                status_code=503,
+                detail="PDF 생성 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(PDF_RENDER_RETRY_AFTER)}
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            pdf = await loop.run_in_executor(self._get_executor(), _render_pdf, html)
+        finally:
+            self._pending -= 1
+            capacity = self._get_capacity()
+            async with capacity:
+                capacity.notify()
+        self._rendered += 1
+        return await asyncio.to_thread(pdf_cache.put, key, pdf)
+
+    async def render_to_file(self, html: str, wait: bool = False) -> Tuple[str, str]:
+        """
+        HTML을 PDF로 렌더링해 캐시 파일 경로를 반환합니다.
+        캐시에 있으면 렌더링하지 않고, 같은 HTML을 동시에 요청하면 렌더링을 한 번만 합니다.
+
+        Args:
+            html (str): 렌더링할 HTML
+            wait (bool): 대기열이 가득 차면 거절하지 않고 자리가 날 때까지 기다릴지 여부
+
+        Returns:
+            Tuple[str, str]: (캐시 키(ETag), PDF 파일 경로)
+
+        Raises:
+            HTTPException: 렌더링 대기열이 가득 찬 경우 (503, wait=False일 때)
+        """
+        key = pdf_cache.key_for(html)
+        path = await asyncio.to_thread(pdf_cache.get, key)
+        if path is None:
+            path, _ = await single_flight.do(f"pdf:{key}", lambda: self._render_and_store(key, html, wait))
+        return key, path
+
+    async def render(self, html: str) -> bytes:
+        """
+        HTML을 PDF로 렌더링해 내용을 반환합니다 (캐시 사용).
+
+        Args:
+            html (str): 렌더링할 HTML
+
+        Returns:
+            bytes: PDF 내용
+        """
+        _, path = await self.render_to_file(html)
+
+        def read_file() -> bytes:
+            with open(path, "rb") as f:
+                return f.read()
+
+        return await asyncio.to_thread(read_file)
+
+    async def iter_rendered_files(self, documents: List[Tuple[str, str]]) -> AsyncIterator[Tuple[str, Union[str, BaseException]]]:
+        """
+        여러 문서를 PDF로 렌더링하며 끝나는 순서대로 캐시 파일 경로를 내보냅니다.
+        한 번에 프로세스 수만큼만 제출해 대기열 한도를 혼자 차지하지 않고,
+        대기열이 가득 차면 거절되지 않고 자리가 날 때까지 기다립니다.
+        소비하는 쪽이 중단하면 남은 렌더링을 취소합니다.
+
+        Args:
+            documents (List[Tuple[str, str]]): (이름, HTML) 목록
+
+        Yields:
+            Tuple[str, Union[str, BaseException]]: (이름, PDF 파일 경로 또는 실패한 경우 예외)
+        """
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def render_one(name: str, html: str) -> Tuple[str, Union[str, BaseException]]:
+            async with semaphore:
+                try:
+                    _, path = await self.render_to_file(html, wait=True)
+                    return name, path
+                except Exception as e:
+                    return name, e
+
+        tasks = [asyncio.ensure_future(render_one(name, html)) for name, html in documents]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        렌더링 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 프로세스 수, 대기 중 요청 수, 렌더링/거절 횟수, PDF 캐시 통계
+        """
+        return {
+            "workers": self.workers,
+            "pending": self._pending,
+            "queue_limit": self.queue_limit,
+            "rendered": self._rendered,
+            "rejected": self._rejected,
+            "cache": pdf_cache.get_stats()
+        }
+
+    def shutdown(self) -> None:
+        """렌더링 프로세스를 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+# 전역 PDFRenderer 인스턴스 생성
+pdf_renderer = PDFRenderer()
@@ -0,0 +1,117 @@
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+class Pipeline:
+    def __init__(self, name: str):
+        """
+        단계 간 의존 관계(DAG)를 선언하고, 의존성이 없는 단계는 동시에 실행하는 파이프라인을 초기화합니다.
+
+        Args:
+            name (str): 로그에 표시할 파이프라인 이름
+        """
+        self.name = name
+        self._stages: Dict[str, Dict[str, Any]] = {}
+
+    def stage(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        depends_on: Sequence[str] = (),
+        run_in_thread: bool = False
+    ) -> "Pipeline":
+        """
+        파이프라인 단계를 추가합니다.
+        func는 의존 단계의 결과를 단계 이름의 키워드 인자로 받습니다.
+
+        Args:
+            name (str): 단계 이름
+            func (Callable[..., Any]): 단계 함수 (코루틴 함수 또는 일반 함수)
+            depends_on (Sequence[str]): 먼저 완료되어야 하는 단계 이름
+            run_in_thread (bool): 동기 함수를 스레드에서 실행할지 여부 (블로킹 API 호출용)
+
+        Returns:
+            Pipeline: 체이닝용 자기 자신
+        """
+        if name in self._stages:
+            raise ValueError(f"중복된 단계 이름: {name}")
+        self._stages[name] = {
+            "func": func,
+            "depends_on": list(depends_on),
+            "run_in_thread": run_in_thread
+        }
+        return self
+
+    def _validate(self) -> None:
+        for name, stage in self._stages.items():
+            for dependency in stage["depends_on"]:
+                if dependency not in self._stages:
+                    raise ValueError(f"단계 {name}의 의존 단계가 없습니다: {dependency}")
+
+        # 위상 정렬로 순환 의존 확인
+        remaining = {name: set(stage["depends_on"]) for name, stage in self._stages.items()}
+        while remaining:
+            ready = [name for name, dependencies in remaining.items() if not dependencies]
+            if not ready:
+                raise ValueError(f"순환 의존이 있습니다: {sorted(remaining)}")
+            for name in ready:
+                remaining.pop(name)
+            for dependencies in remaining.values():
+                dependencies.difference_update(ready)
+
+    async def _run_stage(
+        self,
+        name: str,
+        tasks: Dict[str, asyncio.Task],
+        timings: Dict[str, Dict[str, float]],
+        started_at: float
+    ) -> Any:
+        stage = self._stages[name]
+        dependency_results = {}
+        for dependency in stage["depends_on"]:
+            dependency_results[dependency] = await tasks[dependency]
+
+        stage_start = time.perf_counter()
+        if stage["run_in_thread"]:
+            result = await asyncio.to_thread(stage["func"], **dependency_results)
+        else:
+            result = stage["func"](**dependency_results)
+        if inspect.isawaitable(result):
+            result = await result
+
+        timings[name] = {
+            "started_at": round(stage_start - started_at, 3),
+            "elapsed": round(time.perf_counter() - stage_start, 3)
+        }
+        logger.info(f"[PIPELINE][{self.name}] {name} 완료 ({timings[name]['elapsed']}초)")
+        return result
+
+    async def run(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        모든 단계를 의존 순서에 맞게 실행합니다. 한 단계가 실패하면 나머지 단계를 취소하고 예외를 전달합니다.
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, Any]]: (단계별 결과, 단계별 시작 시각/소요 시간과 전체 소요 시간)
+        """
+        self._validate()
+        started_at = time.perf_counter()
+        timings: Dict[str, Any] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        for name in self._stages:
+            tasks[name] = asyncio.ensure_future(self._run_stage(name, tasks, timings, started_at))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        timings["total"] = round(time.perf_counter() - started_at, 3)
+        logger.info(f"[PIPELINE][{self.name}] 전체 완료 ({timings['total']}초)")
+        return {name: task.result() for name, task in tasks.items()}, timings
@@ -0,0 +1,234 @@
+"""
+Persistent per-channel post store with incremental re-crawl
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from ..utils.post_date import post_timestamp
+
+logger = logging.getLogger(__name__)
+
+# 게시물 저장소 파일 경로
+CRAWL_STORE_PATH = os.getenv("CRAWL_STORE_PATH", "crawl_store/posts.sqlite3")
+# 키워드+채널별로 반환할 최대 게시물 수
+CRAWL_STORE_MAX_POSTS = int(os.getenv("CRAWL_STORE_MAX_POSTS", "30"))
+
+class PostStore:
+    def __init__(self, path: str = CRAWL_STORE_PATH, max_posts: int = CRAWL_STORE_MAX_POSTS):
+        """
+        URL 기준으로 채널별 게시물을 저장하는 영구 저장소를 초기화합니다.
+
+        Args:
+            path (str): SQLite 파일 경로 (처음 사용할 때 생성)
+            max_posts (int): 키워드+채널별로 반환할 최대 게시물 수
+        """
+        self.path = path
+        self.max_posts = max_posts
+        self._ready = False
+        self._init_lock = threading.Lock()
+
+    def _init_store(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS posts (
+                    channel TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    posted_at REAL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (channel, url)
+                );
+                CREATE TABLE IF NOT EXISTS keyword_posts (
+                    keyword_key TEXT NOT NULL,
+                    channel TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    PRIMARY KEY (keyword_key, channel, url)
+                );
+                CREATE TABLE IF NOT EXISTS crawl_marks (
+                    keyword_key TEXT NOT NULL,
+                    channel TEXT NOT NULL,
+                    high_water REAL,
+                    last_crawled_at REAL NOT NULL,
+                    PRIMARY KEY (keyword_key, channel)
+                );
+                """
+            )
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # 저장소 파일은 import 시점이 아니라 처음 사용할 때 만듦
+        if not self._ready:
+            with self._init_lock:
+                if not self._ready:
+                    self._init_store()
+                    self._ready = True
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def keyword_key(keyword: str) -> str:
+        """검색어를 정규화한 저장소 키를 생성합니다."""
+        return hashlib.sha256(keyword.strip().lower().encode()).hexdigest()
+
+    def get_high_water(self, keyword: str, channel: str) -> Optional[float]:
+        """
+        키워드+채널의 마지막 수집 게시 시각(high-water mark)을 조회합니다.
+
+        Args:
+            keyword (str): 검색어
+            channel (str): 채널 키
+
+        Returns:
+            Optional[float]: 마지막으로 수집한 게시물의 게시 시각 또는 None
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT high_water FROM crawl_marks WHERE keyword_key = ? AND channel = ?",
+                (self.keyword_key(keyword), channel)
+            ).fetchone()
+        return row[0] if row else None
+
+    def save_posts(self, keyword: str, channel: str, posts: List[Dict[str, Any]]) -> int:
+        """
+        게시물을 URL 기준으로 저장하고 high-water mark를 갱신합니다.
+
+        Args:
+            keyword (str): 검색어
+            channel (str): 채널 키
+            posts (List[Dict[str, Any]]): 크롤링 결과 (url 필드가 있는 항목만 저장)
+
+        Returns:
+            int: 저장된 게시물 수
+        """
+        keyword_key = self.keyword_key(keyword)
+        now = time.time()
+        rows = []
+        for post in posts:
+            if not isinstance(post, dict) or not post.get("url"):
+                continue
+            rows.append((channel, post["url"], json.dumps(post, ensure_ascii=False), post_timestamp(post), now))
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR REPLACE INTO posts (channel, url, payload, posted_at, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO keyword_posts (keyword_key, channel, url) VALUES (?, ?, ?)",
+                [(keyword_key, channel, row[1]) for row in rows]
+            )
+            timestamps = [row[3] for row in rows if row[3] is not None]
+            conn.execute(
+                """
+                INSERT INTO crawl_marks (keyword_key, channel, high_water, last_crawled_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (keyword_key, channel) DO UPDATE SET
+                    high_water = MAX(COALESCE(crawl_marks.high_water, 0), COALESCE(excluded.high_water, 0)),
+                    last_crawled_at = excluded.last_crawled_at
+                """,
+                (keyword_key, channel, max(timestamps) if timestamps else None, now)
+            )
+            conn.execute("COMMIT")
+        return len(rows)
+
+    def load_posts(self, keyword: str, channel: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        키워드+채널로 저장된 게시물을 최신순으로 조회합니다.
+
+        Args:
+            keyword (str): 검색어
+            channel (str): 채널 키
+            limit (Optional[int]): 최대 게시물 수 (기본값: 저장소 설정)
+
+        Returns:
+            List[Dict[str, Any]]: 저장된 게시물 목록
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT p.payload FROM keyword_posts k
+                JOIN posts p ON p.channel = k.channel AND p.url = k.url
+                WHERE k.keyword_key = ? AND k.channel = ?
+                ORDER BY COALESCE(p.posted_at, p.fetched_at) DESC
+                LIMIT ?
+                """,
+                (self.keyword_key(keyword), channel, limit or self.max_posts)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    async def incremental_crawl(
+        self,
+        channel: str,
+        crawler_func: Callable[..., Awaitable[Any]],
+        keyword: str
+    ) -> List[Any]:
+        """
+        high-water mark 이후의 게시물만 크롤링해 저장하고, 저장된 게시물과 합쳐 반환합니다.
+        since 인자를 지원하지 않는 크롤러는 전체를 크롤링하되 결과는 동일하게 병합됩니다.
+        URL이 없는 결과(샘플 문자열 등)는 저장하지 않고 그대로 전달합니다.
+
+        Args:
+            channel (str): 채널 키
+            crawler_func (Callable[..., Awaitable[Any]]): 채널 크롤러 함수
+            keyword (str): 검색어
+
+        Returns:
+            List[Any]: 병합된 크롤링 결과
+        """
+        high_water = await asyncio.to_thread(self.get_high_water, keyword, channel)
+        if high_water and "since" in inspect.signature(crawler_func).parameters:
+            fetched = await crawler_func(keyword, since=high_water)
+        else:
+            fetched = await crawler_func(keyword)
+        if isinstance(fetched, Exception):
+            raise fetched
+        if not isinstance(fetched, list):
+            fetched = [fetched]
+
+        passthrough = [item for item in fetched if not isinstance(item, dict) or not item.get("url")]
+        saved_count = await asyncio.to_thread(self.save_posts, keyword, channel, fetched)
+        stored_posts = await asyncio.to_thread(self.load_posts, keyword, channel)
+        logger.info(
+            f"[POST_STORE][{channel}] 신규 {saved_count}개 저장, 저장소 결과 {len(stored_posts)}개 "
+            f"(high_water={high_water})"
+        )
+        return stored_posts + passthrough
+
+    def wrap(self, channel: str, crawler_func: Callable[..., Awaitable[Any]]) -> Callable[[str], Awaitable[List[Any]]]:
+        """
+        크롤러 함수를 저장소 기반 증분 크롤링 함수로 감쌉니다.
+
+        Args:
+            channel (str): 채널 키
+            crawler_func (Callable[..., Awaitable[Any]]): 채널 크롤러 함수
+
+        Returns:
+            Callable[[str], Awaitable[List[Any]]]: 검색어만 받는 크롤러 함수
+        """
+        async def stored_crawler(keyword: str) -> List[Any]:
+            return await self.incremental_crawl(channel, crawler_func, keyword)
+        return stored_crawler
+
+# 전역 PostStore 인스턴스 생성
+post_store = PostStore()
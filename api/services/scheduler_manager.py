@@ -1 +1,322 @@
- 
\ No newline at end of file
+"""
+Recurring analysis scheduler
+
+Schedules are stored in SQLite. Identical schedules (same input text, channels and frequency)
+share one group: they fire at the same jittered time and run as a single background job,
+so N subscribers cost one crawl and one analysis.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import uuid4
+
+from .job_queue import job_queue
+
+logger = logging.getLogger(__name__)
+
+# 예약 저장 위치
+SCHEDULE_DB_PATH = os.getenv("SCHEDULE_DB_PATH", "cache/schedules.sqlite3")
+# 예약 확인 주기 (초)
+SCHEDULER_TICK_SECONDS = float(os.getenv("SCHEDULER_TICK_SECONDS", "30"))
+# 실행 시각에 더하는 무작위 지연 최대값 (초)
+SCHEDULE_JITTER_SECONDS = float(os.getenv("SCHEDULE_JITTER_SECONDS", "300"))
+# 사용자당 최대 예약 수
+MAX_SCHEDULES_PER_USER = int(os.getenv("MAX_SCHEDULES_PER_USER", "20"))
+
+# 지원하는 실행 주기 (초)
+FREQUENCY_SECONDS = {
+    "hourly": 3600,
+    "daily": 24 * 3600,
+    "weekly": 7 * 24 * 3600
+}
+
+def schedule_group_key(input_text: str, channels: List[str], frequency: str) -> str:
+    """
+    같은 분석을 같은 주기로 예약한 요청을 묶는 키를 만듭니다.
+
+    Args:
+        input_text (str): 분석할 입력 텍스트
+        channels (List[str]): 크롤링 채널 목록
+        frequency (str): 실행 주기
+
+    Returns:
+        str: 그룹 키
+    """
+    normalized = json.dumps(
+        [" ".join(input_text.split()).lower(), sorted(set(channels)), frequency],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+def next_run_time(group_key: str, frequency: str, after: float) -> float:
+    """
+    다음 실행 시각을 계산합니다.
+    그룹 키에서 정한 고정 위상으로 주기 전체에 실행 시각을 고르게 분산하고(자정 몰림 방지),
+    작은 무작위 지연을 더합니다. 같은 그룹은 같은 위상을 가지므로 함께 실행됩니다.
+
+    Args:
+        group_key (str): 그룹 키
+        frequency (str): 실행 주기
+        after (float): 이 시각 이후의 실행 시각을 계산 (epoch 초)
+
+    Returns:
+        float: 다음 실행 시각 (epoch 초)
+    """
+    interval = FREQUENCY_SECONDS[frequency]
+    phase = int(group_key[:12], 16) % interval
+    next_slot = (int(after - phase) // interval + 1) * interval + phase
+    return next_slot + random.uniform(0, min(SCHEDULE_JITTER_SECONDS, interval * 0.1))
+
+class SchedulerManager:
+    def __init__(self, path: str = SCHEDULE_DB_PATH):
+        """
+        반복 분석 예약 저장소와 실행 루프를 초기화합니다.
+        실행 시각이 된 그룹은 job_queue에 작업 하나로 넣어 작업 워커가 처리합니다.
+
+        Args:
+            path (str): SQLite 파일 경로
+        """
+        self.path = path
+        self._task: Optional[asyncio.Task] = None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS schedules (
+                    id TEXT PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    input_text TEXT NOT NULL,
+                    channels TEXT NOT NULL,
+                    frequency TEXT NOT NULL,
+                    group_key TEXT NOT NULL,
+                    next_run_at REAL NOT NULL,
+                    last_run_at REAL,
+                    last_job_id TEXT,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_schedules_next_run ON schedules (next_run_at)")
+            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_schedules_user_group ON schedules (user_id, group_key)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def add_schedule(self, user_id: str, input_text: str, channels: List[str], frequency: str) -> Dict[str, Any]:
+        """
+        반복 분석을 예약합니다. 같은 사용자가 같은 분석을 다시 예약하면 기존 예약을 반환합니다.
+
+        Args:
+            user_id (str): 사용자 ID
+            input_text (str): 분석할 입력 텍스트
+            channels (List[str]): 크롤링 채널 목록
+            frequency (str): 실행 주기 (hourly, daily, weekly)
+
+        Returns:
+            Dict[str, Any]: 예약 정보
+
+        Raises:
+            ValueError: 입력값이 잘못되었거나 사용자 예약 수 한도를 넘은 경우
+        """
+        if frequency not in FREQUENCY_SECONDS:
+            raise ValueError(f"지원하지 않는 주기입니다: {frequency} (가능: {', '.join(FREQUENCY_SECONDS)})")
+        if not input_text or not input_text.strip():
+            raise ValueError("분석할 텍스트가 비어 있습니다")
+        if not channels:
+            raise ValueError("채널을 하나 이상 선택해야 합니다")
+
+        group_key = schedule_group_key(input_text, channels, frequency)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            existing = conn.execute(
+                "SELECT * FROM schedules WHERE user_id = ? AND group_key = ?",
+                (user_id, group_key)
+            ).fetchone()
+            if existing is not None:
+                conn.execute("COMMIT")
+                return dict(existing)
+
+            count = conn.execute("SELECT COUNT(*) FROM schedules WHERE user_id = ?", (user_id,)).fetchone()[0]
+            if count >= MAX_SCHEDULES_PER_USER:
+                conn.execute("COMMIT")
+                raise ValueError(f"예약은 사용자당 최대 {MAX_SCHEDULES_PER_USER}개까지 가능합니다")
+
+            # 같은 그룹의 기존 예약이 있으면 그 실행 시각에 합류
+            group = conn.execute(
+                "SELECT MIN(next_run_at) FROM schedules WHERE group_key = ?",
+                (group_key,)
+            ).fetchone()[0]
+            schedule = {
+                "id": str(uuid4()),
+                "user_id": user_id,
+                "input_text": input_text,
+                "channels": json.dumps(sorted(set(channels))),
+                "frequency": frequency,
+                "group_key": group_key,
+                "next_run_at": group if group is not None else next_run_time(group_key, frequency, now),
+                "last_run_at": None,
+                "last_job_id": None,
+                "created_at": now
+            }
+            conn.execute(
+                "INSERT INTO schedules (id, user_id, input_text, channels, frequency, group_key, next_run_at, created_at) "
+                "VALUES (:id, :user_id, :input_text, :channels, :frequency, :group_key, :next_run_at, :created_at)",
+                schedule
+            )
+            conn.execute("COMMIT")
+        logger.info(f"[SCHEDULER] 예약 추가: user={user_id}, 주기={frequency}, 그룹={group_key[:12]}")
+        return schedule
+
+    def remove_schedule(self, schedule_id: str, user_id: str) -> bool:
+        """
+        사용자의 예약을 삭제합니다.
+
+        Args:
+            schedule_id (str): 예약 ID
+            user_id (str): 사용자 ID
+
+        Returns:
+            bool: 삭제 여부
+        """
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM schedules WHERE id = ? AND user_id = ?", (schedule_id, user_id))
+            return cursor.rowcount > 0
+
+    def list_schedules(self, user_id: str) -> List[Dict[str, Any]]:
+        """
+        사용자의 예약 목록을 반환합니다.
+
+        Args:
+            user_id (str): 사용자 ID
+
+        Returns:
+            List[Dict[str, Any]]: 예약 목록 (다음 실행 시각 순)
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM schedules WHERE user_id = ? ORDER BY next_run_at",
+                (user_id,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def dispatch_due(self, now: Optional[float] = None) -> List[str]:
+        """
+        실행 시각이 된 예약을 그룹별 작업 하나로 job_queue에 넣고 다음 실행 시각을 갱신합니다.
+        쓰기 잠금 안에서 처리하므로 여러 웹 워커가 동시에 실행해도 한 번만 발송됩니다.
+
+        Args:
+            now (Optional[float]): 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            List[str]: 등록한 작업 ID 목록
+        """
+        now = now or time.time()
+        job_ids = []
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT * FROM schedules WHERE group_key IN "
+                "(SELECT group_key FROM schedules WHERE next_run_at <= ?) ORDER BY group_key",
+                (now,)
+            ).fetchall()
+            groups: Dict[str, List[sqlite3.Row]] = {}
+            for row in rows:
+                groups.setdefault(row["group_key"], []).append(row)
+
+            for group_key, members in groups.items():
+                first = members[0]
+                job_id = job_queue.enqueue(
+                    "scheduled_analysis",
+                    {
+                        "group_key": group_key,
+                        "input_text": first["input_text"],
+                        "channels": json.loads(first["channels"]),
+                        "subscribers": [{"schedule_id": row["id"], "user_id": row["user_id"]} for row in members]
+                    }
+                )
+                next_run_at = next_run_time(group_key, first["frequency"], now)
+                conn.execute(
+                    "UPDATE schedules SET next_run_at = ?, last_run_at = ?, last_job_id = ? WHERE group_key = ?",
+                    (next_run_at, now, job_id, group_key)
+                )
+                job_ids.append(job_id)
+                logger.info(f"[SCHEDULER] 그룹 실행: {group_key[:12]}, 구독자 {len(members)}명, 작업 {job_id}")
+            conn.execute("COMMIT")
+        return job_ids
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        예약 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 예약 수, 그룹 수 (실제 실행 단위)
+        """
+        with self._connect() as conn:
+            schedules, groups = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT group_key) FROM schedules"
+            ).fetchone()
+        return {"schedules": schedules, "groups": groups}
+
+    async def _run_loop(self, interval: float) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.dispatch_due)
+            except Exception as e:
+                logger.error(f"[SCHEDULER] 예약 발송 실패: {str(e)}")
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float = SCHEDULER_TICK_SECONDS) -> None:
+        """
+        주기적으로 실행 시각이 된 예약을 발송하는 백그라운드 작업을 시작합니다 (이미 실행 중이면 무시).
+
+        Args:
+            interval (float): 확인 주기 (초)
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run_loop(interval))
+
+    async def stop(self) -> None:
+        """예약 발송 작업을 중지합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+# 전역 SchedulerManager 인스턴스 생성
+scheduler_manager = SchedulerManager()
+
+def schedule_analysis(user_id: str, input_text: str, channels: List[str], frequency: str) -> Dict[str, Any]:
+    """
+    반복 분석을 예약합니다 (/schedule-analysis).
+
+    Args:
+        user_id (str): 사용자 ID
+        input_text (str): 분석할 입력 텍스트
+        channels (List[str]): 크롤링 채널 목록
+        frequency (str): 실행 주기 (hourly, daily, weekly)
+
+    Returns:
+        Dict[str, Any]: 예약 정보
+    """
+    return scheduler_manager.add_schedule(user_id, input_text, channels, frequency)
@@ -0,0 +1,209 @@
+"""
+Idempotent schema upgrades for the api database (tables, added columns, binary column types, indexes, counter backfill)
+
+Usage:
+    python -m api.services.schema_migration           # 배포 전 한 번 실행 (웹 워커 시작 시에도 자동 실행)
+    python -m api.services.schema_migration recount   # 배포 후 이전 버전 워커가 모두 종료되면 한 번 실행
+
+카운터 채우기는 카운터가 없는 사용자만 그 시점의 COUNT(*)로 채웁니다. 이전 버전 워커(카운터 갱신 없음)가
+그 뒤에 저장한 이력은 카운터에 반영되지 않으므로, 롤아웃이 끝나면 recount로 전체 카운터를 다시 계산해야 합니다.
+"""
+
+import argparse
+import logging
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from sqlalchemy import LargeBinary, MetaData, String, inspect as sa_inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# 여러 웹 워커가 동시에 스키마를 바꾸지 않도록 잡는 잠금 파일
+SCHEMA_LOCK_PATH = os.getenv("SCHEMA_LOCK_PATH", "cache/schema.lock")
+
+@contextmanager
+def _schema_lock(path: str = SCHEMA_LOCK_PATH) -> Iterator[None]:
+    """같은 호스트의 다른 프로세스가 스키마를 바꾸는 동안 기다립니다 (fcntl이 없으면 잠금 없이 진행)."""
+    if fcntl is None:
+        yield
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def _create_missing_tables(engine: Engine, metadata: MetaData) -> None:
+    """없는 테이블을 만듭니다. 다른 프로세스가 먼저 만들었으면 건너뜁니다."""
+    for table in metadata.sorted_tables:
+        try:
+            table.create(bind=engine, checkfirst=True)
+        except DatabaseError:
+            # 다른 호스트의 프로세스가 먼저 만든 경우 (already exists)
+            if not sa_inspect(engine).has_table(table.name):
+                raise
+
+def _add_missing_columns(engine: Engine, metadata: MetaData) -> int:
+    """기존 테이블에 없는 nullable 컬럼을 추가합니다. 다른 프로세스가 먼저 추가했으면 건너뜁니다."""
+    inspector = sa_inspect(engine)
+    table_names = set(inspector.get_table_names())
+    added = 0
+    for table in metadata.sorted_tables:
+        if table.name not in table_names:
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            try:
+                with engine.begin() as conn:
+                    conn.execute(text(
+                        f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(engine.dialect)}"
+                    ))
+                added += 1
+                logger.info(f"[SCHEMA] 컬럼 추가: {table.name}.{column.name}")
+            except DatabaseError:
+                # 다른 호스트의 프로세스가 먼저 추가한 경우 (duplicate column)
+                if column.name not in {c["name"] for c in sa_inspect(engine).get_columns(table.name)}:
+                    raise
+    return added
+
+def _convert_binary_columns(engine: Engine, metadata: MetaData) -> None:
+    """
+    모델에서 바이너리로 바뀐 컬럼이 DB에 아직 텍스트 타입이면 BYTEA로 바꿉니다 (PostgreSQL).
+    기존 값은 UTF-8 바이트로 옮겨지고 코덱이 헤더 없는 이전 값으로 읽습니다.
+    SQLite는 컬럼 타입과 상관없이 BLOB을 저장하므로 바꾸지 않습니다.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    inspector = sa_inspect(engine)
+    table_names = set(inspector.get_table_names())
+    for table in metadata.sorted_tables:
+        if table.name not in table_names:
+            continue
+        existing = {c["name"]: c["type"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            impl = getattr(column.type, "impl", column.type)
+            if not isinstance(impl, LargeBinary) or not isinstance(existing.get(column.name), String):
+                continue
+            try:
+                with engine.begin() as conn:
+                    conn.execute(text(
+                        f"ALTER TABLE {table.name} ALTER COLUMN {column.name} "
+                        f"TYPE BYTEA USING convert_to({column.name}, 'UTF8')"
+                    ))
+                logger.info(f"[SCHEMA] 컬럼 타입 변경: {table.name}.{column.name} -> BYTEA")
+            except DatabaseError:
+                # 다른 호스트의 프로세스가 먼저 바꾼 경우
+                columns = {c["name"]: c["type"] for c in sa_inspect(engine).get_columns(table.name)}
+                if isinstance(columns.get(column.name), String):
+                    raise
+
+def _create_missing_indexes(engine: Engine, metadata: MetaData) -> None:
+    """모델에 선언된 인덱스 중 없는 것을 만듭니다 (create_all은 기존 테이블의 인덱스를 만들지 않음)."""
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except DatabaseError:
+                if index.name not in {i["name"] for i in sa_inspect(engine).get_indexes(table.name)}:
+                    raise
+
+def _backfill_history_counters(engine: Engine, metadata: MetaData) -> None:
+    """
+    카운터 도입 전에 저장된 이력의 사용자별 카운터를 채웁니다. 이미 카운터가 있는 사용자는 건너뜁니다.
+    이후 이전 버전 워커가 저장한 이력은 반영되지 않으므로 롤아웃 후 recount_history_counters를 실행합니다.
+    """
+    if "history_counters" not in metadata.tables:
+        return
+    for table in metadata.sorted_tables:
+        if not table.info.get("history_counted"):
+            continue
+        with engine.begin() as conn:
+            result = conn.execute(text(
+                f"INSERT INTO history_counters (user_id, table_name, count) "
+                f"SELECT user_id, :table_name, COUNT(*) FROM {table.name} AS t "
+                f"WHERE NOT EXISTS (SELECT 1 FROM history_counters AS c "
+                f"WHERE c.user_id = t.user_id AND c.table_name = :table_name) "
+                f"GROUP BY user_id "
+                f"ON CONFLICT DO NOTHING"
+            ), {"table_name": table.name})
+        if result.rowcount:
+            logger.info(f"[SCHEMA] 이력 카운터 채움: {table.name}, 사용자 {result.rowcount}명")
+
+def recount_history_counters(engine: Engine, metadata: MetaData) -> int:
+    """
+    이력 테이블별로 모든 사용자의 카운터를 COUNT(*)로 다시 계산합니다.
+    카운터 갱신이 없는 이전 버전 워커가 모두 종료된 뒤에 실행해야 하며,
+    테이블마다 한 트랜잭션에서 지우고 다시 채우므로 그동안 저장된 이력도 빠지지 않습니다.
+
+    Args:
+        engine (Engine): 데이터베이스 엔진
+        metadata (MetaData): 모델 메타데이터
+
+    Returns:
+        int: 다시 계산한 카운터 수
+    """
+    if "history_counters" not in metadata.tables:
+        return 0
+    total = 0
+    for table in metadata.sorted_tables:
+        if not table.info.get("history_counted"):
+            continue
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM history_counters WHERE table_name = :table_name"), {"table_name": table.name})
+            result = conn.execute(text(
+                f"INSERT INTO history_counters (user_id, table_name, count) "
+                f"SELECT user_id, :table_name, COUNT(*) FROM {table.name} GROUP BY user_id"
+            ), {"table_name": table.name})
+        total += result.rowcount
+        logger.info(f"[SCHEMA] 이력 카운터 재계산: {table.name}, 사용자 {result.rowcount}명")
+    return total
+
+def upgrade_schema(engine: Engine, metadata: MetaData) -> None:
+    """
+    테이블 생성, 새 nullable 컬럼 추가, 바이너리 컬럼 전환, 인덱스 생성, 이력 카운터 채우기를 한 번에 처리합니다.
+    모든 단계가 이미 적용된 상태에서 다시 실행해도 아무것도 바꾸지 않으며,
+    잠금 파일로 같은 호스트의 워커들이 순서대로 실행하게 합니다.
+
+    Args:
+        engine (Engine): 데이터베이스 엔진
+        metadata (MetaData): 모델 메타데이터
+    """
+    with _schema_lock():
+        _create_missing_tables(engine, metadata)
+        _add_missing_columns(engine, metadata)
+        _convert_binary_columns(engine, metadata)
+        _create_missing_indexes(engine, metadata)
+        _backfill_history_counters(engine, metadata)
+
+def main(argv: Any = None) -> None:
+    parser = argparse.ArgumentParser(description="스키마 업그레이드")
+    parser.add_argument("command", nargs="?", choices=["upgrade", "recount"], default="upgrade")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    from api.db.database import Base, engine
+    import api.models  # noqa: F401 (모델 등록)
+
+    if args.command == "recount":
+        with _schema_lock():
+            count = recount_history_counters(engine, Base.metadata)
+        print(f"이력 카운터 {count}개 재계산 완료")
+        return
+    upgrade_schema(engine, Base.metadata)
+    print("스키마 업그레이드 완료")
+
+if __name__ == "__main__":
+    main()
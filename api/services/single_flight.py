@@ -0,0 +1,55 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+class SingleFlight:
+    def __init__(self):
+        """
+        같은 키로 동시에 들어온 요청을 하나의 실행으로 합치는 single-flight 관리자를 초기화합니다.
+        """
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._shared_count = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        같은 키의 실행이 진행 중이면 그 결과를 기다리고, 아니면 새로 실행합니다.
+        실행은 별도 작업으로 돌아가므로 먼저 요청한 쪽이 취소되어도 대기 중인 요청은 결과를 받습니다.
+
+        Args:
+            key (str): 요청 식별 키
+            func (Callable[[], Awaitable[Any]]): 실제 작업을 수행하는 코루틴 함수
+
+        Returns:
+            Tuple[Any, bool]: (실행 결과, 다른 요청의 결과를 공유했는지 여부)
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._shared_count += 1
+            logger.info(f"[SINGLE_FLIGHT] 진행 중인 요청에 합류: key={key}")
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(func())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done_task: self._release(key, done_task))
+        return await asyncio.shield(task), False
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        single-flight 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 진행 중인 키 수와 합류한 요청 수
+        """
+        return {
+            "in_flight": len(self._in_flight),
+            "shared_requests": self._shared_count
+        }
+
+# 전역 SingleFlight 인스턴스 생성
+single_flight = SingleFlight()
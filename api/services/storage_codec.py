@@ -0,0 +1,210 @@
+"""
+Compression codec for stored result payloads (history result_json, crawl dumps)
+
+Stored values are bytes with a one-byte format header. The header bytes are
+never valid as the first byte of UTF-8 text, so rows written before
+compression (plain JSON text) are still told apart and read as-is, and a
+plain value can never be mistaken for an encoded one.
+"""
+
+import gzip
+import logging
+import os
+import zlib
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# 압축 사용 여부 (false면 새로 쓰는 값은 압축 없이 저장, 읽기는 항상 지원)
+STORAGE_COMPRESSION = os.getenv("STORAGE_COMPRESSION", "true").lower() == "true"
+# 이 크기(바이트)보다 작은 값은 압축하지 않음
+STORAGE_COMPRESS_MIN_BYTES = int(os.getenv("STORAGE_COMPRESS_MIN_BYTES", "256"))
+# zstd 압축 레벨
+STORAGE_ZSTD_LEVEL = int(os.getenv("STORAGE_ZSTD_LEVEL", "9"))
+# 한국어 마케팅 텍스트로 학습한 zstd 사전 경로 (없으면 사전 없이 압축)
+STORAGE_ZSTD_DICT_PATH = os.getenv("STORAGE_ZSTD_DICT_PATH", "cache/storage.zdict")
+# 사전 학습 기본 크기 (바이트)
+STORAGE_ZSTD_DICT_SIZE = int(os.getenv("STORAGE_ZSTD_DICT_SIZE", str(112 * 1024)))
+
+# 저장 형식 헤더 (UTF-8 텍스트의 첫 바이트가 될 수 없는 값)
+FORMAT_RAW = 0xF8
+FORMAT_ZLIB = 0xF9
+FORMAT_ZSTD = 0xFA
+FORMAT_ZSTD_DICT = 0xFB
+STORAGE_FORMATS = (FORMAT_RAW, FORMAT_ZLIB, FORMAT_ZSTD, FORMAT_ZSTD_DICT)
+
+class StorageCodec:
+    def __init__(self, dict_path: str = STORAGE_ZSTD_DICT_PATH, level: int = STORAGE_ZSTD_LEVEL):
+        """
+        결과 텍스트/파일을 압축하는 코덱을 초기화합니다.
+        zstandard가 설치되어 있으면 zstd(사전이 있으면 사전 사용), 없으면 zlib으로 압축합니다.
+
+        Args:
+            dict_path (str): zstd 사전 파일 경로
+            level (int): zstd 압축 레벨
+        """
+        self.level = level
+        self._dict = None
+        if ZSTD_AVAILABLE and os.path.exists(dict_path):
+            with open(dict_path, "rb") as f:
+                self._dict = zstandard.ZstdCompressionDict(f.read())
+            logger.info(f"[CODEC] zstd 사전 로드: {dict_path} (id={self._dict.dict_id()})")
+        elif not ZSTD_AVAILABLE:
+            logger.warning("[CODEC] zstandard 미설치: zlib으로 압축합니다")
+
+    def _compressor(self, use_dict: bool):
+        if use_dict:
+            return zstandard.ZstdCompressor(level=self.level, dict_data=self._dict)
+        return zstandard.ZstdCompressor(level=self.level)
+
+    def _decompressor(self, use_dict: bool):
+        if use_dict:
+            if self._dict is None:
+                raise ValueError("zstd 사전으로 압축된 값이지만 사전이 없습니다 (STORAGE_ZSTD_DICT_PATH 확인)")
+            return zstandard.ZstdDecompressor(dict_data=self._dict)
+        return zstandard.ZstdDecompressor()
+
+    def current_format(self) -> int:
+        """현재 설정으로 압축할 때 붙는 형식 헤더를 반환합니다."""
+        if not ZSTD_AVAILABLE:
+            return FORMAT_ZLIB
+        return FORMAT_ZSTD_DICT if self._dict is not None else FORMAT_ZSTD
+
+    def encode_value(self, value: Optional[str], compress: bool = True) -> Optional[bytes]:
+        """
+        텍스트를 형식 헤더가 붙은 바이트로 변환합니다. 작은 값이나 압축 효과가 없는 값은 압축 없이 저장합니다.
+        모든 값에 헤더가 붙으므로 원문이 어떤 내용이든 읽을 때 압축된 값으로 오인되지 않습니다.
+
+        Args:
+            value (Optional[str]): 원문
+            compress (bool): False면 압축하지 않음
+
+        Returns:
+            Optional[bytes]: 저장할 값
+        """
+        if value is None:
+            return None
+        raw = value.encode("utf-8")
+        if not compress or not STORAGE_COMPRESSION or len(raw) < STORAGE_COMPRESS_MIN_BYTES:
+            return bytes([FORMAT_RAW]) + raw
+
+        fmt = self.current_format()
+        if fmt == FORMAT_ZLIB:
+            compressed = zlib.compress(raw, 9)
+        else:
+            compressed = self._compressor(fmt == FORMAT_ZSTD_DICT).compress(raw)
+
+        # 압축 효과가 없으면 압축 없이 저장
+        if len(compressed) >= len(raw):
+            return bytes([FORMAT_RAW]) + raw
+        return bytes([fmt]) + compressed
+
+    def decode_value(self, value: Optional[Union[bytes, memoryview, str]]) -> Optional[str]:
+        """
+        저장된 값을 원문으로 되돌립니다.
+        헤더가 없는 값은 압축 전에 저장된 원문으로 보고 그대로 읽습니다.
+
+        Args:
+            value (Optional[Union[bytes, memoryview, str]]): 저장된 값 (드라이버에 따라 bytes/memoryview, 압축 전 Text 행은 str)
+
+        Returns:
+            Optional[str]: 원문
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return value
+        data = bytes(value)
+        if not data or data[0] not in STORAGE_FORMATS:
+            return data.decode("utf-8")
+
+        fmt, payload = data[0], data[1:]
+        if fmt == FORMAT_RAW:
+            return payload.decode("utf-8")
+        if fmt == FORMAT_ZLIB:
+            return zlib.decompress(payload).decode("utf-8")
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd로 압축된 값이지만 zstandard가 설치되어 있지 않습니다")
+        return self._decompressor(fmt == FORMAT_ZSTD_DICT).decompress(payload).decode("utf-8")
+
+    def encode_file(self, data: bytes) -> Tuple[bytes, str]:
+        """
+        파일 내용을 압축합니다. 표준 형식(.zst / .gz)으로 저장해 명령줄 도구로도 열 수 있습니다.
+
+        Args:
+            data (bytes): 파일 내용
+
+        Returns:
+            Tuple[bytes, str]: (압축된 내용, 파일 확장자)
+        """
+        if ZSTD_AVAILABLE:
+            # 파일은 사전 없이 압축해 zstd -d로 바로 풀 수 있게 함
+            return self._compressor(False).compress(data), ".zst"
+        return gzip.compress(data, 9), ".gz"
+
+    def decode_file(self, data: bytes, suffix: str) -> bytes:
+        """
+        encode_file로 압축한 파일 내용을 되돌립니다.
+
+        Args:
+            data (bytes): 압축된 내용
+            suffix (str): 파일 확장자 (.zst, .gz)
+
+        Returns:
+            bytes: 원래 내용
+        """
+        if suffix == ".zst":
+            if not ZSTD_AVAILABLE:
+                raise ValueError("zstd 파일이지만 zstandard가 설치되어 있지 않습니다")
+            return self._decompressor(False).decompress(data)
+        if suffix == ".gz":
+            return gzip.decompress(data)
+        return data
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        코덱 설정을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 압축 사용 여부, 알고리즘, 사전 ID
+        """
+        return {
+            "enabled": STORAGE_COMPRESSION,
+            "algorithm": "zstd" if ZSTD_AVAILABLE else "zlib",
+            "level": self.level,
+            "dict_id": self._dict.dict_id() if self._dict is not None else None
+        }
+
+def train_dictionary(samples: List[str], path: str = STORAGE_ZSTD_DICT_PATH, size: int = STORAGE_ZSTD_DICT_SIZE) -> int:
+    """
+    저장된 결과 텍스트로 zstd 사전을 학습해 파일로 저장합니다.
+    사전을 바꾸면 기존 사전으로 압축한 값을 읽을 수 없으므로 이전 사전 파일을 보관하거나 재인코딩해야 합니다.
+
+    Args:
+        samples (List[str]): 학습용 텍스트 (수백 개 이상 권장)
+        path (str): 사전 저장 경로
+        size (int): 사전 크기 (바이트)
+
+    Returns:
+        int: 학습된 사전 ID
+    """
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("사전 학습에는 zstandard가 필요합니다")
+    dictionary = zstandard.train_dictionary(size, [sample.encode("utf-8") for sample in samples])
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(dictionary.as_bytes())
+    logger.info(f"[CODEC] zstd 사전 학습 완료: {path} (샘플 {len(samples)}개, id={dictionary.dict_id()})")
+    return dictionary.dict_id()
+
+# 전역 StorageCodec 인스턴스 생성
+storage_codec = StorageCodec()
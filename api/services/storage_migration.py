@@ -0,0 +1,177 @@
+"""
+Re-encode stored result payloads with the storage codec
+
+Usage:
+    python -m api.services.storage_migration train-dict   # 기존 결과로 zstd 사전 학습
+    python -m api.services.storage_migration encode       # 원문/다른 설정으로 압축된 행을 현재 코덱으로 재인코딩
+    python -m api.services.storage_migration decode       # 압축을 풀어 무압축 형식으로 되돌림 (롤백용)
+    python -m api.services.storage_migration crawl-logs   # 크롤링 JSON 덤프 압축
+
+사전을 새로 학습했다면 웹/작업 워커를 재시작해 사전을 읽게 한 뒤 encode를 실행해야 합니다.
+Text 컬럼의 BYTEA 전환은 웹 서버 시작 시 스키마 업그레이드에서 하며, encode는 압축 전 원문 행을 새 형식으로 바꿉니다.
+"""
+
+import argparse
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Union
+
+from sqlalchemy import bindparam, column, select, table, update
+from sqlalchemy.engine import Engine
+
+from .storage_codec import storage_codec, train_dictionary
+
+logger = logging.getLogger(__name__)
+
+# 압축 대상 테이블과 컬럼
+COMPRESSED_COLUMNS = [
+    ("analysis_history", "result_json"),
+    ("strategy_history", "result_json"),
+    ("crawl_history", "result_json")
+]
+# 크롤링 덤프 디렉토리 (api.routes.crawler와 같은 설정)
+CRAWL_LOG_DIR = os.getenv("CRAWL_LOG_DIR", "crawl_logs")
+# 한 번에 읽고 쓰는 행 수
+MIGRATION_BATCH_SIZE = int(os.getenv("STORAGE_MIGRATION_BATCH_SIZE", "500"))
+
+def _stored_size(value: Optional[Union[bytes, memoryview, str]]) -> int:
+    if value is None:
+        return 0
+    return len(value.encode("utf-8")) if isinstance(value, str) else len(bytes(value))
+
+def reencode_column(engine: Engine, table_name: str, column_name: str, decode: bool = False, batch_size: int = MIGRATION_BATCH_SIZE) -> Dict[str, int]:
+    """
+    테이블의 한 컬럼을 id 순서로 배치 단위로 읽어 현재 코덱으로 다시 저장합니다.
+    TypeDecorator를 거치지 않는 컬럼 정의를 사용하므로 저장된 값을 그대로 읽고 씁니다.
+
+    Args:
+        engine (Engine): 데이터베이스 엔진
+        table_name (str): 테이블 이름
+        column_name (str): 컬럼 이름
+        decode (bool): True면 압축 없이 저장
+        batch_size (int): 배치 크기
+
+    Returns:
+        Dict[str, int]: 처리 행 수, 변경 행 수, 변경 전후 바이트
+    """
+    target = table(table_name, column("id"), column(column_name))
+    stats = {"rows": 0, "updated": 0, "bytes_before": 0, "bytes_after": 0}
+    last_id = ""
+    while True:
+        with engine.connect() as conn:
+            rows = conn.execute(
+                select(target.c.id, target.c[column_name])
+                .where(target.c.id > last_id)
+                .order_by(target.c.id)
+                .limit(batch_size)
+            ).all()
+        if not rows:
+            break
+
+        updates = []
+        for record_id, value in rows:
+            plain = storage_codec.decode_value(value)
+            encoded = storage_codec.encode_value(plain, compress=not decode)
+            stats["rows"] += 1
+            stats["bytes_before"] += _stored_size(value)
+            stats["bytes_after"] += _stored_size(encoded)
+            # 압축 전 Text 값(str)은 항상 새 형식으로 씀
+            if encoded != (bytes(value) if isinstance(value, (bytes, memoryview)) else value):
+                updates.append({"_id": record_id, "_value": encoded})
+
+        if updates:
+            with engine.begin() as conn:
+                conn.execute(
+                    update(target).where(target.c.id == bindparam("_id")).values({column_name: bindparam("_value")}),
+                    updates
+                )
+            stats["updated"] += len(updates)
+        last_id = rows[-1][0]
+        logger.info(f"[MIGRATION] {table_name}.{column_name}: {stats['rows']}행 처리, {stats['updated']}행 변경")
+    return stats
+
+def reencode_all(engine: Engine, decode: bool = False) -> Dict[str, Dict[str, int]]:
+    """
+    압축 대상 컬럼 전체를 재인코딩합니다.
+
+    Args:
+        engine (Engine): 데이터베이스 엔진
+        decode (bool): True면 압축 없이 저장
+
+    Returns:
+        Dict[str, Dict[str, int]]: 테이블별 처리 통계
+    """
+    return {
+        f"{table_name}.{column_name}": reencode_column(engine, table_name, column_name, decode=decode)
+        for table_name, column_name in COMPRESSED_COLUMNS
+    }
+
+def collect_dictionary_samples(engine: Engine, limit_per_table: int = 2000) -> List[str]:
+    """
+    사전 학습용으로 최근 결과 텍스트를 모읍니다.
+
+    Args:
+        engine (Engine): 데이터베이스 엔진
+        limit_per_table (int): 테이블당 최대 샘플 수
+
+    Returns:
+        List[str]: 원문 텍스트 목록
+    """
+    samples = []
+    with engine.connect() as conn:
+        for table_name, column_name in COMPRESSED_COLUMNS:
+            target = table(table_name, column("created_at"), column(column_name))
+            rows = conn.execute(
+                select(target.c[column_name]).order_by(target.c.created_at.desc()).limit(limit_per_table)
+            ).scalars()
+            samples.extend(storage_codec.decode_value(value) for value in rows if value)
+    return samples
+
+def compress_crawl_logs(directory: str) -> Dict[str, int]:
+    """
+    압축 전에 저장된 크롤링 JSON 덤프(indent=2)를 압축 형식으로 바꿉니다.
+
+    Args:
+        directory (str): 크롤링 덤프 디렉토리
+
+    Returns:
+        Dict[str, int]: 처리 파일 수, 변경 전후 바이트
+    """
+    stats = {"files": 0, "bytes_before": 0, "bytes_after": 0}
+    if not os.path.isdir(directory):
+        return stats
+    for entry in os.scandir(directory):
+        if not entry.name.endswith(".json") or not entry.is_file():
+            continue
+        with open(entry.path, "r", encoding="utf-8") as f:
+            payload = json.dumps(json.load(f), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        data, suffix = storage_codec.encode_file(payload)
+        with open(entry.path + suffix, "wb") as f:
+            f.write(data)
+        stats["files"] += 1
+        stats["bytes_before"] += entry.stat().st_size
+        stats["bytes_after"] += len(data)
+        os.remove(entry.path)
+    logger.info(f"[MIGRATION] 크롤링 덤프 {stats['files']}개 압축")
+    return stats
+
+def main(argv: Any = None) -> None:
+    parser = argparse.ArgumentParser(description="결과 데이터 압축 마이그레이션")
+    parser.add_argument("command", choices=["train-dict", "encode", "decode", "crawl-logs"])
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "crawl-logs":
+        print(json.dumps(compress_crawl_logs(CRAWL_LOG_DIR), indent=2))
+        return
+
+    from api.db.database import engine
+    if args.command == "train-dict":
+        dict_id = train_dictionary(collect_dictionary_samples(engine))
+        print(f"사전 ID {dict_id} 저장 완료. 워커를 재시작한 뒤 encode를 실행하세요.")
+    else:
+        print(json.dumps(reencode_all(engine, decode=args.command == "decode"), indent=2))
+
+if __name__ == "__main__":
+    main()
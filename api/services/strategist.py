@@ -4,9 +4,10 @@ Strategy Generation Service using GPT
 
 import json
 import os
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 import logging
 from api.services.claude_caller import ClaudeCaller
+from api.services.llm_router import llm_router
 from fastapi import HTTPException
 
 from openai import OpenAI
@@ -16,6 +17,8 @@ load_dotenv()
 
 logger = logging.getLogger("uvicorn.access")
 
+STRATEGY_SYSTEM_PROMPT = "You are an expert marketing strategist."
+
 class Strategist:
     def __init__(self):
         self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
@@ -28,14 +31,9 @@ class Strategist:
         with open(prompt_path, "r", encoding="utf-8") as f:
             return f.read()
             
-    async def generate_strategy(self, analysis_result: Dict) -> Dict:
-        """
-        분석 결과를 바탕으로 마케팅 전략을 생성합니다.
-        """
-        try:
-            logger.info(f"[STRATEGIST] 전략 생성 시작: 분석 결과={analysis_result}")
-            
-            prompt = f"""
+    def _build_prompt(self, analysis_result: Dict) -> str:
+        """분석 결과로 전략 생성 프롬프트를 만듭니다."""
+        return f"""
             다음 분석 결과를 바탕으로 마케팅 전략을 생성해주세요:
             {analysis_result}
             
@@ -46,9 +44,18 @@ class Strategist:
             4. 실행 계획
             """
             
-            response = await self.claude.call(
-                prompt=prompt,
-                system="You are an expert marketing strategist."
+    async def generate_strategy(self, analysis_result: Dict) -> Dict:
+        """
+        분석 결과를 바탕으로 마케팅 전략을 생성합니다.
+        """
+        try:
+            logger.info(f"[STRATEGIST] 전략 생성 시작: 분석 결과={analysis_result}")
+            
+            # Claude가 늦거나 실패하면 GPT로 헤지/대체 요청
+            response = await llm_router.call(
+                prompt=self._build_prompt(analysis_result),
+                system=STRATEGY_SYSTEM_PROMPT,
+                primary="anthropic"
             )
             
             if not response or "content" not in response:
@@ -63,4 +70,22 @@ class Strategist:
             raise HTTPException(
                 status_code=500,
                 detail="전략 생성 중 오류가 발생했습니다"
-            ) 
\ No newline at end of file
+            )
+
+    async def stream_strategy(self, analysis_result: Dict) -> AsyncIterator[str]:
+        """
+        분석 결과를 바탕으로 마케팅 전략을 생성하며 토큰을 도착하는 대로 전달합니다.
+
+        Args:
+            analysis_result (Dict): 분석 결과
+
+        Yields:
+            str: 전략 텍스트 조각
+        """
+        logger.info(f"[STRATEGIST] 전략 스트리밍 시작")
+        async for text in self.claude.stream(
+            prompt=self._build_prompt(analysis_result),
+            system=STRATEGY_SYSTEM_PROMPT
+        ):
+            yield text
+        logger.info(f"[STRATEGIST] 전략 스트리밍 완료") 
\ No newline at end of file
@@ -0,0 +1,104 @@
+import os
+import re
+from typing import BinaryIO, Iterator, Optional, Tuple
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+# 파일 전송 단위
+FILE_CHUNK_SIZE = 64 * 1024
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def _parse_range(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 Range 헤더를 (시작, 끝) 바이트 위치로 변환합니다 (끝 포함).
+    여러 구간 요청이나 형식이 잘못된 헤더는 None(전체 전송)으로 처리합니다.
+    """
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        # 마지막 N바이트 요청 (bytes=-N)
+        length = int(end)
+        if length == 0:
+            raise ValueError("빈 범위입니다")
+        return max(file_size - length, 0), file_size - 1
+    start = int(start)
+    end = min(int(end), file_size - 1) if end else file_size - 1
+    if start >= file_size or start > end:
+        raise ValueError("범위가 파일 크기를 벗어났습니다")
+    return start, end
+
+def _iter_file(f: BinaryIO, start: int, end: int) -> Iterator[bytes]:
+    with f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(FILE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+def cached_file_response(
+    request: Request,
+    path: str,
+    media_type: str,
+    filename: str,
+    etag: str
+) -> Response:
+    """
+    내용이 바뀌지 않는 파일을 ETag/If-None-Match와 Range 요청을 지원하며 전송합니다.
+    같은 ETag를 가진 재요청은 304로, Range 요청은 206으로 해당 구간만 보냅니다.
+
+    Args:
+        request (Request): 요청 (If-None-Match, Range 헤더 확인용)
+        path (str): 파일 경로
+        media_type (str): Content-Type
+        filename (str): 다운로드 파일명
+        etag (str): 파일 내용 해시
+
+    Returns:
+        Response: 200 / 206 / 304 / 416 응답
+    """
+    quoted_etag = f'"{etag}"'
+    headers = {
+        "ETag": quoted_etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, max-age=0, must-revalidate",
+        "Content-Disposition": f'attachment; filename="{filename}"'
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or quoted_etag in [tag.strip() for tag in if_none_match.split(",")]):
+        return Response(status_code=304, headers={key: headers[key] for key in ("ETag", "Cache-Control")})
+
+    # 응답을 만들기 전에 파일을 열어 두어 전송 중 캐시 정리로 파일이 삭제되어도 끝까지 읽을 수 있게 함
+    f = open(path, "rb")
+    file_size = os.fstat(f.fileno()).st_size
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    byte_range = None
+    if range_header and (not if_range or if_range.strip() == quoted_etag):
+        try:
+            byte_range = _parse_range(range_header, file_size)
+        except ValueError:
+            f.close()
+            return Response(status_code=416, headers={"Content-Range": f"bytes */{file_size}", **headers})
+
+    if byte_range is None:
+        headers["Content-Length"] = str(file_size)
+        return StreamingResponse(_iter_file(f, 0, file_size - 1), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _iter_file(f, start, end),
+        status_code=206,
+        media_type=media_type,
+        headers=headers
+    )
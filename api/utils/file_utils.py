@@ -1,8 +1,8 @@
 import os
-import glob
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
 from datetime import datetime
+from api.services.export_index import export_index
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ def ensure_export_directories():
 
 def find_latest_html_filename(analysis_id: str) -> Optional[str]:
     """
-    주어진 분석 ID에 대한 가장 최근 HTML 파일명을 찾습니다.
+    주어진 분석 ID에 대한 가장 최근 HTML 파일명을 찾습니다 (EXPORT_DIR_HTML에 저장된 파일만).
     
     Args:
         analysis_id (str): 분석 ID
@@ -34,17 +34,11 @@ def find_latest_html_filename(analysis_id: str) -> Optional[str]:
         Optional[str]: 가장 최근 HTML 파일명 또는 None
     """
     try:
-        pattern = f"{EXPORT_DIR_HTML}/{analysis_id}_*.html"
-        files = glob.glob(pattern)
-        
-        if not files:
-            logger.debug(f"HTML 파일을 찾을 수 없음: {pattern}")
+        latest = export_index.latest(analysis_id, "html", directory=EXPORT_DIR_HTML)
+        if latest is None:
+            logger.debug(f"HTML 파일을 찾을 수 없음: {analysis_id}")
             return None
-            
-        latest_file = max(files, key=os.path.getctime)
-        filename = os.path.basename(latest_file)
-        logger.debug(f"HTML 파일 찾음: {filename}")
-        return filename
+        return latest["filename"]
         
     except Exception as e:
         logger.error(f"HTML 파일명 검색 중 오류: {str(e)}")
@@ -52,7 +46,7 @@ def find_latest_html_filename(analysis_id: str) -> Optional[str]:
 
 def find_latest_pdf_filename(analysis_id: str) -> Optional[str]:
     """
-    주어진 분석 ID에 대한 가장 최근 PDF 파일명을 찾습니다.
+    주어진 분석 ID에 대한 가장 최근 PDF 파일명을 찾습니다 (EXPORT_DIR_PDF에 저장된 파일만).
     
     Args:
         analysis_id (str): 분석 ID
@@ -61,22 +55,36 @@ def find_latest_pdf_filename(analysis_id: str) -> Optional[str]:
         Optional[str]: 가장 최근 PDF 파일명 또는 None
     """
     try:
-        pattern = f"{EXPORT_DIR_PDF}/{analysis_id}_*.pdf"
-        files = glob.glob(pattern)
-        
-        if not files:
-            logger.debug(f"PDF 파일을 찾을 수 없음: {pattern}")
+        latest = export_index.latest(analysis_id, "pdf", directory=EXPORT_DIR_PDF)
+        if latest is None:
+            logger.debug(f"PDF 파일을 찾을 수 없음: {analysis_id}")
             return None
-            
-        latest_file = max(files, key=os.path.getctime)
-        filename = os.path.basename(latest_file)
-        logger.debug(f"PDF 파일 찾음: {filename}")
-        return filename
+        return latest["filename"]
         
     except Exception as e:
         logger.error(f"PDF 파일명 검색 중 오류: {str(e)}")
         return None
 
+def find_latest_export_filenames(analysis_ids: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+    """
+    여러 분석 ID의 가장 최근 HTML/PDF 파일명을 EXPORT_DIR_HTML/EXPORT_DIR_PDF에서 한 번에 찾습니다 (목록 페이지용).
+    
+    Args:
+        analysis_ids (List[str]): 분석 ID 목록
+        
+    Returns:
+        Dict[str, Dict[str, Optional[str]]]: 분석 ID별 {"html_filename", "pdf_filename"}
+    """
+    filenames = {analysis_id: {"html_filename": None, "pdf_filename": None} for analysis_id in analysis_ids}
+    try:
+        # 인덱스에는 다른 디렉토리(exports 등)의 파일도 있으므로 파일명만 반환하는 여기서는 디렉토리를 고정
+        for kind, directory in (("html", EXPORT_DIR_HTML), ("pdf", EXPORT_DIR_PDF)):
+            for analysis_id, latest in export_index.latest_many(analysis_ids, kind, directory=directory).items():
+                filenames[analysis_id][f"{kind}_filename"] = latest["filename"]
+    except Exception as e:
+        logger.error(f"파일명 일괄 검색 중 오류: {str(e)}")
+    return filenames
+
 def cleanup_old_files(max_age_days: int = 7) -> None:
     """
     지정된 기간보다 오래된 파일들을 삭제합니다.
@@ -95,6 +103,7 @@ def cleanup_old_files(max_age_days: int = 7) -> None:
                     
                     if age_days > max_age_days:
                         os.remove(filepath)
+                        export_index.remove(filepath)
                         logger.info(f"오래된 파일 삭제: {filepath}")
                         
     except Exception as e:
@@ -0,0 +1,127 @@
+import hashlib
+import os
+import re
+from typing import Any, Dict, List, Set, Tuple
+from .text_cleaner import clean_text
+
+# 근사 중복 판정 유사도 기준 (0~1, SimHash 비트 일치율)
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.9"))
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+
+# "[Reddit] 제목" 형태의 채널 라벨
+_CHANNEL_LABEL_PATTERN = re.compile(r'\[[^\]]*\]\s*')
+
+def normalize_for_dedup(text: str) -> str:
+    """
+    중복 비교용으로 텍스트를 정규화합니다.
+    clean_text로 HTML/URL/이모지를 제거한 뒤 채널 라벨, 공백, 문장부호를 지웁니다.
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    text = clean_text(text)
+    text = _CHANNEL_LABEL_PATTERN.sub('', text)
+    text = re.sub(r'[^\w]', '', text)
+    return text.lower()
+
+def simhash(text: str, shingle_size: int = SHINGLE_SIZE) -> int:
+    """
+    정규화된 텍스트의 문자 shingle로 64비트 SimHash를 계산합니다.
+
+    Args:
+        text (str): 정규화된 텍스트
+        shingle_size (int): shingle 길이 (문자 단위)
+
+    Returns:
+        int: 64비트 SimHash 값
+    """
+    if len(text) <= shingle_size:
+        shingles = {text}
+    else:
+        shingles = {text[i:i + shingle_size] for i in range(len(text) - shingle_size + 1)}
+
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+class NearDuplicateIndex:
+    def __init__(self, similarity_threshold: float = NEAR_DUPLICATE_THRESHOLD):
+        """
+        SimHash + LSH 밴딩 기반 근사 중복 인덱스를 초기화합니다.
+        허용 해밍 거리보다 밴드 수를 하나 많게 나누면, 기준 이내의 두 지문은
+        적어도 한 밴드가 완전히 일치하므로 같은 버킷 후보만 비교하면 됩니다.
+
+        Args:
+            similarity_threshold (float): 중복으로 판정할 최소 유사도 (0~1)
+        """
+        self.max_distance = int((1 - similarity_threshold) * SIMHASH_BITS)
+        self.band_count = self.max_distance + 1
+        self.band_bits = SIMHASH_BITS // self.band_count
+        self._band_mask = (1 << self.band_bits) - 1
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._exact: Set[str] = set()
+
+    def _bands(self, fingerprint: int) -> List[Tuple[int, int]]:
+        return [
+            (band, (fingerprint >> (band * self.band_bits)) & self._band_mask)
+            for band in range(self.band_count)
+        ]
+
+    def add(self, text: str) -> bool:
+        """
+        텍스트를 인덱스에 추가합니다. 이미 유사한 텍스트가 있으면 추가하지 않습니다.
+
+        Args:
+            text (str): 비교할 텍스트 (제목 + 본문)
+
+        Returns:
+            bool: 새로운 텍스트면 True, 근사 중복이면 False
+        """
+        normalized = normalize_for_dedup(text)
+        if not normalized or normalized in self._exact:
+            return False
+
+        fingerprint = simhash(normalized)
+        bands = self._bands(fingerprint)
+        for band_key in bands:
+            for candidate in self._buckets.get(band_key, []):
+                if bin(candidate ^ fingerprint).count("1") <= self.max_distance:
+                    return False
+
+        self._exact.add(normalized)
+        for band_key in bands:
+            self._buckets.setdefault(band_key, []).append(fingerprint)
+        return True
+
+def remove_near_duplicates(
+    results: List[Dict[str, Any]],
+    similarity_threshold: float = NEAR_DUPLICATE_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """
+    크롤링 결과에서 제목+본문이 근사 중복인 항목을 제거합니다 (먼저 나온 항목 유지).
+
+    Args:
+        results (List[Dict[str, Any]]): 크롤링 결과 리스트
+        similarity_threshold (float): 중복으로 판정할 최소 유사도 (0~1)
+
+    Returns:
+        List[Dict[str, Any]]: 중복이 제거된 결과 리스트
+    """
+    index = NearDuplicateIndex(similarity_threshold)
+    return [
+        result for result in results
+        if index.add(f"{result.get('title', '')} {result.get('content', '')}")
+    ]
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# 게시물 날짜 문자열 형식 (커뮤니티마다 다름)
+POST_DATE_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d", "%Y.%m.%d", "%y/%m/%d", "%y.%m.%d"]
+POST_TIME_FORMATS = ["%H:%M:%S", "%H:%M"]
+
+def parse_post_date(value: Any) -> Optional[float]:
+    """
+    게시물 날짜 값을 UNIX 타임스탬프로 변환합니다.
+    시간만 표시된 값(오늘 게시물)은 오늘 날짜로 간주합니다.
+
+    Args:
+        value (Any): created_utc 숫자 또는 날짜 문자열
+
+    Returns:
+        Optional[float]: UNIX 타임스탬프 또는 None (해석 불가 시)
+    """
+    if isinstance(value, (int, float)):
+        return float(value) if value > 0 else None
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    text = value.strip()
+    for date_format in POST_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).timestamp()
+        except ValueError:
+            continue
+    for time_format in POST_TIME_FORMATS:
+        try:
+            parsed = datetime.strptime(text, time_format)
+            return datetime.now().replace(
+                hour=parsed.hour, minute=parsed.minute, second=parsed.second, microsecond=0
+            ).timestamp()
+        except ValueError:
+            continue
+    return None
+
+def post_timestamp(post: Dict[str, Any]) -> Optional[float]:
+    """
+    크롤링 결과에서 게시 시각을 추출합니다 (created_utc 또는 date 필드).
+
+    Args:
+        post (Dict[str, Any]): 크롤링 결과 항목
+
+    Returns:
+        Optional[float]: UNIX 타임스탬프 또는 None
+    """
+    return parse_post_date(post.get("created_utc")) or parse_post_date(post.get("date"))
@@ -0,0 +1,177 @@
+import os
+import re
+from typing import Any, Dict, List
+from ..config import Config
+from .token_counter import estimate_tokens
+
+# 호출당 프롬프트 입력 토큰 예산 (지시문 + 크롤링 본문)
+PROMPT_INPUT_TOKEN_BUDGET = int(os.getenv("PROMPT_INPUT_TOKEN_BUDGET", "8000"))
+# 모델 컨텍스트 크기 (입력 + 응답)
+MODEL_CONTEXT_TOKENS = int(os.getenv("MODEL_CONTEXT_TOKENS", "200000"))
+# 이보다 적은 토큰만 남는 게시물은 잘라 넣지 않고 제외
+MIN_ITEM_TOKENS = 40
+
+TRUNCATION_MARK = "…"
+_SENTENCE_END_PATTERN = re.compile(r'[.!?。？！\n]\s*')
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    텍스트를 추정 토큰 수 이내로 자릅니다. 가능하면 문장 경계에서 자릅니다.
+
+    Args:
+        text (str): 원본 텍스트
+        max_tokens (int): 최대 토큰 수
+
+    Returns:
+        str: 잘린 텍스트 (잘린 경우 끝에 말줄임표 추가)
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+
+    # 토큰 예산에 맞는 가장 긴 접두사를 이진 탐색
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) + 1 <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    prefix = text[:low]
+
+    # 접두사의 절반 이상을 유지할 수 있으면 마지막 문장 경계에서 자름
+    boundaries = [match.end() for match in _SENTENCE_END_PATTERN.finditer(prefix)]
+    if boundaries and boundaries[-1] >= len(prefix) // 2:
+        prefix = prefix[:boundaries[-1]]
+    return prefix.rstrip() + TRUNCATION_MARK
+
+def pack_texts(texts: List[str], token_budget: int, separator: str = "\n\n") -> Dict[str, Any]:
+    """
+    여러 텍스트를 토큰 예산 안에 들어가도록 합칩니다.
+    예산이 부족하면 게시물별 몫을 고르게 나누고(짧은 게시물이 남긴 몫은 재분배),
+    몫을 넘는 게시물은 앞부분만 남기며, 몫이 너무 작아지면 뒤쪽 게시물부터 제외합니다.
+
+    Args:
+        texts (List[str]): 합칠 텍스트 (우선순위 순)
+        token_budget (int): 최대 토큰 수
+        separator (str): 텍스트 구분자
+
+    Returns:
+        Dict[str, Any]: text(합쳐진 텍스트), packed_tokens, included_count, total_count, trimmed_count
+    """
+    texts = [text for text in texts if text and text.strip()]
+    separator_tokens = estimate_tokens(separator)
+    costs = [estimate_tokens(text) for text in texts]
+
+    included = len(texts)
+    while included > 0:
+        available = token_budget - separator_tokens * (included - 1)
+        if available // included >= MIN_ITEM_TOKENS or included == 1:
+            break
+        included -= 1
+
+    # 짧은 텍스트부터 전부 넣고, 남은 예산을 긴 텍스트에 고르게 배분
+    available = max(token_budget - separator_tokens * max(included - 1, 0), 0)
+    allowances = [0] * included
+    order = sorted(range(included), key=lambda index: costs[index])
+    for position, index in enumerate(order):
+        share = available // (included - position)
+        allowances[index] = min(costs[index], share)
+        available -= allowances[index]
+
+    packed_texts = []
+    trimmed_count = 0
+    for index in range(included):
+        if allowances[index] < costs[index]:
+            trimmed_count += 1
+            packed_texts.append(truncate_to_tokens(texts[index], allowances[index]))
+        else:
+            packed_texts.append(texts[index])
+
+    packed = separator.join(text for text in packed_texts if text)
+    return {
+        "text": packed,
+        "packed_tokens": estimate_tokens(packed),
+        "included_count": len([text for text in packed_texts if text]),
+        "total_count": len(texts),
+        "trimmed_count": trimmed_count
+    }
+
+def chunk_texts(texts: List[str], token_budget: int, separator: str = "\n\n") -> List[List[str]]:
+    """
+    텍스트를 순서대로 토큰 예산 단위의 묶음으로 나눕니다 (여러 번 호출로 분할 분석할 때 사용).
+    예산보다 긴 단일 텍스트는 예산에 맞게 잘라 단독 묶음으로 만듭니다.
+
+    Args:
+        texts (List[str]): 나눌 텍스트
+        token_budget (int): 묶음당 최대 토큰 수
+        separator (str): 텍스트 구분자
+
+    Returns:
+        List[List[str]]: 텍스트 묶음 리스트
+    """
+    separator_tokens = estimate_tokens(separator)
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+    for text in texts:
+        cost = estimate_tokens(text)
+        if cost > token_budget:
+            text, cost = truncate_to_tokens(text, token_budget), token_budget
+        extra = cost + (separator_tokens if current else 0)
+        if current and current_tokens + extra > token_budget:
+            chunks.append(current)
+            current, current_tokens, extra = [], 0, cost
+        current.append(text)
+        current_tokens += extra
+    if current:
+        chunks.append(current)
+    return chunks
+
+def response_token_limit(input_tokens: int, max_tokens: int = Config.DEFAULT_MAX_TOKENS) -> int:
+    """
+    요청별 max_tokens를 계산합니다.
+    응답 길이는 프롬프트 길이와 무관하므로 호출하는 쪽의 응답 예산을 그대로 쓰고,
+    컨텍스트 여유(모델 컨텍스트 - 입력)를 넘는 경우에만 줄입니다.
+
+    Args:
+        input_tokens (int): 프롬프트 추정 토큰 수
+        max_tokens (int): 응답 토큰 예산
+
+    Returns:
+        int: 요청에 사용할 max_tokens
+    """
+    return max(1, min(max_tokens, MODEL_CONTEXT_TOKENS - input_tokens))
+
+def pack_prompt(
+    template: str,
+    texts: List[str],
+    placeholder: str = "{content}",
+    input_budget: int = PROMPT_INPUT_TOKEN_BUDGET,
+    max_tokens: int = Config.DEFAULT_MAX_TOKENS
+) -> Dict[str, Any]:
+    """
+    지시문 템플릿의 placeholder에 텍스트를 예산 안에서 채워 넣고 응답 토큰 수를 정합니다.
+
+    Args:
+        template (str): placeholder가 포함된 프롬프트 템플릿
+        texts (List[str]): 채워 넣을 텍스트 (우선순위 순)
+        placeholder (str): 템플릿 내 치환 위치
+        input_budget (int): 템플릿을 포함한 입력 토큰 예산
+        max_tokens (int): 응답 토큰 예산
+
+    Returns:
+        Dict[str, Any]: prompt(완성된 프롬프트), max_tokens, 패킹 메타데이터
+    """
+    template_tokens = estimate_tokens(template.replace(placeholder, ""))
+    packed = pack_texts(texts, max(input_budget - template_tokens, 0))
+    prompt = template.replace(placeholder, packed.pop("text"))
+    packed_tokens = estimate_tokens(prompt)
+    packed.update({
+        "prompt": prompt,
+        "packed_tokens": packed_tokens,
+        "input_budget": input_budget,
+        "max_tokens": response_token_limit(packed_tokens, max_tokens)
+    })
+    return packed
@@ -0,0 +1,166 @@
+import math
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Set
+from .post_date import post_timestamp
+from .near_duplicate import normalize_for_dedup
+from .text_cleaner import clean_text
+from .token_counter import estimate_tokens
+
+# 점수 가중치 (관련도 / 반응도 / 최신성)
+RELEVANCE_WEIGHT = 0.6
+ENGAGEMENT_WEIGHT = 0.25
+RECENCY_WEIGHT = 0.15
+# 최신성 점수가 절반이 되는 기간 (초)
+RECENCY_HALF_LIFE_SECONDS = 7 * 24 * 3600
+# 이미 고른 결과와 비슷할수록, 같은 채널에서 많이 골랐을수록 주는 감점
+DIVERSITY_PENALTY = 0.3
+CHANNEL_PENALTY = 0.4
+# Claude 분석 입력 토큰 예산
+ANALYSIS_INPUT_TOKEN_BUDGET = int(os.getenv("ANALYSIS_INPUT_TOKEN_BUDGET", "6000"))
+
+# BM25 파라미터
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+def tokenize(text: str) -> List[str]:
+    """
+    BM25 계산용 토큰으로 분리합니다.
+    조사가 붙은 한국어 단어도 매칭되도록 단어와 함께 문자 bigram을 사용합니다.
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        List[str]: 토큰 리스트
+    """
+    tokens = []
+    for word in re.findall(r'\w+', clean_text(text).lower()):
+        tokens.append(word)
+        if len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+def _result_text(result: Dict[str, Any]) -> str:
+    return f"{result.get('title', '')} {result.get('content', '')}"
+
+def _to_number(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        digits = re.sub(r'[^\d.]', '', value)
+        try:
+            return float(digits) if digits else 0.0
+        except ValueError:
+            return 0.0
+    return 0.0
+
+def _normalize(values: List[float]) -> List[float]:
+    highest = max(values) if values else 0
+    return [value / highest if highest > 0 else 0.0 for value in values]
+
+def score_results(results: List[Dict[str, Any]], query: str) -> List[float]:
+    """
+    결과별로 키워드 관련도(BM25), 반응도(score/views), 최신성을 합친 점수를 계산합니다.
+
+    Args:
+        results (List[Dict[str, Any]]): 크롤링 결과 리스트
+        query (str): 검색어
+
+    Returns:
+        List[float]: 결과 순서와 같은 순서의 점수 (0~1)
+    """
+    if not results:
+        return []
+
+    documents = [tokenize(_result_text(result)) for result in results]
+    query_terms = set(tokenize(query))
+    average_length = sum(len(doc) for doc in documents) / len(documents) or 1
+    document_frequency = Counter(term for doc in documents for term in set(doc) if term in query_terms)
+
+    relevance = []
+    for doc in documents:
+        term_counts = Counter(doc)
+        score = 0.0
+        for term in query_terms:
+            frequency = term_counts.get(term, 0)
+            if not frequency:
+                continue
+            idf = math.log(1 + (len(documents) - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+            score += idf * frequency * (BM25_K1 + 1) / (
+                frequency + BM25_K1 * (1 - BM25_B + BM25_B * len(doc) / average_length)
+            )
+        relevance.append(score)
+
+    engagement = [
+        math.log1p(max(_to_number(result.get("score")), 0) + max(_to_number(result.get("views")), 0))
+        for result in results
+    ]
+
+    now = time.time()
+    recency = []
+    for result in results:
+        posted_at = post_timestamp(result)
+        recency.append(0.5 ** (max(now - posted_at, 0) / RECENCY_HALF_LIFE_SECONDS) if posted_at else 0.0)
+
+    return [
+        RELEVANCE_WEIGHT * rel + ENGAGEMENT_WEIGHT * eng + RECENCY_WEIGHT * rec
+        for rel, eng, rec in zip(_normalize(relevance), _normalize(engagement), recency)
+    ]
+
+def _shingles(text: str) -> Set[str]:
+    normalized = normalize_for_dedup(text)
+    return {normalized[i:i + 3] for i in range(max(len(normalized) - 2, 1))}
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+def select_results(
+    results: List[Dict[str, Any]],
+    query: str,
+    max_count: int,
+    token_budget: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    점수가 높으면서 채널이 고르게 섞이고 서로 겹치지 않는 결과를 고릅니다 (MMR 방식의 greedy 선택).
+    토큰 예산이 주어지면 예산을 넘는 결과는 건너뜁니다.
+
+    Args:
+        results (List[Dict[str, Any]]): 크롤링 결과 리스트
+        query (str): 검색어
+        max_count (int): 최대 결과 수
+        token_budget (Optional[int]): 선택 결과의 최대 추정 토큰 합계
+
+    Returns:
+        List[Dict[str, Any]]: 선택된 결과 (선택 순서 = 우선순위 순)
+    """
+    scores = score_results(results, query)
+    shingles = [_shingles(_result_text(result)) for result in results]
+    tokens = [estimate_tokens(_result_text(result)) for result in results]
+
+    remaining = set(range(len(results)))
+    selected: List[int] = []
+    channel_counts: Dict[str, int] = defaultdict(int)
+    used_tokens = 0
+
+    while remaining and len(selected) < max_count:
+        best_index, best_value = None, None
+        for index in remaining:
+            if token_budget is not None and used_tokens + tokens[index] > token_budget:
+                continue
+            similarity = max((_jaccard(shingles[index], shingles[chosen]) for chosen in selected), default=0.0)
+            channel_share = channel_counts[results[index].get("channel", "")] / len(selected) if selected else 0.0
+            value = scores[index] - DIVERSITY_PENALTY * similarity - CHANNEL_PENALTY * channel_share
+            if best_value is None or value > best_value:
+                best_index, best_value = index, value
+        if best_index is None:
+            break
+        remaining.discard(best_index)
+        selected.append(best_index)
+        channel_counts[results[best_index].get("channel", "")] += 1
+        used_tokens += tokens[best_index]
+
+    return [results[index] for index in selected]
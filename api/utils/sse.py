@@ -0,0 +1,47 @@
+import json
+import logging
+from typing import Any, AsyncIterator, Dict
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+# 프록시 버퍼링을 끄고 캐시하지 않도록 하는 헤더
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"
+}
+
+def format_sse(event: str, data: Any) -> str:
+    """
+    Server-Sent Events 형식의 메시지를 만듭니다.
+
+    Args:
+        event (str): 이벤트 이름
+        data (Any): JSON으로 직렬화할 데이터
+
+    Returns:
+        str: SSE 메시지
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+def sse_response(events: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """
+    {"type": ..., ...} 형태의 이벤트를 SSE 스트림 응답으로 변환합니다.
+    스트림 도중 발생한 오류는 상태 코드를 바꿀 수 없으므로 error 이벤트로 전달합니다.
+
+    Args:
+        events (AsyncIterator[Dict[str, Any]]): type 키를 가진 이벤트 딕셔너리
+
+    Returns:
+        StreamingResponse: text/event-stream 응답
+    """
+    async def event_stream():
+        try:
+            async for event in events:
+                payload = dict(event)
+                yield format_sse(payload.pop("type"), payload)
+        except Exception as e:
+            logger.error(f"[SSE] 스트리밍 중 오류: {str(e)}", exc_info=True)
+            yield format_sse("error", {"detail": str(e)})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -0,0 +1,23 @@
+import math
+import re
+
+# 한글/한자/가나 등 CJK 문자는 대략 문자당 1토큰, 그 외 문자는 약 4자당 1토큰으로 계산
+_CJK_PATTERN = re.compile(r'[ᄀ-ᇿ぀-ヿ㄰-㆏一-鿿가-힯]')
+CHARS_PER_TOKEN = 4
+
+def estimate_tokens(text: str) -> int:
+    """
+    네트워크 호출 없이 텍스트의 토큰 수를 대략 추정합니다.
+    한국어 위주의 마케팅 텍스트에서 약간 크게 추정되도록 보수적으로 계산합니다.
+
+    Args:
+        text (str): 토큰 수를 추정할 텍스트
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    if not text:
+        return 0
+    cjk_count = len(_CJK_PATTERN.findall(text))
+    other_count = len(text) - cjk_count
+    return cjk_count + math.ceil(other_count / CHARS_PER_TOKEN)
@@ -0,0 +1,83 @@
+import logging
+import time
+import zipfile
+from typing import AsyncIterator, List, Tuple, Union
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+# 파일을 ZIP 항목으로 복사하는 단위
+ZIP_CHUNK_SIZE = 64 * 1024
+
+class _ZipStreamBuffer:
+    """ZipFile이 쓴 바이트를 모아 두었다가 스트림으로 내보내는 쓰기 전용 버퍼 (seek/tell 미지원)."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+async def stream_zip(entries: AsyncIterator[Tuple[str, Union[str, bytes]]]) -> AsyncIterator[bytes]:
+    """
+    (ZIP 내 파일명, 디스크 파일 경로) 항목을 받는 대로 ZIP 바이트 스트림으로 내보냅니다.
+    파일은 조각 단위로 복사하므로 메모리에는 항상 한 조각만 유지되며, 압축하지 않고 저장(ZIP_STORED)합니다.
+    PDF처럼 이미 압축된 파일을 다시 압축하는 비용을 피하기 위함입니다.
+    경로 대신 bytes를 주면 그 내용을 그대로 항목으로 씁니다 (누락 목록 같은 작은 텍스트용).
+
+    Args:
+        entries (AsyncIterator[Tuple[str, Union[str, bytes]]]): (ZIP 내 파일명, 파일 경로 또는 내용)
+
+    Yields:
+        bytes: ZIP 데이터 조각
+    """
+    buffer = _ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zip_file:
+        async for arcname, path in entries:
+            info = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            if isinstance(path, bytes):
+                zip_file.writestr(info, path)
+                yield buffer.drain()
+                continue
+            with open(path, "rb") as source, zip_file.open(info, "w") as target:
+                while True:
+                    chunk = source.read(ZIP_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    target.write(chunk)
+                    data = buffer.drain()
+                    if data:
+                        yield data
+            yield buffer.drain()
+    # 중앙 디렉토리
+    yield buffer.drain()
+
+def zip_stream_response(entries: AsyncIterator[Tuple[str, Union[str, bytes]]], filename: str) -> StreamingResponse:
+    """
+    항목이 준비되는 대로 전송하는 ZIP 다운로드 응답을 만듭니다.
+
+    Args:
+        entries (AsyncIterator[Tuple[str, Union[str, bytes]]]): (ZIP 내 파일명, 파일 경로 또는 내용)
+        filename (str): 다운로드 파일명
+
+    Returns:
+        StreamingResponse: application/zip 스트림 응답
+    """
+    return StreamingResponse(
+        stream_zip(entries),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "X-Accel-Buffering": "no"
+        }
+    )
@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+from api.services.crawl_fanout import CrawlFanout
+
+def make_crawler(delay: float, results=None, error: Exception = None, events: dict = None):
+    """지정한 시간 뒤에 결과를 반환(또는 예외 발생)하는 가짜 크롤러를 만듭니다."""
+    async def crawler(input_text):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if events is not None:
+                events["cancelled"].set()
+            raise
+        if error is not None:
+            raise error
+        return results if results is not None else [f"{input_text} 결과"]
+    return crawler
+
+def test_channel_timeout_only_affects_slow_channel():
+    """채널별 제한 시간을 넘긴 채널만 timeout이 되고 나머지 채널 결과는 그대로 반환됩니다."""
+    fanout = CrawlFanout(channel_timeout=0.05, request_budget=5)
+    crawler_map = {
+        "fast": make_crawler(0.01),
+        "slow": make_crawler(1),
+        "broken": make_crawler(0.01, error=RuntimeError("차단됨")),
+        "single": make_crawler(0.01, results={"content": "하나"})
+    }
+
+    outcomes = asyncio.run(fanout.run(["slow", "fast", "broken", "single", "unknown"], crawler_map, "검색어"))
+
+    # 요청 채널 순서 유지
+    assert list(outcomes) == ["slow", "fast", "broken", "single", "unknown"]
+    assert outcomes["fast"]["status"] == "success"
+    assert outcomes["fast"]["results"] == ["검색어 결과"]
+    assert outcomes["slow"]["status"] == "timeout" and outcomes["slow"]["results"] == []
+    assert outcomes["broken"]["status"] == "failed" and outcomes["broken"]["error"] == "차단됨"
+    assert outcomes["single"]["results"] == [{"content": "하나"}]
+    assert outcomes["unknown"]["status"] == "unsupported"
+
+def test_iter_completed_yields_in_completion_order():
+    fanout = CrawlFanout(channel_timeout=5, request_budget=5)
+    crawler_map = {"a": make_crawler(0.08), "b": make_crawler(0.01), "c": make_crawler(0.04)}
+
+    async def collect():
+        return [channel async for channel, _ in fanout.iter_completed(["a", "b", "c"], crawler_map, "q")]
+
+    assert asyncio.run(collect()) == ["b", "c", "a"]
+
+def test_request_budget_cancels_pending_channels():
+    """요청 예산을 넘기면 끝나지 않은 채널을 취소하고 timeout으로 마지막에 전달합니다."""
+    fanout = CrawlFanout(channel_timeout=10, request_budget=0.1)
+
+    async def collect():
+        events = {"cancelled": asyncio.Event()}
+        crawler_map = {"fast": make_crawler(0.01), "hanging": make_crawler(10, events=events)}
+        started = time.monotonic()
+        outcomes = [item async for item in fanout.iter_completed(["hanging", "fast"], crawler_map, "q")]
+        elapsed = time.monotonic() - started
+        # 취소된 크롤러가 실제로 CancelledError를 받았는지 확인
+        await asyncio.wait_for(events["cancelled"].wait(), timeout=1)
+        return outcomes, elapsed
+
+    outcomes, elapsed = asyncio.run(collect())
+
+    assert elapsed < 1
+    assert [channel for channel, _ in outcomes] == ["fast", "hanging"]
+    hanging = outcomes[1][1]
+    assert hanging["status"] == "timeout"
+    assert hanging["elapsed"] == 0.1
+
+def test_duplicate_channels_run_once():
+    fanout = CrawlFanout(channel_timeout=1, request_budget=1)
+    calls = []
+
+    async def crawler(input_text):
+        calls.append(input_text)
+        return []
+
+    outcomes = asyncio.run(fanout.run(["a", "a"], {"a": crawler}, "q"))
+
+    assert calls == ["q"]
+    assert list(outcomes) == ["a"]
@@ -0,0 +1,79 @@
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from api.utils.file_response import _iter_file, _parse_range, cached_file_response
+
+CONTENT = bytes(range(256)) * 4
+ETAG = "abc123"
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "report.pdf"
+    path.write_bytes(CONTENT)
+    return str(path)
+
+def respond(path: str, **headers):
+    request = SimpleNamespace(headers={key.replace("_", "-"): value for key, value in headers.items()})
+    return cached_file_response(request, path, "application/pdf", "report.pdf", ETAG)
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=100-", (100, 1023)),
+    ("bytes=-24", (1000, 1023)),
+    ("bytes=-5000", (0, 1023)),
+    ("bytes=1000-5000", (1000, 1023)),
+    (" bytes=5-5 ", (5, 5))
+])
+def test_parse_range(header, expected):
+    assert _parse_range(header, 1024) == expected
+
+@pytest.mark.parametrize("header", ["bytes=0-1,5-9", "bytes=-", "items=0-1", "bytes=a-b"])
+def test_unsupported_range_falls_back_to_full_file(header):
+    """여러 구간이나 형식이 잘못된 헤더는 전체 파일 전송으로 처리합니다."""
+    assert _parse_range(header, 1024) is None
+
+@pytest.mark.parametrize("header", ["bytes=1024-", "bytes=10-5", "bytes=-0"])
+def test_unsatisfiable_range_raises(header):
+    with pytest.raises(ValueError):
+        _parse_range(header, 1024)
+
+def test_iter_file_reads_inclusive_range():
+    assert b"".join(_iter_file(io.BytesIO(CONTENT), 10, 19)) == CONTENT[10:20]
+
+def test_matching_etag_returns_304(pdf_path):
+    response = respond(pdf_path, if_none_match=f'"other", "{ETAG}"')
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == f'"{ETAG}"'
+
+def test_wildcard_if_none_match_returns_304(pdf_path):
+    assert respond(pdf_path, if_none_match="*").status_code == 304
+
+def test_full_response_without_range(pdf_path):
+    response = respond(pdf_path, if_none_match='"stale"')
+
+    assert response.status_code == 200
+    assert response.headers["Content-Length"] == str(len(CONTENT))
+    assert response.headers["Accept-Ranges"] == "bytes"
+
+def test_range_returns_206(pdf_path):
+    response = respond(pdf_path, range="bytes=100-199")
+
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == f"bytes 100-199/{len(CONTENT)}"
+    assert response.headers["Content-Length"] == "100"
+
+def test_unsatisfiable_range_returns_416(pdf_path):
+    response = respond(pdf_path, range=f"bytes={len(CONTENT)}-")
+
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == f"bytes */{len(CONTENT)}"
+
+def test_stale_if_range_sends_full_file(pdf_path):
+    """If-Range의 ETag가 다르면 Range를 무시하고 전체 파일을 보냅니다."""
+    response = respond(pdf_path, range="bytes=0-9", if_range='"old-etag"')
+
+    assert response.status_code == 200
+    assert "Content-Range" not in response.headers
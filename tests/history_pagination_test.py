@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from api.db.database import Base
+from api.models.history import AnalysisHistory, HistoryCounter
+from api.services.history_pagination import (
+    decode_cursor,
+    encode_cursor,
+    get_history_count,
+    paginate_latest
+)
+from api.services.schema_migration import recount_history_counters
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'history.sqlite3'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+def add_history(db, user_id: str, count: int, created_at: datetime):
+    """같은 created_at을 가진 이력을 여러 개 추가합니다 (id로 순서가 갈리는 경우)."""
+    records = [
+        AnalysisHistory(id=f"{user_id}-{i:03d}", user_id=user_id, input_text="입력", result_json="{}", created_at=created_at)
+        for i in range(count)
+    ]
+    db.add_all(records)
+    db.commit()
+    return records
+
+def read_all_pages(db, user_id: str, limit: int):
+    query = db.query(AnalysisHistory).filter(AnalysisHistory.user_id == user_id)
+    pages, cursor = [], None
+    while True:
+        rows, cursor = paginate_latest(query, AnalysisHistory, cursor, limit)
+        pages.append([row.id for row in rows])
+        if cursor is None:
+            return pages
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+    cursor = encode_cursor(created_at, "abc-123")
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, "abc-123")
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", encode_cursor(datetime(2024, 1, 1), "x")[:-3]])
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+def test_pages_cover_every_row_once_in_order(db):
+    """created_at이 같은 행이 페이지 경계에 걸려도 빠지거나 중복되지 않습니다."""
+    base = datetime(2024, 5, 1, 12, 0, 0)
+    add_history(db, "u", 4, base)
+    add_history(db, "u2", 2, base)
+    db.add_all([
+        AnalysisHistory(id=f"late-{i}", user_id="u", input_text="입력", result_json="{}", created_at=base + timedelta(minutes=i + 1))
+        for i in range(3)
+    ])
+    db.commit()
+
+    pages = read_all_pages(db, "u", limit=3)
+    ids = [record_id for page in pages for record_id in page]
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert ids == ["late-2", "late-1", "late-0", "u-003", "u-002", "u-001", "u-000"]
+
+def test_last_full_page_has_no_next_cursor(db):
+    """행 수가 페이지 크기의 배수여도 빈 페이지를 더 요청하게 하지 않습니다."""
+    add_history(db, "u", 6, datetime(2024, 5, 1))
+
+    pages = read_all_pages(db, "u", limit=3)
+
+    assert [len(page) for page in pages] == [3, 3]
+
+def test_history_counter_tracks_inserts_and_deletes(db):
+    """이력 추가/삭제 시 카운터가 같은 트랜잭션에서 생성되고 갱신됩니다."""
+    records = add_history(db, "u", 5, datetime(2024, 5, 1))
+    assert db.get(HistoryCounter, ("u", "analysis_history")).count == 5
+
+    db.delete(records[0])
+    db.commit()
+
+    assert get_history_count(db, AnalysisHistory, "u") == 4
+    assert get_history_count(db, AnalysisHistory, "nobody") == 0
+
+def test_recount_fixes_rows_saved_without_counter_hook(db):
+    """카운터 갱신이 없는 이전 버전 워커가 저장한 행은 recount 후 반영됩니다."""
+    add_history(db, "u", 2, datetime(2024, 5, 1))
+    db.execute(text(
+        "INSERT INTO analysis_history (id, user_id, input_text, result_json, created_at) "
+        "VALUES ('old-worker', 'u', '입력', '{}', '2024-05-02 00:00:00')"
+    ))
+    db.commit()
+    assert get_history_count(db, AnalysisHistory, "u") == 2
+
+    recount_history_counters(db.get_bind(), Base.metadata)
+
+    assert get_history_count(db, AnalysisHistory, "u") == 3
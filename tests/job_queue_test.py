@@ -0,0 +1,125 @@
+import sqlite3
+import time
+
+import pytest
+
+from api.services import job_queue as job_queue_module
+from api.services.job_queue import JobQueue
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.sqlite3"))
+
+def set_started_at(queue: JobQueue, job_id: str, started_at: float) -> None:
+    """워커가 멈춘 상황을 흉내 내기 위해 시작 시각을 과거로 돌립니다."""
+    conn = sqlite3.connect(queue.path)
+    with conn:
+        conn.execute("UPDATE jobs SET started_at = ? WHERE id = ?", (started_at, job_id))
+    conn.close()
+
+def test_claim_returns_oldest_job_once(queue):
+    """작업은 들어온 순서대로, 한 워커에게만 한 번 넘어갑니다."""
+    first = queue.enqueue("full_analysis", {"n": 1}, user_id="u")
+    second = queue.enqueue("full_analysis", {"n": 2}, user_id="u")
+
+    job = queue.claim("worker-a")
+    assert job["job_id"] == first
+    assert job["payload"] == {"n": 1}
+    assert job["status"] == "running" and job["attempts"] == 1
+
+    assert queue.claim("worker-b")["job_id"] == second
+    assert queue.claim("worker-c") is None
+
+def test_complete_and_progress(queue):
+    job_id = queue.enqueue("batch_analysis", {"texts": ["a"]})
+    queue.claim("worker")
+
+    queue.update_progress(job_id, {"progress_percent": 50})
+    assert queue.get(job_id)["result"] == {"progress_percent": 50}
+
+    assert queue.complete(job_id, {"progress_percent": 100}, "worker", 1)
+    job = queue.get(job_id)
+    assert job["status"] == "succeeded"
+    assert job["result"] == {"progress_percent": 100}
+
+    # 완료 후 늦게 도착한 진행률은 결과를 덮어쓰지 않음
+    queue.update_progress(job_id, {"progress_percent": 75})
+    assert queue.get(job_id)["result"] == {"progress_percent": 100}
+
+def test_fail_requeues_until_max_attempts(queue, monkeypatch):
+    """실패한 작업은 시도 횟수가 남아 있으면 다시 대기열로, 다 쓰면 failed가 됩니다."""
+    monkeypatch.setattr(job_queue_module, "JOB_RETRY_BASE", 0)
+    job_id = queue.enqueue("full_analysis", {}, max_attempts=2)
+
+    queue.claim("worker")
+    assert queue.fail(job_id, "boom 1", "worker", 1) == "queued"
+    assert queue.get(job_id)["error"] == "boom 1"
+
+    job = queue.claim("worker")
+    assert job["job_id"] == job_id and job["attempts"] == 2
+    assert queue.fail(job_id, "boom 2", "worker", 2) == "failed"
+
+    failed = queue.get(job_id)
+    assert failed["status"] == "failed" and failed["finished_at"] is not None
+    assert queue.claim("worker") is None
+
+def test_retry_waits_for_backoff(queue, monkeypatch):
+    """백오프 시간이 지나기 전에는 다시 가져가지 않습니다."""
+    monkeypatch.setattr(job_queue_module, "JOB_RETRY_BASE", 1000)
+    monkeypatch.setattr(job_queue_module.random, "uniform", lambda low, high: high)
+    job_id = queue.enqueue("full_analysis", {})
+
+    queue.claim("worker")
+    assert queue.fail(job_id, "rate limited", "worker", 1) == "queued"
+    assert queue.claim("worker") is None
+
+def test_timed_out_running_job_is_requeued(queue):
+    """제한 시간을 넘긴 running 작업은 다른 워커가 다시 가져갑니다."""
+    job_id = queue.enqueue("favorites_zip", {}, max_attempts=3)
+    queue.claim("worker-a")
+    set_started_at(queue, job_id, time.time() - job_queue_module.JOB_TIMEOUT - 1)
+
+    job = queue.claim("worker-b")
+
+    assert job["job_id"] == job_id
+    assert job["worker"] == "worker-b" and job["attempts"] == 2
+
+def test_stale_attempt_cannot_finish_requeued_job(queue):
+    """제한 시간 후 다시 가져간 작업은 늦게 끝난 이전 시도가 완료/실패로 덮어쓰지 못합니다."""
+    job_id = queue.enqueue("favorites_zip", {}, max_attempts=3)
+    queue.claim("worker-a")
+    set_started_at(queue, job_id, time.time() - job_queue_module.JOB_TIMEOUT - 1)
+    # 같은 이름의 워커가 다시 가져가도 시도 번호로 구분
+    queue.claim("worker-a")
+
+    assert queue.complete(job_id, {"file_path": "a-1.zip"}, "worker-a", 1) is False
+    assert queue.fail(job_id, "late failure", "worker-a", 1) is None
+    job = queue.get(job_id)
+    assert job["status"] == "running" and job["result"] is None
+
+    assert queue.complete(job_id, {"file_path": "a-2.zip"}, "worker-a", 2) is True
+    assert queue.get(job_id)["result"] == {"file_path": "a-2.zip"}
+
+def test_timed_out_job_without_attempts_left_fails(queue):
+    job_id = queue.enqueue("favorites_zip", {}, max_attempts=1)
+    queue.claim("worker-a")
+    set_started_at(queue, job_id, time.time() - job_queue_module.JOB_TIMEOUT - 1)
+
+    assert queue.claim("worker-b") is None
+    job = queue.get(job_id)
+    assert job["status"] == "failed" and job["error"] == "worker timeout"
+
+def test_purge_finished_removes_old_jobs_and_result_files(queue, tmp_path):
+    result_file = tmp_path / "result.zip"
+    result_file.write_bytes(b"zip")
+    old_job = queue.enqueue("favorites_zip", {})
+    queue.claim("worker")
+    queue.complete(old_job, {"file_path": str(result_file)}, "worker", 1)
+    pending_job = queue.enqueue("favorites_zip", {})
+
+    assert queue.purge_finished(retention=3600) == 0
+    assert queue.purge_finished(retention=-1) == 1
+
+    assert queue.get(old_job) is None
+    assert not result_file.exists()
+    assert queue.get(pending_job)["status"] == "queued"
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from api.services import llm_router as llm_router_module
+from api.services.llm_router import LLMRouter
+
+class FakeCaller:
+    def __init__(self, provider: str, delay: float, error: Exception = None):
+        """지정한 시간 뒤에 응답(또는 예외)을 돌려주고 취소 여부를 기록하는 가짜 호출 클래스입니다."""
+        self.provider = provider
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    def _request_key(self, prompt, system, model, max_tokens):
+        return f"{self.provider}:{prompt}"
+
+    async def _call(self, prompt, system, model, max_tokens, timeout, max_retries=None):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return {"content": f"{self.provider} 응답", "usage": None, "model": self.provider}
+
+@pytest.fixture
+def router(monkeypatch):
+    monkeypatch.setattr(llm_router_module.llm_response_cache, "set", lambda *args: None)
+    router = LLMRouter()
+    monkeypatch.setattr(router, "_hedge_delay", lambda provider: 0.05)
+    return router
+
+def run_call(router: LLMRouter, claude: FakeCaller, gpt: FakeCaller):
+    router._callers = {"anthropic": claude, "openai": gpt}
+
+    async def main():
+        response = await router.call("프롬프트", primary="anthropic", bypass_cache=True)
+        # 취소된 요청이 CancelledError를 처리할 수 있도록 한 번 양보
+        await asyncio.sleep(0)
+        return response
+
+    return asyncio.run(main())
+
+def test_fast_primary_is_not_hedged(router):
+    claude, gpt = FakeCaller("anthropic", 0.01), FakeCaller("openai", 0.01)
+
+    response = run_call(router, claude, gpt)
+
+    assert response["provider"] == "anthropic"
+    assert gpt.calls == 0
+    assert router.get_stats()["hedged"] == 0
+
+def test_slow_primary_is_hedged_and_loser_cancelled(router):
+    """주 제공자가 헤지 대기 시간을 넘기면 보조 제공자에게도 요청하고, 먼저 온 응답을 쓰고 나머지는 취소합니다."""
+    claude, gpt = FakeCaller("anthropic", 5), FakeCaller("openai", 0.01)
+
+    response = run_call(router, claude, gpt)
+
+    assert response["provider"] == "openai"
+    assert claude.calls == 1 and gpt.calls == 1
+    assert claude.cancelled
+    stats = router.get_stats()
+    assert stats["hedged"] == 1 and stats["hedge_wins"] == 1 and stats["failovers"] == 0
+
+def test_primary_still_wins_after_hedge(router):
+    """헤지 요청 후에도 주 제공자가 먼저 응답하면 주 제공자 응답을 쓰고 헤지 요청을 취소합니다."""
+    claude, gpt = FakeCaller("anthropic", 0.08), FakeCaller("openai", 5)
+
+    response = run_call(router, claude, gpt)
+
+    assert response["provider"] == "anthropic"
+    assert gpt.cancelled
+    assert router.get_stats()["hedge_wins"] == 0
+
+def test_primary_failure_fails_over_immediately(router):
+    """주 제공자가 실패하면 헤지 대기 시간을 기다리지 않고 바로 보조 제공자로 요청합니다."""
+    claude = FakeCaller("anthropic", 0, error=RuntimeError("overloaded"))
+    gpt = FakeCaller("openai", 0.01)
+
+    response = run_call(router, claude, gpt)
+
+    assert response["provider"] == "openai"
+    stats = router.get_stats()
+    assert stats["failovers"] == 1 and stats["hedged"] == 0
+
+def test_both_providers_failing_raises_last_error(router):
+    claude = FakeCaller("anthropic", 0, error=RuntimeError("claude down"))
+    gpt = FakeCaller("openai", 0, error=RuntimeError("gpt down"))
+
+    with pytest.raises(RuntimeError, match="gpt down"):
+        run_call(router, claude, gpt)
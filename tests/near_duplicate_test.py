@@ -0,0 +1,95 @@
+import random
+from itertools import combinations
+
+from api.utils.near_duplicate import (
+    SIMHASH_BITS,
+    NearDuplicateIndex,
+    normalize_for_dedup,
+    remove_near_duplicates,
+    simhash
+)
+
+WORDS = [
+    "배송", "가격", "할인", "품질", "후기", "추천", "교환", "환불", "디자인", "사이즈",
+    "색상", "재질", "만족", "불만", "포장", "서비스", "이벤트", "쿠폰", "재구매", "가성비"
+]
+
+def make_post(rng: random.Random, length: int = 60) -> str:
+    """무작위 단어로 게시물 본문을 만듭니다."""
+    return " ".join(rng.choice(WORDS) + str(rng.randint(0, 99)) for _ in range(length))
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+def test_normalize_ignores_channel_label_and_punctuation():
+    """채널 라벨, 문장부호, 공백, 대소문자 차이는 같은 텍스트로 봅니다."""
+    assert normalize_for_dedup("[Reddit] Hello, World!!") == normalize_for_dedup("hello   world")
+
+def test_small_edits_are_duplicates_and_distinct_posts_are_kept():
+    """문장부호나 단어 하나가 다른 게시물은 중복으로, 다른 게시물은 새 게시물로 판정합니다."""
+    rng = random.Random(7)
+    original = make_post(rng)
+    results = [
+        {"title": "[뽐뿌] 후기", "content": original},
+        {"title": "[클리앙] 후기", "content": original + "!!"},
+        {"title": "후기", "content": original.replace(original.split()[10], "배송", 1)},
+        {"title": "다른 글", "content": make_post(rng)}
+    ]
+
+    kept = remove_near_duplicates(results)
+
+    assert [result["title"] for result in kept] == ["[뽐뿌] 후기", "다른 글"]
+
+def test_lsh_bands_find_every_pair_within_threshold():
+    """LSH 밴드 후보 검색이 전수 비교와 같은 결과를 내는지 확인합니다 (재현율 100%)."""
+    rng = random.Random(42)
+    texts = []
+    for _ in range(60):
+        words = make_post(rng).split()
+        texts.append(" ".join(words))
+        # 일부 단어만 바꾼 변형 (기준 근처의 거리를 고르게 만듦)
+        for _ in range(3):
+            variant = list(words)
+            for position in rng.sample(range(len(variant)), rng.randint(1, 12)):
+                variant[position] = rng.choice(WORDS) + str(rng.randint(0, 99))
+            texts.append(" ".join(variant))
+    rng.shuffle(texts)
+
+    for threshold in (0.8, 0.9, 0.95):
+        index = NearDuplicateIndex(threshold)
+        kept_fingerprints = []
+        kept_texts = set()
+        for text in texts:
+            normalized = normalize_for_dedup(text)
+            fingerprint = simhash(normalized)
+            expected = normalized not in kept_texts and all(
+                hamming(fingerprint, kept) > index.max_distance for kept in kept_fingerprints
+            )
+            assert index.add(text) is expected
+            if expected:
+                kept_fingerprints.append(fingerprint)
+                kept_texts.add(normalized)
+
+def test_similar_texts_have_close_fingerprints():
+    """조금 다른 텍스트는 전혀 다른 텍스트보다 SimHash 거리가 가깝습니다."""
+    rng = random.Random(3)
+    base = make_post(rng, 120)
+    edited = base.replace(base.split()[5], "쿠폰", 1)
+    unrelated = make_post(rng, 120)
+
+    near = hamming(simhash(normalize_for_dedup(base)), simhash(normalize_for_dedup(edited)))
+    far = hamming(simhash(normalize_for_dedup(base)), simhash(normalize_for_dedup(unrelated)))
+
+    assert near <= int(0.1 * SIMHASH_BITS) < far
+
+def test_brute_force_pairs_match_remove_near_duplicates():
+    """remove_near_duplicates 결과 안에는 기준 이내로 가까운 쌍이 남지 않습니다."""
+    rng = random.Random(11)
+    results = [{"title": "", "content": make_post(rng, 40)} for _ in range(30)]
+    results += [{"title": "", "content": result["content"] + " 재구매"} for result in results[:10]]
+
+    kept = remove_near_duplicates(results, similarity_threshold=0.9)
+    fingerprints = [simhash(normalize_for_dedup(f" {result['content']}")) for result in kept]
+
+    assert len(kept) < len(results)
+    assert all(hamming(a, b) > NearDuplicateIndex(0.9).max_distance for a, b in combinations(fingerprints, 2))
@@ -0,0 +1,68 @@
+import os
+import time
+
+import pytest
+
+from api.services.pdf_cache import PDFArtifactCache
+
+PDF = b"%PDF-1.4 " + b"x" * 91
+
+def age(path: str, seconds: float) -> None:
+    """파일의 최근 사용 시각을 과거로 돌립니다."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+@pytest.fixture
+def cache(tmp_path):
+    # 파일 2개까지만 담을 수 있는 용량
+    return PDFArtifactCache(directory=str(tmp_path), max_bytes=len(PDF) * 2, evict_grace=60)
+
+def test_put_and_get(cache):
+    key = cache.key_for("<html>리포트</html>")
+
+    assert cache.get(key) is None
+    path = cache.put(key, PDF)
+
+    assert cache.get(key) == path
+    with open(path, "rb") as f:
+        assert f.read() == PDF
+    stats = cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["entries"] == 1
+
+def test_key_depends_on_html(cache):
+    assert cache.key_for("<p>a</p>") != cache.key_for("<p>b</p>")
+    assert cache.key_for("<p>a</p>") == cache.key_for("<p>a</p>")
+
+def test_evicts_least_recently_used_files_outside_grace(cache):
+    """용량을 넘으면 유예 시간이 지난 파일 중 가장 오래 사용되지 않은 파일부터 지웁니다."""
+    oldest = cache.put("oldest", PDF)
+    older = cache.put("older", PDF)
+    age(oldest, 300)
+    age(older, 200)
+
+    newest = cache.put("newest", PDF)
+
+    assert not os.path.exists(oldest)
+    assert os.path.exists(older) and os.path.exists(newest)
+    assert cache.get_stats()["evictions"] == 1
+
+def test_get_refreshes_recency(cache):
+    first = cache.put("first", PDF)
+    second = cache.put("second", PDF)
+    age(first, 300)
+    age(second, 200)
+    # 조회하면 최근 사용 시각이 갱신되어 나중에 지워짐
+    assert cache.get("first") == first
+    age(first, 100)
+
+    cache.put("third", PDF)
+
+    assert os.path.exists(first)
+    assert not os.path.exists(second)
+
+def test_recently_used_files_survive_over_capacity(cache):
+    """유예 시간 안에 사용된 파일은 용량을 넘어도 지우지 않습니다 (읽는 중인 요청 보호)."""
+    paths = [cache.put(f"recent-{index}", PDF) for index in range(3)]
+
+    assert all(os.path.exists(path) for path in paths)
+    assert cache.get_stats()["evictions"] == 0
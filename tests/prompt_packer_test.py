@@ -0,0 +1,102 @@
+from api.utils.prompt_packer import (
+    MIN_ITEM_TOKENS,
+    MODEL_CONTEXT_TOKENS,
+    TRUNCATION_MARK,
+    chunk_texts,
+    pack_prompt,
+    pack_texts,
+    response_token_limit,
+    truncate_to_tokens
+)
+from api.utils.token_counter import estimate_tokens
+
+SEPARATOR = "\n\n"
+
+def make_texts(count: int, repeat: int):
+    return [f"{i}번 게시물: 배송이 빠르고 가격이 괜찮아요. " * repeat for i in range(count)]
+
+def test_truncate_to_tokens_stays_within_budget():
+    """잘린 텍스트는 말줄임표를 포함해 예산 이내입니다."""
+    text = "배송이 빠르고 가격이 괜찮아요. " * 50
+    for budget in (1, 10, 37, 100):
+        truncated = truncate_to_tokens(text, budget)
+        assert estimate_tokens(truncated) <= budget
+        assert truncated.endswith(TRUNCATION_MARK)
+    assert truncate_to_tokens("짧은 글", 100) == "짧은 글"
+
+def test_pack_texts_fits_everything_when_budget_allows():
+    texts = make_texts(3, 1)
+
+    packed = pack_texts(texts, token_budget=10000)
+
+    assert packed["text"] == SEPARATOR.join(texts)
+    assert packed["included_count"] == packed["total_count"] == 3
+    assert packed["trimmed_count"] == 0
+
+def test_pack_texts_never_exceeds_budget():
+    """어떤 예산이든 합친 결과가 예산을 넘지 않습니다."""
+    texts = make_texts(12, 8) + make_texts(5, 1)
+    for budget in (50, 200, 777, 2000, 5000):
+        packed = pack_texts(texts, token_budget=budget)
+        assert packed["packed_tokens"] <= budget
+        assert packed["packed_tokens"] == estimate_tokens(packed["text"])
+
+def test_pack_texts_shares_budget_and_keeps_short_texts_whole():
+    """짧은 게시물은 그대로 두고 남은 예산을 긴 게시물에 나눕니다."""
+    short = "짧은 후기입니다."
+    texts = make_texts(4, 20) + [short]
+
+    packed = pack_texts(texts, token_budget=600)
+
+    assert short in packed["text"]
+    assert packed["included_count"] == 5
+    assert packed["trimmed_count"] == 4
+
+def test_pack_texts_drops_lowest_priority_when_shares_get_too_small():
+    """게시물별 몫이 MIN_ITEM_TOKENS보다 작아지면 뒤쪽 게시물부터 제외합니다."""
+    texts = make_texts(20, 10)
+    budget = MIN_ITEM_TOKENS * 5
+
+    packed = pack_texts(texts, token_budget=budget)
+
+    assert 0 < packed["included_count"] < packed["total_count"]
+    assert packed["text"].startswith("0번 게시물")
+    assert "19번 게시물" not in packed["text"]
+
+def test_chunk_texts_respects_budget_and_order():
+    """각 묶음은 예산 이내이고, 묶음을 이어 붙이면 원래 순서가 유지됩니다."""
+    texts = make_texts(15, 3)
+    budget = 200
+
+    chunks = chunk_texts(texts, token_budget=budget)
+
+    assert len(chunks) > 1
+    assert [text for chunk in chunks for text in chunk] == texts
+    assert all(estimate_tokens(SEPARATOR.join(chunk)) <= budget for chunk in chunks)
+
+def test_chunk_texts_truncates_oversized_text_into_its_own_chunk():
+    long_text = "아주 긴 게시물입니다. " * 200
+    texts = ["앞 글", long_text, "뒤 글"]
+
+    chunks = chunk_texts(texts, token_budget=100)
+
+    assert chunks[0] == ["앞 글"]
+    assert len(chunks[1]) == 1 and chunks[1][0].endswith(TRUNCATION_MARK)
+    assert estimate_tokens(chunks[1][0]) <= 100
+    assert chunks[-1] == ["뒤 글"]
+
+def test_response_token_limit_only_clamps_to_context():
+    """응답 예산은 입력 길이와 무관하며 컨텍스트가 부족할 때만 줄어듭니다."""
+    assert response_token_limit(100, max_tokens=4096) == 4096
+    assert response_token_limit(50000, max_tokens=4096) == 4096
+    assert response_token_limit(MODEL_CONTEXT_TOKENS - 1000, max_tokens=4096) == 1000
+    assert response_token_limit(MODEL_CONTEXT_TOKENS + 10, max_tokens=4096) == 1
+
+def test_pack_prompt_includes_template_in_input_budget():
+    template = "다음 게시물을 분석하세요:\n{content}\nJSON으로 답하세요."
+    packed = pack_prompt(template, make_texts(30, 10), input_budget=1000, max_tokens=2048)
+
+    assert packed["packed_tokens"] <= 1000
+    assert packed["prompt"].startswith("다음 게시물을 분석하세요:")
+    assert packed["prompt"].endswith("JSON으로 답하세요.")
+    assert packed["max_tokens"] == 2048
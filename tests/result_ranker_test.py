@@ -0,0 +1,78 @@
+import time
+
+from api.utils.result_ranker import score_results, select_results, tokenize
+from api.utils.token_counter import estimate_tokens
+
+def make_result(title: str, content: str, channel: str = "reddit", **extra):
+    return {"title": title, "content": content, "channel": channel, **extra}
+
+def result_tokens(result) -> int:
+    return estimate_tokens(f"{result.get('title', '')} {result.get('content', '')}")
+
+def test_tokenize_matches_korean_words_with_particles():
+    """조사가 붙은 단어도 bigram으로 검색어와 겹칩니다."""
+    assert set(tokenize("가성비")) & set(tokenize("가성비가 좋아요"))
+
+def test_bm25_ranks_relevant_results_first():
+    """검색어가 들어간 결과가 그렇지 않은 결과보다 점수가 높습니다."""
+    results = [
+        make_result("날씨", "오늘은 비가 옵니다"),
+        make_result("무선 이어폰 후기", "무선 이어폰 음질이 좋고 배터리가 오래 갑니다"),
+        make_result("점심", "김치찌개를 먹었습니다")
+    ]
+
+    scores = score_results(results, "무선 이어폰")
+
+    assert scores[1] == max(scores)
+    assert all(0 <= score <= 1 for score in scores)
+
+def test_engagement_and_recency_break_ties():
+    """관련도가 같으면 반응이 많고 최근 글이 앞섭니다."""
+    now = time.time()
+    results = [
+        make_result("이어폰", "이어폰 후기", score=1, created_utc=now - 90 * 24 * 3600),
+        make_result("이어폰", "이어폰 후기", score=500, created_utc=now - 3600)
+    ]
+
+    scores = score_results(results, "이어폰")
+
+    assert scores[1] > scores[0]
+
+def test_select_results_respects_token_budget():
+    """선택된 결과의 토큰 합계가 예산을 넘지 않고, 큰 결과를 건너뛰고 작은 결과로 채웁니다."""
+    results = [make_result("이어폰 후기", "이어폰 " * 400)]
+    results += [make_result(f"이어폰 {i}", f"이어폰 짧은 후기 {i} 번째 글입니다") for i in range(10)]
+    budget = 120
+
+    selected = select_results(results, "이어폰", max_count=20, token_budget=budget)
+
+    assert sum(result_tokens(result) for result in selected) <= budget
+    assert results[0] not in selected
+    assert len(selected) > 1
+
+def test_select_results_without_budget_stops_at_max_count():
+    """예산이 없으면 max_count까지 고르고 같은 결과를 두 번 고르지 않습니다."""
+    results = [make_result(f"글 {i}", f"이어폰 후기 {i}") for i in range(8)]
+
+    selected = select_results(results, "이어폰", max_count=5)
+
+    assert len(selected) == 5
+    assert len({id(result) for result in selected}) == 5
+
+def test_mmr_prefers_diverse_results_and_channels():
+    """같은 내용의 복제 글보다 다른 내용, 다른 채널의 글을 먼저 고릅니다."""
+    duplicate = "무선 이어폰 음질 배터리 노이즈캔슬링 후기 " * 5
+    results = [
+        make_result("이어폰 후기", duplicate, channel="reddit"),
+        make_result("이어폰 후기", duplicate, channel="reddit"),
+        make_result("이어폰 후기", duplicate, channel="reddit"),
+        make_result("이어폰 가격", "무선 이어폰 할인 가격 비교 정리", channel="clien")
+    ]
+
+    selected = select_results(results, "무선 이어폰", max_count=2)
+
+    assert results[3] in selected
+
+def test_empty_input():
+    assert score_results([], "이어폰") == []
+    assert select_results([], "이어폰", max_count=5, token_budget=100) == []
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from api.services.single_flight import SingleFlight
+
+def test_concurrent_calls_share_one_execution():
+    """같은 키로 동시에 들어온 요청은 한 번만 실행되고 결과를 공유합니다."""
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"value": 42}
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", work) for _ in range(3)))
+
+    outcomes = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert [result for result, _ in outcomes] == [{"value": 42}] * 3
+    assert [shared for _, shared in outcomes] == [False, True, True]
+    assert flight.get_stats() == {"in_flight": 0, "shared_requests": 2}
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    calls = []
+
+    async def work(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key
+
+    async def main():
+        return await asyncio.gather(flight.do("a", lambda: work("a")), flight.do("b", lambda: work("b")))
+
+    assert asyncio.run(main()) == [("a", False), ("b", False)]
+    assert sorted(calls) == ["a", "b"]
+
+def test_cancelled_first_caller_does_not_cancel_shared_execution():
+    """먼저 요청한 쪽이 취소되어도 실행은 계속되고 합류한 요청은 결과를 받습니다."""
+    flight = SingleFlight()
+    finished = []
+
+    async def work():
+        await asyncio.sleep(0.05)
+        finished.append(True)
+        return "done"
+
+    async def main():
+        first = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == ("done", True)
+    assert finished == [True]
+
+def test_error_is_shared_and_key_is_released():
+    """실행이 실패하면 합류한 요청도 같은 예외를 받고, 다음 요청은 새로 실행합니다."""
+    flight = SingleFlight()
+    calls = []
+
+    async def failing():
+        calls.append("fail")
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def succeeding():
+        calls.append("ok")
+        return "ok"
+
+    async def main():
+        outcomes = await asyncio.gather(
+            flight.do("key", failing),
+            flight.do("key", failing),
+            return_exceptions=True
+        )
+        return outcomes, await flight.do("key", succeeding)
+
+    outcomes, retry = asyncio.run(main())
+
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert retry == ("ok", False)
+    assert calls == ["fail", "ok"]
+    assert flight.get_stats()["in_flight"] == 0
@@ -0,0 +1,76 @@
+import json
+import zlib
+
+import pytest
+
+from api.services import storage_codec as storage_codec_module
+from api.services.storage_codec import (
+    FORMAT_RAW,
+    FORMAT_ZLIB,
+    STORAGE_FORMATS,
+    StorageCodec
+)
+
+LARGE_TEXT = json.dumps(
+    {"analysis": {"content": "이 브랜드의 마케팅 전략은 고객의 욕구를 분석하여 " * 80}},
+    ensure_ascii=False
+)
+
+@pytest.fixture(params=["zstd", "zlib"])
+def codec(request, tmp_path, monkeypatch):
+    """zstd(설치된 경우)와 zlib 두 가지 설정으로 코덱을 만듭니다."""
+    if request.param == "zstd" and not storage_codec_module.ZSTD_AVAILABLE:
+        pytest.skip("zstandard 미설치")
+    if request.param == "zlib":
+        monkeypatch.setattr(storage_codec_module, "ZSTD_AVAILABLE", False)
+    return StorageCodec(dict_path=str(tmp_path / "missing.zdict"))
+
+@pytest.mark.parametrize("value", ["", "{}", "짧은 값", LARGE_TEXT])
+def test_round_trip(codec, value):
+    encoded = codec.encode_value(value)
+
+    assert isinstance(encoded, bytes)
+    assert encoded[0] in STORAGE_FORMATS
+    assert codec.decode_value(encoded) == value
+    assert codec.decode_value(memoryview(encoded)) == value
+
+def test_large_values_are_compressed(codec):
+    encoded = codec.encode_value(LARGE_TEXT)
+
+    assert encoded[0] == codec.current_format() != FORMAT_RAW
+    assert len(encoded) < len(LARGE_TEXT.encode("utf-8")) // 4
+
+def test_compress_false_stores_raw(codec):
+    encoded = codec.encode_value(LARGE_TEXT, compress=False)
+
+    assert encoded == bytes([FORMAT_RAW]) + LARGE_TEXT.encode("utf-8")
+    assert codec.decode_value(encoded) == LARGE_TEXT
+
+@pytest.mark.parametrize("value", ["zs1:AAAA", "zl1:hello world note", "\u00f8" + "x" * 500])
+def test_any_text_round_trips(codec, value):
+    """원문이 어떤 내용으로 시작해도 압축된 값으로 오인되지 않습니다."""
+    assert codec.decode_value(codec.encode_value(value)) == value
+
+def test_uncompressed_rows_are_read(codec):
+    """압축 전에 저장된 원문 행(Text 컬럼의 str, BYTEA로 바뀐 UTF-8 바이트)을 그대로 읽습니다."""
+    for value in (LARGE_TEXT, "zl1:hello world note", ""):
+        assert codec.decode_value(value) == value
+        assert codec.decode_value(value.encode("utf-8")) == value
+
+def test_zlib_values_are_readable_by_any_codec(codec):
+    """zstandard가 있는 서버도 zlib으로 저장된 값을 읽습니다."""
+    encoded = bytes([FORMAT_ZLIB]) + zlib.compress(LARGE_TEXT.encode("utf-8"))
+
+    assert codec.decode_value(encoded) == LARGE_TEXT
+
+def test_none_passes_through(codec):
+    assert codec.encode_value(None) is None
+    assert codec.decode_value(None) is None
+
+def test_compression_disabled(codec, monkeypatch):
+    monkeypatch.setattr(storage_codec_module, "STORAGE_COMPRESSION", False)
+
+    encoded = codec.encode_value(LARGE_TEXT)
+
+    assert encoded[0] == FORMAT_RAW
+    assert codec.decode_value(encoded) == LARGE_TEXT